@@ -8,6 +8,9 @@ Código: 836463
 """
 
 import time
+import datetime
+import functools
+import hashlib
 import pandas as pd
 import numpy as np
 import os
@@ -16,7 +19,9 @@ from scipy import stats
 import logging
 from typing import Dict, List, Tuple, Optional
 import warnings
-warnings.filterwarnings('ignore')
+
+if int(pd.__version__.split('.')[0]) >= 2:
+    pd.set_option('mode.copy_on_write', True)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -24,6 +29,58 @@ logger = logging.getLogger(__name__)
 CACHE_DIR = "Dados"
 CORRELACAO_CACHE_DIR = os.path.join(CACHE_DIR, "correlacao")
 
+MESES_ARR = np.array(['', 'Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun',
+                      'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez'])
+
+_ANO_ATUAL_CACHE = [0, 0.0]
+
+
+def _ano_atual() -> int:
+    """
+    Retorna o ano corrente com memoização de 60 segundos
+
+    pd.Timestamp.now() é relativamente caro; nas validações de cache chamadas
+    por variável × defasagem o custo se multiplica sem necessidade.
+    """
+    agora = time.time()
+    if agora - _ANO_ATUAL_CACHE[1] > 60:
+        _ANO_ATUAL_CACHE[0] = datetime.datetime.now().year
+        _ANO_ATUAL_CACHE[1] = agora
+    return _ANO_ATUAL_CACHE[0]
+
+_PREP_CACHE_MAX_ENTRIES = 8
+_prep_cache: Dict[Tuple, pd.DataFrame] = {}
+
+
+def _hash_dados_entrada(df_arboviroses: pd.DataFrame, df_clima: pd.DataFrame) -> str:
+    """
+    Gera hash curto do conteúdo dos DataFrames de entrada
+
+    Usado como parte da chave de cache da preparação para detectar quando os
+    dados de arboviroses/clima mudaram (ex.: cache de origem renovado). O
+    clima (dezenas de linhas) é hasheado inteiro; das arboviroses entra o
+    tamanho mais uma amostra de passo constante (≤512 linhas), o que pega
+    revisões de mesmo tamanho sem hashear milhões de linhas.
+
+    Args:
+        df_arboviroses: DataFrame com dados de arboviroses
+        df_clima: DataFrame com dados climáticos
+
+    Returns:
+        Hash hexadecimal curto do conteúdo
+    """
+    h = hashlib.blake2b(digest_size=8)
+    h.update(str(len(df_arboviroses)).encode())
+    h.update(str(len(df_clima)).encode())
+    if not df_arboviroses.empty:
+        passo = max(1, len(df_arboviroses) // 512)
+        h.update(pd.util.hash_pandas_object(
+            df_arboviroses.iloc[::passo], index=False
+        ).values.tobytes())
+    if not df_clima.empty:
+        h.update(pd.util.hash_pandas_object(df_clima, index=False).values.tobytes())
+    return h.hexdigest()
+
 class CacheManagerCorrelacao:
     """
     Gerencia cache de análises de correlação com TTL (Time To Live)
@@ -38,29 +95,38 @@ class CacheManagerCorrelacao:
         os.makedirs(CORRELACAO_CACHE_DIR, exist_ok=True)
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _gerar_nome_arquivo(arbovirose: str, ano: int, variavel_climatica: Optional[str] = None) -> str:
         """
         Gera nome do arquivo de cache incluindo variável climática
-        
+
+        Memoizado: todas as operações de cache passam por aqui e as chaves são
+        um conjunto pequeno de strings, então o lower()/format roda uma vez só.
+
         Args:
             arbovirose: Nome da arbovirose
             ano: Ano dos dados
             variavel_climatica: Variável climática específica
-            
+
         Returns:
             Nome do arquivo de cache
         """
         if variavel_climatica:
             return f"{arbovirose.lower()}_{variavel_climatica}_{ano}.pkl"
         return f"{arbovirose.lower()}_clima_{ano}.pkl"
-    
+
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _caminho_arquivo(arbovirose: str, ano: int, variavel_climatica: Optional[str] = None) -> str:
-        """Retorna caminho completo do arquivo de cache"""
-        CacheManagerCorrelacao._criar_diretorios()
+        """Retorna caminho completo do arquivo de cache (sem tocar o disco)"""
         nome_arquivo = CacheManagerCorrelacao._gerar_nome_arquivo(arbovirose, ano, variavel_climatica)
         return os.path.join(CORRELACAO_CACHE_DIR, nome_arquivo)
-    
+
+    @staticmethod
+    def _caminho_parquet(caminho_pkl: str) -> str:
+        """Retorna o caminho do sidecar Parquet que acompanha o .pkl de metadados"""
+        return caminho_pkl.replace('.pkl', '.parquet')
+
     @staticmethod
     def salvar(arbovirose: str, ano: int, dados: Dict, variavel_climatica: Optional[str] = None) -> bool:
         """
@@ -75,14 +141,38 @@ class CacheManagerCorrelacao:
         Returns:
             True se salvou com sucesso
         """
+        caminho_tmp = None
         try:
+            CacheManagerCorrelacao._criar_diretorios()
             caminho = CacheManagerCorrelacao._caminho_arquivo(arbovirose, ano, variavel_climatica)
-            with open(caminho, 'wb') as f:
-                pickle.dump(dados, f)
-            logger.info(f"Análise de correlação salva em cache: {caminho}")
+            caminho_parquet = CacheManagerCorrelacao._caminho_parquet(caminho)
+
+            df_correlacao = dados.get('dados_correlacao')
+            if isinstance(df_correlacao, pd.DataFrame) and not df_correlacao.empty:
+                parquet_tmp = f"{caminho_parquet}.tmp.{os.getpid()}"
+                df_correlacao.to_parquet(parquet_tmp, engine='pyarrow', compression='zstd')
+                os.replace(parquet_tmp, caminho_parquet)
+                dados = {**dados, 'dados_correlacao': None}
+            elif os.path.exists(caminho_parquet):
+                os.remove(caminho_parquet)
+
+            # Escrita atômica: um crash no meio do dump não pode deixar um .pkl
+            # truncado, senão o próximo carregar falha e a análise é refeita.
+            caminho_tmp = f"{caminho}.tmp.{os.getpid()}"
+            with open(caminho_tmp, 'wb', buffering=1024 * 1024) as f:
+                pickle.dump(dados, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(caminho_tmp, caminho)
+            logger.info("Análise de correlação salva em cache: %s", caminho)
             return True
         except Exception as e:
-            logger.error(f"Erro ao salvar cache de correlação: {e}")
+            logger.error("Erro ao salvar cache de correlação: %s", e)
+            if caminho_tmp and os.path.exists(caminho_tmp):
+                try:
+                    os.remove(caminho_tmp)
+                except OSError:
+                    pass
             return False
     
     @staticmethod
@@ -101,20 +191,26 @@ class CacheManagerCorrelacao:
         try:
             caminho = CacheManagerCorrelacao._caminho_arquivo(arbovirose, ano, variavel_climatica)
             if not os.path.exists(caminho):
-                logger.info(f"Cache de correlação não encontrado: {caminho}")
+                logger.info("Cache de correlação não encontrado: %s", caminho)
                 return None
             
             if not CacheManagerCorrelacao._cache_esta_valido(caminho, ano):
-                logger.info(f"Cache correlação expirado, removendo: {caminho}")
+                logger.info("Cache correlação expirado, removendo: %s", caminho)
                 os.remove(caminho)
                 return None
             
-            with open(caminho, 'rb') as f:
+            with open(caminho, 'rb', buffering=1024 * 1024) as f:
                 dados = pickle.load(f)
-            logger.info(f"Análise de correlação carregada do cache: {caminho}")
+
+            if dados.get('dados_correlacao') is None:
+                caminho_parquet = CacheManagerCorrelacao._caminho_parquet(caminho)
+                if os.path.exists(caminho_parquet):
+                    dados['dados_correlacao'] = pd.read_parquet(caminho_parquet, engine='pyarrow')
+
+            logger.info("Análise de correlação carregada do cache: %s", caminho)
             return dados
         except Exception as e:
-            logger.error(f"Erro ao carregar cache de correlação: {e}")
+            logger.error("Erro ao carregar cache de correlação: %s", e)
             return None
     
     @staticmethod
@@ -131,9 +227,6 @@ class CacheManagerCorrelacao:
             True se existe no cache e é válido
         """
         caminho = CacheManagerCorrelacao._caminho_arquivo(arbovirose, ano, variavel_climatica)
-        if not os.path.exists(caminho):
-            return False
-        
         return CacheManagerCorrelacao._cache_esta_valido(caminho, ano)
     
     @staticmethod
@@ -151,37 +244,43 @@ class CacheManagerCorrelacao:
         """
         try:
             caminho = CacheManagerCorrelacao._caminho_arquivo(arbovirose, ano, variavel_climatica)
+            caminho_parquet = CacheManagerCorrelacao._caminho_parquet(caminho)
+            if os.path.exists(caminho_parquet):
+                os.remove(caminho_parquet)
             if os.path.exists(caminho):
                 os.remove(caminho)
-                logger.info(f"Cache de {variavel_climatica} removido: {caminho}")
+                logger.info("Cache de %s removido: %s", variavel_climatica, caminho)
                 return True
             return False
         except Exception as e:
-            logger.error(f"Erro ao remover cache específico: {e}")
+            logger.error("Erro ao remover cache específico: %s", e)
             return False
         
     @staticmethod
     def _cache_esta_valido(caminho_arquivo: str, ano: int) -> bool:
         """
         Verifica se o cache está dentro do TTL (24 horas para ano atual)
+
+        Um único os.stat cobre existência e mtime, evitando syscalls repetidas
+        nas checagens por variável/defasagem.
         """
-        if not os.path.exists(caminho_arquivo):
+        try:
+            stat_arquivo = os.stat(caminho_arquivo)
+        except FileNotFoundError:
             return False
-            
-        tempo_modificacao = os.path.getmtime(caminho_arquivo)
-        tempo_atual = time.time()
-        idade_cache_segundos = tempo_atual - tempo_modificacao
-        
-        ano_atual = pd.Timestamp.now().year
+
+        idade_cache_segundos = time.time() - stat_arquivo.st_mtime
+
+        ano_atual = _ano_atual()
         if ano == ano_atual:
             if idade_cache_segundos > CacheManagerCorrelacao.CACHE_TTL_SEGUNDOS:
-                logger.info(f"Cache correlação expirado para {ano} (atual): {idade_cache_segundos/3600:.1f}h > {CacheManagerCorrelacao.CACHE_TTL_HORAS}h")
+                logger.info("Cache correlação expirado para %s (atual): %.1fh > %sh", ano, idade_cache_segundos / 3600, CacheManagerCorrelacao.CACHE_TTL_HORAS)
                 return False
             else:
-                logger.info(f"Cache correlação válido para {ano} (atual): {idade_cache_segundos/3600:.1f}h")
+                logger.info("Cache correlação válido para %s (atual): %.1fh", ano, idade_cache_segundos / 3600)
                 return True
         else:
-            logger.info(f"Cache correlação válido para {ano} (histórico)")
+            logger.info("Cache correlação válido para %s (histórico)", ano)
             return True
 
 class CorrelationAnalyzer:
@@ -206,38 +305,59 @@ class CorrelationAnalyzer:
             DataFrame preparado para análise de correlação
         """
         try:
-            logger.info(f"Preparando dados para correlação com defasagem de {defasagem_meses} mês(es)")
-            
-            MESES_PT_BR = {
-                1: 'Jan', 2: 'Fev', 3: 'Mar', 4: 'Abr', 5: 'Mai', 6: 'Jun',
-                7: 'Jul', 8: 'Ago', 9: 'Set', 10: 'Out', 11: 'Nov', 12: 'Dez'
-            }
-            
+            logger.info("Preparando dados para correlação com defasagem de %s mês(es)", defasagem_meses)
+
             if 'ANO_MES' not in df_arboviroses.columns and 'DT_NOTIFIC' in df_arboviroses.columns:
                 df_arboviroses['ANO_MES'] = df_arboviroses['DT_NOTIFIC'].dt.to_period('M')
-            
-            casos_por_mes_regiao = df_arboviroses.groupby(['REGIAO', 'ANO_MES']).size().reset_index(name='casos_arbovirose')
+
+            if not isinstance(df_arboviroses['REGIAO'].dtype, pd.CategoricalDtype):
+                df_arboviroses = df_arboviroses.assign(
+                    REGIAO=df_arboviroses['REGIAO'].astype('category')
+                )
+
+            casos_por_mes_regiao = (
+                df_arboviroses[['REGIAO', 'ANO_MES']]
+                .value_counts()
+                .rename('casos_arbovirose')
+                .reset_index()
+            )
+            casos_por_mes_regiao = casos_por_mes_regiao[
+                casos_por_mes_regiao['casos_arbovirose'] > 0
+            ].reset_index(drop=True)
+
+            periodo_clima = casos_por_mes_regiao['ANO_MES'] - defasagem_meses
             casos_por_mes_regiao['data_arbovirose'] = casos_por_mes_regiao['ANO_MES'].dt.to_timestamp()
+            casos_por_mes_regiao['data_clima'] = periodo_clima.dt.to_timestamp()
             casos_por_mes_regiao = casos_por_mes_regiao.drop('ANO_MES', axis=1)
-            
-            casos_por_mes_regiao['data_clima'] = casos_por_mes_regiao['data_arbovirose'] - pd.DateOffset(months=defasagem_meses)
+
             casos_por_mes_regiao['mes_arbovirose'] = casos_por_mes_regiao['data_arbovirose'].dt.month
-            casos_por_mes_regiao['mes_nome_arbovirose'] = casos_por_mes_regiao['mes_arbovirose'].map(MESES_PT_BR)
-            
-            df_clima_preparado = df_clima.copy()
-            df_clima_preparado = df_clima_preparado.rename(columns={'regiao': 'REGIAO'})
+
+            df_clima_preparado = df_clima.rename(columns={'regiao': 'REGIAO'}, copy=False)
             df_clima_preparado['mes_clima'] = df_clima_preparado['data'].dt.month
-            df_clima_preparado['mes_nome_clima'] = df_clima_preparado['mes_clima'].map(MESES_PT_BR)
-            
-            df_correlacao = pd.merge(
-                casos_por_mes_regiao,
-                df_clima_preparado,
-                left_on=['data_clima', 'REGIAO'],
-                right_on=['data', 'REGIAO'],
-                how='inner',
-                suffixes=('', '_clima')
+
+            clima_indexado = df_clima_preparado.set_index(['data', 'REGIAO']).sort_index()
+            indice_busca = pd.MultiIndex.from_arrays([
+                casos_por_mes_regiao['data_clima'],
+                casos_por_mes_regiao['REGIAO']
+            ])
+            clima_alinhado = clima_indexado.reindex(indice_busca)
+
+            df_correlacao = pd.concat(
+                [
+                    casos_por_mes_regiao.reset_index(drop=True),
+                    clima_alinhado.reset_index(drop=True)
+                ],
+                axis=1
             )
-            
+
+            coluna_clima_referencia = next(
+                (col for col in ('temperatura_c', 'precipitacao_mm', 'umidade_percentual')
+                 if col in df_correlacao.columns),
+                None
+            )
+            if coluna_clima_referencia is not None:
+                df_correlacao = df_correlacao.dropna(subset=[coluna_clima_referencia])
+
             df_correlacao = df_correlacao.rename(columns={
                 'data_arbovirose': 'data_casos',
                 'data_clima': 'data_clima_correlacao'
@@ -246,70 +366,209 @@ class CorrelationAnalyzer:
             df_correlacao['arbovirose'] = arbovirose
             df_correlacao['ano'] = ano
             df_correlacao['defasagem_meses'] = defasagem_meses
-            df_correlacao['relacao_temporal'] = df_correlacao['mes_nome_clima'] + ' → ' + df_correlacao['mes_nome_arbovirose']
-            
-            logger.info(f"Dados preparados para correlação com defasagem: {len(df_correlacao)} registros")
-            logger.info(f"Relação temporal: Clima do mês M → Casos do mês M+{defasagem_meses}")
+
+            for coluna in ('precipitacao_mm', 'temperatura_c', 'umidade_percentual'):
+                if coluna in df_correlacao.columns:
+                    df_correlacao[coluna] = pd.to_numeric(df_correlacao[coluna], downcast='float')
+            df_correlacao['casos_arbovirose'] = pd.to_numeric(
+                df_correlacao['casos_arbovirose'], downcast='unsigned'
+            )
+
+            logger.info("Dados preparados para correlação com defasagem: %s registros", len(df_correlacao))
+            logger.info("Relação temporal: Clima do mês M → Casos do mês M+%s", defasagem_meses)
             
             return df_correlacao
             
         except Exception as e:
-            logger.error(f"Erro ao preparar dados para correlação: {e}")
+            logger.error("Erro ao preparar dados para correlação: %s", e)
             return pd.DataFrame(columns=['data_casos', 'data_clima_correlacao', 'REGIAO', 'casos_arbovirose', 
                                     'precipitacao_mm', 'temperatura_c', 'umidade_percentual', 'arbovirose', 'ano'])
     
     @staticmethod
-    def calcular_correlacao_por_variavel(df_correlacao: pd.DataFrame, variavel_alvo: str) -> Dict:
+    def _spearman_numpy(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+        """
+        Calcula correlação de Spearman via Pearson sobre postos (rankdata + produto interno)
+
+        Equivalente a scipy.stats.spearmanr, mas opera diretamente sobre arrays
+        numpy contíguos, com p-valor analítico pela distribuição t — evita as
+        múltiplas transições Python→C do caminho padrão do scipy.
+
+        Args:
+            x: Array numérico (sem NaN)
+            y: Array numérico (sem NaN)
+
+        Returns:
+            Tuple[correlação, p-valor]
+        """
+        n = x.size
+        if n < 2:
+            return np.nan, np.nan
+
+        rx = stats.rankdata(x)
+        ry = stats.rankdata(y)
+        rx = rx - rx.mean()
+        ry = ry - ry.mean()
+
+        denominador = np.sqrt((rx * rx).sum() * (ry * ry).sum())
+        if denominador == 0:
+            return np.nan, np.nan
+
+        corr = float((rx * ry).sum() / denominador)
+
+        if n == 2 or abs(corr) >= 1.0:
+            p_valor = 0.0 if abs(corr) >= 1.0 and n > 2 else 1.0
+        else:
+            t = corr * np.sqrt((n - 2) / (1.0 - corr * corr))
+            p_valor = float(2 * stats.distributions.t.sf(abs(t), n - 2))
+
+        return corr, p_valor
+
+    @staticmethod
+    def _pearson_numpy(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+        """
+        Calcula correlação de Pearson via np.corrcoef com p-valor analítico
+
+        Evita a ordenação O(N log N) exigida pelo Spearman quando o chamador
+        pede explicitamente o coeficiente linear.
+
+        Args:
+            x: Array numérico (sem NaN)
+            y: Array numérico (sem NaN)
+
+        Returns:
+            Tuple[correlação, p-valor]
+        """
+        n = x.size
+        if n < 2:
+            return np.nan, np.nan
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            corr = float(np.corrcoef(x, y)[0, 1])
+        if np.isnan(corr):
+            return np.nan, np.nan
+
+        if n == 2 or abs(corr) >= 1.0:
+            p_valor = 0.0 if abs(corr) >= 1.0 and n > 2 else 1.0
+        else:
+            t = corr * np.sqrt((n - 2) / (1.0 - corr * corr))
+            p_valor = float(2 * stats.distributions.t.sf(abs(t), n - 2))
+
+        return corr, p_valor
+
+    @staticmethod
+    def calcular_correlacao_por_variavel(df_correlacao: pd.DataFrame, variavel_alvo: str,
+                                         metodo: str = 'spearman') -> Dict:
         """
         Calcula correlação para uma variável climática específica
-        
+
         Args:
             df_correlacao: DataFrame preparado para correlação
             variavel_alvo: Variável climática a analisar
-            
+            metodo: 'spearman' (padrão) ou 'pearson'
+
         Returns:
             Dicionário com resultados da correlação
         """
         if df_correlacao.empty or variavel_alvo not in df_correlacao.columns:
             return {}
-        
+
+        if metodo == 'pearson':
+            kernel_correlacao = CorrelationAnalyzer._pearson_numpy
+        else:
+            kernel_correlacao = CorrelationAnalyzer._spearman_numpy
+
         resultados_variavel = {
             'correlacao_geral': {},
             'correlacao_por_regiao': {},
         }
-        
-        dados_validos = df_correlacao[['casos_arbovirose', variavel_alvo]].dropna()
-        if len(dados_validos) > 1:
-            corr_spearman, p_spearman = stats.spearmanr(
-                dados_validos['casos_arbovirose'], 
-                dados_validos[variavel_alvo]
-            )
-            
+
+        x = df_correlacao['casos_arbovirose'].to_numpy(dtype=np.float64)
+        y = df_correlacao[variavel_alvo].to_numpy(dtype=np.float64)
+        validos = ~(np.isnan(x) | np.isnan(y))
+
+        if validos.sum() > 1:
+            corr_spearman, p_spearman = kernel_correlacao(x[validos], y[validos])
+
             resultados_variavel['correlacao_geral'] = {
                 'spearman': round(corr_spearman, 3),
                 'p_valor': round(p_spearman, 4),
-                'significativo': p_spearman < 0.05
+                'significativo': p_spearman < 0.05,
+                'metodo': metodo
             }
-        
-        for regiao in df_correlacao['REGIAO'].unique():
-            df_regiao = df_correlacao[df_correlacao['REGIAO'] == regiao]
-            dados_validos_regiao = df_regiao[['casos_arbovirose', variavel_alvo]].dropna()
-            
-            if len(dados_validos_regiao) > 1:
-                corr_spearman, p_spearman = stats.spearmanr(
-                    dados_validos_regiao['casos_arbovirose'], 
-                    dados_validos_regiao[variavel_alvo]
-                )
-                
+
+        def _aplicar_kernel(grupo: pd.DataFrame) -> pd.Series:
+            valores = grupo.to_numpy(dtype=np.float64)
+            bons = ~np.isnan(valores).any(axis=1)
+            n_amostras = int(bons.sum())
+            if n_amostras <= 1:
+                return pd.Series({'spearman': np.nan, 'p_valor': np.nan, 'n_amostras': n_amostras})
+            corr, p_valor = kernel_correlacao(valores[bons, 0], valores[bons, 1])
+            return pd.Series({'spearman': corr, 'p_valor': p_valor, 'n_amostras': n_amostras})
+
+        por_regiao = df_correlacao.groupby('REGIAO', sort=False, observed=True)[
+            ['casos_arbovirose', variavel_alvo]
+        ].apply(_aplicar_kernel)
+
+        for regiao, linha in por_regiao.iterrows():
+            if linha['n_amostras'] > 1 and not np.isnan(linha['spearman']):
                 resultados_variavel['correlacao_por_regiao'][regiao] = {
-                    'spearman': round(corr_spearman, 3),
-                    'p_valor': round(p_spearman, 4),
-                    'significativo': p_spearman < 0.05,
-                    'n_amostras': len(dados_validos_regiao)
+                    'spearman': round(float(linha['spearman']), 3),
+                    'p_valor': round(float(linha['p_valor']), 4),
+                    'significativo': bool(linha['p_valor'] < 0.05),
+                    'n_amostras': int(linha['n_amostras'])
                 }
-        
+
         return resultados_variavel
     
+    @staticmethod
+    def calcular_correlacoes_multi(df_correlacao: pd.DataFrame, variaveis: List[str]) -> Dict:
+        """
+        Calcula correlações de Spearman de todas as variáveis climáticas em uma passada
+
+        Ranqueia todas as colunas de uma vez e usa np.corrcoef sobre os postos;
+        a primeira linha da matriz traz as correlações de cada variável com
+        'casos_arbovirose'. P-valores derivados analiticamente (distribuição t),
+        totalmente vetorizados.
+
+        Args:
+            df_correlacao: DataFrame preparado para correlação
+            variaveis: Lista de variáveis climáticas a analisar
+
+        Returns:
+            Dicionário variavel -> {spearman, p_valor, significativo, n_amostras}
+        """
+        variaveis_existentes = [v for v in variaveis if v in df_correlacao.columns]
+        if df_correlacao.empty or not variaveis_existentes:
+            return {}
+
+        dados = df_correlacao[['casos_arbovirose'] + variaveis_existentes].dropna()
+        n = len(dados)
+        if n < 2:
+            return {}
+
+        postos = dados.rank().to_numpy(dtype=np.float64)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            matriz = np.corrcoef(postos, rowvar=False)
+        correlacoes = np.atleast_1d(matriz[0, 1:])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = correlacoes * np.sqrt((n - 2) / (1.0 - correlacoes ** 2))
+        p_valores = 2 * stats.distributions.t.sf(np.abs(t), n - 2)
+        p_valores = np.where(np.abs(correlacoes) >= 1.0, 0.0, p_valores)
+
+        resultados = {}
+        for i, variavel in enumerate(variaveis_existentes):
+            resultados[variavel] = {
+                'spearman': round(float(correlacoes[i]), 3),
+                'p_valor': round(float(p_valores[i]), 4),
+                'significativo': bool(p_valores[i] < 0.05),
+                'n_amostras': n
+            }
+
+        return resultados
+
     @staticmethod
     def gerar_relatorio_por_variavel(resultados_variavel: Dict, variavel_climatica: str,
                                 arbovirose: str, ano: int) -> Dict:
@@ -330,7 +589,7 @@ class CorrelationAnalyzer:
                 'arbovirose': arbovirose,
                 'variavel_climatica': variavel_climatica,
                 'ano': ano,
-                'data_geracao': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+                'data_geracao': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             },
             'correlacao_principal': {},
             'insights': [],
@@ -379,6 +638,162 @@ class CorrelationAnalyzer:
         
         return relatorio
 
+def construir_relacao_temporal(df_correlacao: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adiciona colunas descritivas de relação temporal apenas quando necessário
+
+    As colunas 'mes_nome_clima', 'mes_nome_arbovirose' e 'relacao_temporal' são
+    puramente estéticas (hover de gráficos); construí-las na preparação
+    encareceria todo pickle/parquet do cache com colunas object. Esta função as
+    deriva sob demanda a partir dos meses inteiros já presentes no DataFrame.
+
+    Args:
+        df_correlacao: DataFrame preparado para correlação
+
+    Returns:
+        DataFrame com as colunas descritivas adicionadas
+    """
+    if df_correlacao.empty or 'mes_clima' not in df_correlacao.columns:
+        return df_correlacao
+
+    df = df_correlacao.copy()
+    nomes_clima = MESES_ARR[df['mes_clima'].to_numpy(dtype=np.int64)]
+    nomes_arbovirose = MESES_ARR[df['mes_arbovirose'].to_numpy(dtype=np.int64)]
+    df['mes_nome_clima'] = nomes_clima
+    df['mes_nome_arbovirose'] = nomes_arbovirose
+    df['relacao_temporal'] = np.char.add(np.char.add(nomes_clima, ' → '), nomes_arbovirose)
+    return df
+
+def preparar_dados_correlacao_cached(df_arboviroses: pd.DataFrame, df_clima: pd.DataFrame,
+                                     arbovirose: str, ano: int, defasagem_meses: int = 1) -> pd.DataFrame:
+    """
+    Versão com cache de preparar_dados_correlacao
+
+    O groupby+merge da preparação é idêntico para as três variáveis climáticas
+    de um mesmo (arbovirose, ano, defasagem); esta função reutiliza o resultado
+    via cache em memória e em disco em vez de refazer a união a cada variável.
+
+    Args:
+        df_arboviroses: DataFrame com dados de arboviroses
+        df_clima: DataFrame com dados climáticos
+        arbovirose: Nome da arbovirose
+        ano: Ano dos dados
+        defasagem_meses: Defasagem temporal em meses
+
+    Returns:
+        DataFrame preparado para análise de correlação
+    """
+    hash_entrada = _hash_dados_entrada(df_arboviroses, df_clima)
+    chave = (arbovirose.lower(), ano, defasagem_meses, hash_entrada)
+
+    if chave in _prep_cache:
+        logger.info("Preparação de correlação reutilizada do cache em memória: %s", chave[:3])
+        return _prep_cache[chave]
+
+    CacheManagerCorrelacao._criar_diretorios()
+    caminho_prep = os.path.join(
+        CORRELACAO_CACHE_DIR,
+        f"prep_{arbovirose.lower()}_{ano}_lag{defasagem_meses}_{hash_entrada}.pkl"
+    )
+
+    df_correlacao = None
+    # Mesma política de validade dos demais caches: 24h para o ano atual,
+    # permanente para anos históricos
+    if CacheManagerCorrelacao._cache_esta_valido(caminho_prep, ano):
+        try:
+            with open(caminho_prep, 'rb') as f:
+                df_correlacao = pickle.load(f)
+            logger.info("Preparação de correlação carregada do disco: %s", caminho_prep)
+        except Exception as e:
+            logger.error("Erro ao carregar preparação do disco: %s", e)
+            df_correlacao = None
+
+    if df_correlacao is None:
+        df_correlacao = CorrelationAnalyzer.preparar_dados_correlacao(
+            df_arboviroses, df_clima, arbovirose, ano, defasagem_meses
+        )
+        try:
+            with open(caminho_prep, 'wb') as f:
+                pickle.dump(df_correlacao, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Coleta de órfãos: o hash no nome muda a cada renovação dos
+            # dados, então preparações antigas do mesmo (arbovirose, ano,
+            # defasagem) nunca mais seriam lidas — remove-as aqui em vez
+            # de acumular até o botão Limpar Cache
+            prefixo = f"prep_{arbovirose.lower()}_{ano}_lag{defasagem_meses}_"
+            nome_atual = os.path.basename(caminho_prep)
+            for nome in os.listdir(CORRELACAO_CACHE_DIR):
+                if nome.startswith(prefixo) and nome != nome_atual:
+                    try:
+                        os.remove(os.path.join(CORRELACAO_CACHE_DIR, nome))
+                    except OSError:
+                        pass
+        except Exception as e:
+            logger.error("Erro ao salvar preparação em disco: %s", e)
+
+    if len(_prep_cache) >= _PREP_CACHE_MAX_ENTRIES:
+        _prep_cache.pop(next(iter(_prep_cache)))
+    _prep_cache[chave] = df_correlacao
+
+    return df_correlacao
+
+VARIAVEIS_CLIMATICAS_PADRAO = ['precipitacao_mm', 'temperatura_c', 'umidade_percentual']
+
+def analisar_correlacao_todas_variaveis(df_arboviroses: pd.DataFrame, df_clima: pd.DataFrame,
+                                        arbovirose: str, ano: int,
+                                        variaveis_climaticas: Optional[List[str]] = None,
+                                        defasagem_meses: int = 1) -> Dict:
+    """
+    Analisa correlação com todas as variáveis climáticas em lote
+
+    Prepara os dados uma única vez e calcula Spearman para todas as variáveis
+    com um único rank + np.corrcoef, em vez de uma chamada completa por
+    variável.
+
+    Args:
+        df_arboviroses: DataFrame com dados de arboviroses
+        df_clima: DataFrame com dados climáticos
+        arbovirose: Nome da arbovirose
+        ano: Ano dos dados
+        variaveis_climaticas: Variáveis a analisar (padrão: precipitação, temperatura, umidade)
+        defasagem_meses: Defasagem temporal em meses
+
+    Returns:
+        Dicionário com dados preparados e resultados/relatório por variável
+    """
+    if variaveis_climaticas is None:
+        variaveis_climaticas = VARIAVEIS_CLIMATICAS_PADRAO
+
+    df_correlacao = preparar_dados_correlacao_cached(
+        df_arboviroses, df_clima, arbovirose, ano, defasagem_meses
+    )
+
+    correlacoes = CorrelationAnalyzer.calcular_correlacoes_multi(df_correlacao, variaveis_climaticas)
+
+    por_variavel = {}
+    for variavel, stats_variavel in correlacoes.items():
+        resultados_variavel = {
+            'correlacao_geral': {
+                'spearman': stats_variavel['spearman'],
+                'p_valor': stats_variavel['p_valor'],
+                'significativo': stats_variavel['significativo']
+            },
+            'correlacao_por_regiao': {}
+        }
+        relatorio = CorrelationAnalyzer.gerar_relatorio_por_variavel(
+            resultados_variavel, variavel, arbovirose, ano
+        )
+        relatorio['resumo_analise']['defasagem_meses'] = defasagem_meses
+        por_variavel[variavel] = {
+            'resultados_correlacao': resultados_variavel,
+            'relatorio': relatorio
+        }
+
+    return {
+        'dados_correlacao': df_correlacao,
+        'defasagem_meses': defasagem_meses,
+        'por_variavel': por_variavel
+    }
+
 def analisar_correlacao_por_variavel(df_arboviroses: pd.DataFrame, df_clima: pd.DataFrame,
                                    arbovirose: str, ano: int, variavel_climatica: str, 
                                    usar_cache: bool = True, defasagem_meses: int = 1) -> Tuple[Dict, bool]:
@@ -393,23 +808,32 @@ def analisar_correlacao_por_variavel(df_arboviroses: pd.DataFrame, df_clima: pd.
         variavel_climatica: Variável climática a analisar
         usar_cache: Usar cache para melhor performance
         defasagem_meses: Defasagem temporal em meses
-        
+
     Returns:
         Tuple[Resultados da análise, True se veio do cache]
+
+    Nota:
+        O DataFrame 'dados_correlacao' não é gravado no cache de resultados;
+        em cache-hit ele é reconstruído via preparar_dados_correlacao_cached,
+        que é barato por conta do cache de preparação compartilhado.
     """
     cache_key = f"{variavel_climatica}_lag{defasagem_meses}"
     
     if usar_cache:
         dados_cache = CacheManagerCorrelacao.carregar(arbovirose, ano, variavel_climatica=cache_key)
         if dados_cache is not None:
+            if dados_cache.get('dados_correlacao') is None:
+                dados_cache['dados_correlacao'] = preparar_dados_correlacao_cached(
+                    df_arboviroses, df_clima, arbovirose, ano, defasagem_meses
+                )
             return dados_cache, True
     
-    logger.info(f"Analisando correlação entre {arbovirose} e {variavel_climatica} para {ano} (defasagem: {defasagem_meses} mês(es))...")
+    logger.info("Analisando correlação entre %s e %s para %s (defasagem: %s mês(es))...", arbovirose, variavel_climatica, ano, defasagem_meses)
     
-    df_correlacao = CorrelationAnalyzer.preparar_dados_correlacao(
+    df_correlacao = preparar_dados_correlacao_cached(
         df_arboviroses, df_clima, arbovirose, ano, defasagem_meses
     )
-    
+
     if df_correlacao.empty:
         logger.warning("DataFrame de correlação vazio - não é possível calcular correlações")
         resultados_vazio = {
@@ -422,7 +846,7 @@ def analisar_correlacao_por_variavel(df_arboviroses: pd.DataFrame, df_clima: pd.
                     'variavel_climatica': variavel_climatica, 
                     'ano': ano, 
                     'defasagem_meses': defasagem_meses,
-                    'data_geracao': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+                    'data_geracao': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                 },
                 'correlacao_principal': {}, 
                 'insights': ['Dados insuficientes para análise de correlação'], 
@@ -452,7 +876,11 @@ def analisar_correlacao_por_variavel(df_arboviroses: pd.DataFrame, df_clima: pd.
     
     cache_utilizado = False
     if usar_cache and resultados_completos:
-        cache_salvo = CacheManagerCorrelacao.salvar(arbovirose, ano, resultados_completos, variavel_climatica=cache_key)
+        resultados_para_cache = {
+            chave: valor for chave, valor in resultados_completos.items()
+            if chave != 'dados_correlacao'
+        }
+        cache_salvo = CacheManagerCorrelacao.salvar(arbovirose, ano, resultados_para_cache, variavel_climatica=cache_key)
         cache_utilizado = cache_salvo
     
     return resultados_completos, cache_utilizado
@@ -460,6 +888,7 @@ def analisar_correlacao_por_variavel(df_arboviroses: pd.DataFrame, df_clima: pd.
 def limpar_cache_correlacao():
     """Limpa todo o cache de análises de correlação"""
     try:
+        _prep_cache.clear()
         if os.path.exists(CORRELACAO_CACHE_DIR):
             for arquivo in os.listdir(CORRELACAO_CACHE_DIR):
                 os.remove(os.path.join(CORRELACAO_CACHE_DIR, arquivo))
@@ -467,4 +896,4 @@ def limpar_cache_correlacao():
         else:
             logger.info("Diretório de cache correlação não existe")
     except Exception as e:
-        logger.error(f"Erro ao limpar cache correlação: {e}")
\ No newline at end of file
+        logger.error("Erro ao limpar cache correlação: %s", e)
\ No newline at end of file
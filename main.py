@@ -8,10 +8,11 @@ Código: 836463
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from scipy.stats import spearmanr
+import numpy as np
+
+# Imports pesados (plotly, scipy, correlation_analysis) são feitos de forma
+# tardia dentro dos blocos que realmente os utilizam, acelerando o primeiro
+# render da sidebar antes de qualquer download de dados
 
 from utils import (
     baixar_dados_arbovirose, 
@@ -28,15 +29,524 @@ from utils_climate import (
     gerar_relatorio_clima,
     limpar_cache_clima
 )
-from correlation_analysis import (
-    analisar_correlacao_por_variavel,
-    limpar_cache_correlacao
+MAX_PONTOS_SERIE_CLIMA = 1000
+
+# Acima deste número de pontos o LOWESS (O(n²)) é trocado por uma
+# tendência de medianas por quantis no gráfico de dispersão
+MAX_PONTOS_LOWESS = 500
+
+VARIAVEIS_CLIMATICAS_RELEVANTES = ('precipitacao_mm', 'temperatura_c', 'umidade_percentual')
+
+# Rótulos de exibição calculados uma vez, em vez de repetir
+# .replace('_', ' ').title() em cada rerun (e já com as unidades)
+VAR_LABEL = {
+    'temperatura_c': 'Temperatura (°C)',
+    'precipitacao_mm': 'Precipitação (mm)',
+    'umidade_percentual': 'Umidade (%)'
+}
+
+# Únicas colunas de arboviroses que o dashboard consome; o restante do
+# schema do SINAN não precisa ser materializado para a interface
+COLS_ARBOVIROSES_UI = ('REGIAO', 'CS_SEXO', 'DT_NOTIFIC', 'ANO_MES', 'EM_INVESTIGACAO')
+
+MESES_CAT = pd.CategoricalDtype(
+    ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun',
+     'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez'],
+    ordered=True
 )
 
-if 'recalcular_correlacao' not in st.session_state:
-    st.session_state.recalcular_correlacao = False
-if 'variavel_climatica_selecionada' not in st.session_state:
-    st.session_state.variavel_climatica_selecionada = 'temperatura_c'
+def downsample_serie_clima(df_serie: pd.DataFrame, coluna_ordem: str,
+                           max_pontos: int = MAX_PONTOS_SERIE_CLIMA) -> pd.DataFrame:
+    """
+    Limita o número de pontos enviados ao navegador por série climática
+
+    Com um único ano (12 meses × 5 regiões) é um no-op; quando a visão
+    multi-ano (2010-2025) estiver agregada, mantém o gráfico responsivo
+    amostrando pontos igualmente espaçados em vez de enviar a série inteira.
+    """
+    if len(df_serie) <= max_pontos:
+        return df_serie
+    indices = np.linspace(0, len(df_serie) - 1, max_pontos).round().astype(int)
+    return df_serie.sort_values(coluna_ordem).iloc[indices]
+
+@st.cache_data(ttl=24 * 3600, show_spinner=False)
+def calcular_matriz_spearman(dados_heatmap: pd.DataFrame, variaveis: tuple) -> pd.DataFrame:
+    """Matriz de correlação de Spearman cacheada entre reruns do Streamlit"""
+    return dados_heatmap[list(variaveis)].corr(method='spearman')
+
+@st.cache_data(ttl=24 * 3600, show_spinner=False)
+def calcular_spearman_regional(dados: pd.DataFrame, variavel: str):
+    """Correlação de Spearman casos × variável climática, cacheada entre reruns"""
+    from scipy.stats import spearmanr
+    return spearmanr(dados['casos_arbovirose'], dados[variavel])
+
+def filtrar_regioes_validas(df: pd.DataFrame, coluna: str = 'REGIAO') -> pd.DataFrame:
+    """
+    Filtra as regiões oficiais do Brasil
+
+    Quando a coluna é categórica, a comparação é feita sobre os códigos
+    inteiros (int8) em vez do hash de cada string, o caminho rápido
+    habilitado pela conversão para category feita na ingestão.
+    """
+    serie = df[coluna]
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        codigos_validos = np.flatnonzero(serie.cat.categories.isin(REGIOES_VALIDAS))
+        df_filtrado = df[np.isin(serie.cat.codes.to_numpy(), codigos_validos)]
+        # Sem isso, categorias zeradas (ex.: 'Não definida') reapareceriam
+        # com contagem 0 nos value_counts a jusante (pizza, tabelas, relatório)
+        df_filtrado[coluna] = df_filtrado[coluna].cat.remove_unused_categories()
+        return df_filtrado
+    return df[serie.isin(REGIOES_VALIDAS)]
+
+@st.cache_resource
+def obter_cache_manager_clima():
+    """Instância única do gerenciador de cache climático, reutilizada entre reruns"""
+    return CacheManagerClima()
+
+@st.cache_resource
+def obter_cache_manager_correlacao():
+    """Instância única do gerenciador de cache de correlação, reutilizada entre reruns"""
+    from correlation_analysis import CacheManagerCorrelacao
+    return CacheManagerCorrelacao()
+
+@st.cache_data(ttl=24 * 3600, show_spinner=False)
+def converter_para_arrow(_df: pd.DataFrame, chave: str, arbovirose: str, ano: int,
+                         total_linhas: int, total_casos: int):
+    """
+    Tabela Arrow pronta para o st.dataframe, convertida uma única vez
+
+    Passar pyarrow.Table direto ao st.dataframe pula a conversão
+    pandas → Arrow que o Streamlit refaz a cada rerun; a chave identifica
+    qual tabela está sendo cacheada para o par (arbovirose, ano), e o
+    fingerprint (total_linhas, total_casos) invalida a tabela quando um
+    Forçar Recarregar troca os dados por trás do mesmo par.
+    """
+    import pyarrow as pa
+    return pa.Table.from_pandas(_df, preserve_index=False)
+
+@st.cache_data(show_spinner=False)
+def gerar_pizza_regioes_json(regioes: tuple, casos: tuple, arbovirose: str, ano: int) -> str:
+    """
+    Pizza de distribuição regional já serializada; reusada enquanto as entradas não mudam
+
+    Recebe tuplas em vez de DataFrame: o go.Pie só precisa dos rótulos e
+    valores, e tuplas pequenas são mais baratas de hashear na chave do cache.
+    """
+    import plotly.graph_objects as go
+    # go.Pie direto dispensa a fábrica do px e o custom_data de hover_data;
+    # o percentual já aparece via %{percent} no hovertemplate
+    fig_pizza = go.Figure(go.Pie(
+        labels=list(regioes),
+        values=list(casos),
+        textposition='inside',
+        textinfo='percent+label',
+        hovertemplate='<b>%{label}</b><br>Casos: %{value:,}<br>Percentual: %{percent}<extra></extra>'
+    ))
+    fig_pizza.update_layout(
+        title=f'Distribuição de Casos de {arbovirose} por Região - {ano}',
+        height=500,
+        showlegend=True
+    )
+    return fig_pizza.to_json()
+
+@st.cache_data(show_spinner=False)
+def gerar_heatmap_casos_json(pivot: pd.DataFrame, arbovirose: str, ano: int) -> str:
+    """Heatmap de casos por região e mês já serializado para JSON"""
+    import plotly.graph_objects as go
+    fig = go.Figure(data=go.Heatmap(
+        z=pivot.values,
+        x=pivot.columns,
+        y=pivot.index,
+        colorscale='Reds',
+        hoverongaps=False,
+        hovertemplate='Região: %{y}<br>Mês: %{x}<br>Casos: %{z}<extra></extra>',
+        colorbar=dict(title='Número de Casos')
+    ))
+    fig.update_layout(
+        title=f'Mapa de Calor de Casos de {arbovirose} por Região e Mês - {ano}',
+        xaxis_title='Mês',
+        yaxis_title='Região',
+        height=500
+    )
+    return fig.to_json()
+
+@st.cache_data(show_spinner=False)
+def gerar_dispersao_json(dados_filtrados: pd.DataFrame, variavel_dispersao: str,
+                         arbovirose: str, titulo_regiao: str, com_legenda: bool) -> str:
+    """Dispersão clima × casos já serializada; evita refazer o LOWESS por rerun"""
+    import plotly.express as px
+    rotulo_variavel = VAR_LABEL.get(variavel_dispersao, variavel_dispersao)
+    fig_dispersao = px.scatter(
+        dados_filtrados,
+        x=variavel_dispersao,
+        y='casos_arbovirose',
+        color='REGIAO' if com_legenda else None,
+        title=f'Relação entre {rotulo_variavel} e Casos de {arbovirose} - {titulo_regiao}',
+        labels={
+            variavel_dispersao: rotulo_variavel,
+            'casos_arbovirose': f'Casos de {arbovirose}',
+            'REGIAO': 'Região'
+        },
+        hover_data=['mes_nome_clima', 'mes_nome_arbovirose', 'relacao_temporal'],
+        trendline='lowess' if len(dados_filtrados) <= MAX_PONTOS_LOWESS else None,
+        render_mode='webgl'
+    )
+    fig_dispersao.update_layout(
+        height=500,
+        template="plotly_white",
+        xaxis_title=rotulo_variavel,
+        yaxis_title=f'Casos de {arbovirose}',
+        showlegend=com_legenda
+    )
+    fig_dispersao.update_traces(
+        hovertemplate=(
+            f"<b>{rotulo_variavel}:</b> %{{x}}<br>"
+            f"<b>Casos {arbovirose}:</b> %{{y}}<br>"
+            "<b>Relação temporal:</b> %{customdata[2]}<br>"
+            "<extra></extra>"
+        )
+    )
+    if len(dados_filtrados) > MAX_PONTOS_LOWESS:
+        # Tendência de medianas por quantis: mesma leitura visual do LOWESS
+        # sem o custo quadrático do statsmodels em bases grandes
+        quantis = pd.qcut(dados_filtrados[variavel_dispersao], 25, duplicates='drop')
+        medianas = dados_filtrados.groupby(quantis, observed=True)['casos_arbovirose'].median()
+        fig_dispersao.add_scatter(
+            x=[intervalo.mid for intervalo in medianas.index],
+            y=medianas.values,
+            mode='lines',
+            name='Tendência (mediana)',
+            line=dict(color='black', dash='dash')
+        )
+    return fig_dispersao.to_json()
+
+@st.cache_data(ttl=24 * 3600, show_spinner=False)
+def construir_pivot_regiao_mes(_casos_validos: pd.DataFrame, arbovirose: str, ano: int,
+                               total_linhas: int, total_casos: int) -> pd.DataFrame:
+    """
+    Tabela região × mês com soma de casos, cacheada por (arbovirose, ano)
+
+    groupby().sum().unstack() evita o caminho mais pesado do pivot_table;
+    a mesma tabela alimenta o heatmap da aba 3 e o cálculo do mês de pico.
+    Int32 basta para contagens mensais e reduz à metade o payload JSON
+    que o heatmap envia ao navegador. O fingerprint barato
+    (total_linhas, total_casos) entra na chave para o pivot acompanhar um
+    Forçar Recarregar que troque os dados sem hashear o DataFrame inteiro.
+    """
+    return (
+        _casos_validos.groupby(['REGIAO', 'MES_FORMATADO'], observed=True)['CASOS']
+        .sum()
+        .unstack(fill_value=0)
+        .astype(np.int32)
+    )
+
+@st.cache_data(ttl=24 * 3600, show_spinner=False)
+def calcular_estatisticas_gerais(_df: pd.DataFrame, arbovirose: str, ano: int,
+                                 total_linhas: int) -> dict:
+    """
+    Distribuições de região e sexo calculadas uma única vez por (arbovirose, ano)
+
+    O DataFrame entra com underscore para não ser hasheado pelo Streamlit;
+    a chave é (arbovirose, ano, total_linhas) com ttl de 24h, para as
+    distribuições acompanharem um Forçar Recarregar que troque os dados.
+    Uma única máscara de REGIAO é reutilizada em vez de repetir isin a
+    cada rerun.
+    """
+    estatisticas = {'dist_regiao': None, 'dist_sexo': None}
+
+    if 'REGIAO' in _df.columns:
+        mascara_regiao = _df['REGIAO'].isin(REGIOES_VALIDAS)
+        dist_regiao = (
+            _df.loc[mascara_regiao, 'REGIAO'].value_counts(normalize=True) * 100
+        )
+        # REGIAO categórica inclui categorias zeradas no value_counts
+        # (ex.: 'Não definida', já excluída pela máscara)
+        estatisticas['dist_regiao'] = dist_regiao[dist_regiao > 0]
+
+    if 'CS_SEXO' in _df.columns:
+        estatisticas['dist_sexo'] = _df['CS_SEXO'].value_counts()
+
+    return estatisticas
+
+@st.cache_data(show_spinner=False)
+def opcoes_regiao_dispersao(_dados: pd.DataFrame, arbovirose: str, total_linhas: int) -> list:
+    """
+    Opções do filtro regional da aba de dispersão
+
+    O DataFrame entra com underscore para não ser hasheado; a dupla
+    (arbovirose, total de linhas) identifica o conjunto de correlação
+    vigente. Evita repetir o unique O(n) a cada interação nos selectboxes.
+    """
+    return ['Todas as Regiões'] + _dados['REGIAO'].unique().tolist()
+
+# Corpos das abas isolados em fragments: um rerun disparado por um widget
+# dentro de uma aba (ex.: os selectboxes da dispersão) reexecuta apenas o
+# fragment correspondente, sem reconstruir as outras quatro abas
+
+@st.fragment
+def renderizar_tab_distribuicao(dist_regiao_tbl: pd.DataFrame, tem_dados_regiao: bool,
+                                arbovirose: str, ano: int) -> None:
+    """Aba 1: pizza de distribuição regional e tabela detalhada"""
+    import plotly.io as pio
+    st.subheader("🗺️ Distribuição de Casos por Região")
+
+    if tem_dados_regiao:
+
+        if not dist_regiao_tbl.empty:
+            # A pizza consome os arrays direto; o DataFrame só é montado
+            # para a tabela detalhada logo abaixo
+            fig_pizza = pio.from_json(gerar_pizza_regioes_json(
+                tuple(dist_regiao_tbl['REGIAO']),
+                tuple(dist_regiao_tbl['CASOS']),
+                arbovirose,
+                ano
+            ))
+            st.plotly_chart(fig_pizza, use_container_width=True)
+
+            st.subheader("📊 Dados Detalhados por Região")
+            df_regioes = pd.DataFrame({
+                'Região': dist_regiao_tbl['REGIAO'].values,
+                'Casos': dist_regiao_tbl['CASOS'].values,
+                'Percentual': dist_regiao_tbl['PCT'].round(1).values
+            })
+            st.dataframe(
+                converter_para_arrow(df_regioes, 'df_regioes', arbovirose, ano,
+                                     len(df_regioes), int(df_regioes['Casos'].sum())),
+                use_container_width=True
+            )
+        else:
+            st.warning("Não há dados de regiões válidas disponíveis")
+    else:
+        st.warning("Não há dados de região disponíveis")
+
+@st.fragment
+def renderizar_tab_evolucao(casos_regiao_validos: pd.DataFrame, ano: int) -> None:
+    """Aba 2: evolução mensal dos casos facetada por região"""
+    import plotly.express as px
+    st.subheader("📈 Evolução Mensal por Região")
+
+    if not casos_regiao_validos.empty:
+        # Uma única figura facetada no lugar de um px.line por região:
+        # uma construção/serialização de figura em vez de cinco
+        n_regioes = casos_regiao_validos['REGIAO'].nunique()
+        fig = px.line(
+            casos_regiao_validos,
+            x="MES_FORMATADO",
+            y="CASOS",
+            color="REGIAO",
+            facet_col="REGIAO",
+            facet_col_wrap=2,
+            markers=True,
+            title=f"Evolução Mensal por Região - {ano}",
+            color_discrete_sequence=px.colors.qualitative.Set1
+        )
+        fig.update_layout(
+            height=300 * ((n_regioes + 1) // 2),
+            showlegend=False,
+            template="plotly_white"
+        )
+        fig.update_yaxes(matches=None)
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.warning("Não há dados suficientes para gerar os gráficos por região")
+
+@st.fragment
+def renderizar_tab_heatmap(pivot_regiao_mes: pd.DataFrame, tem_casos: bool,
+                           arbovirose: str, ano: int) -> None:
+    """Aba 3: mapa de calor de casos por região e mês"""
+    import plotly.io as pio
+    st.subheader("🔥 Mapa de Calor - Casos por Região e Mês")
+    if tem_casos:
+
+        if not pivot_regiao_mes.empty:
+            fig = pio.from_json(gerar_heatmap_casos_json(pivot_regiao_mes, arbovirose, ano))
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.warning("Não há dados de regiões válidas para gerar o mapa de calor")
+    else:
+        st.warning("Não há dados suficientes para gerar o mapa de calor")
+
+@st.fragment
+def renderizar_tab_tabelas(casos_regiao_validos: pd.DataFrame, tem_casos: bool,
+                           dist_regiao_tbl: pd.DataFrame, tem_dados_regiao: bool,
+                           arbovirose: str, ano: int) -> None:
+    """Aba 4: tabelas detalhadas de casos e distribuição regional"""
+    st.subheader("📋 Dados Detalhados")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.write("**Casos por Região e Mês**")
+        if tem_casos:
+            st.dataframe(casos_regiao_validos, use_container_width=True)
+        else:
+            st.warning("Não há dados para exibir")
+
+    with col2:
+        st.write("**Distribuição por Região**")
+        if tem_dados_regiao:
+            if not dist_regiao_tbl.empty:
+                distribuicao_regiao = dist_regiao_tbl.rename(columns={'PCT': '%'}).copy()
+                distribuicao_regiao['%'] = distribuicao_regiao['%'].round(2)
+                st.dataframe(
+                    converter_para_arrow(distribuicao_regiao, 'distribuicao_regiao', arbovirose, ano,
+                                         len(distribuicao_regiao), int(distribuicao_regiao['CASOS'].sum())),
+                    use_container_width=True
+                )
+            else:
+                st.warning("Não há dados de regiões válidas disponíveis")
+        else:
+            st.warning("Não há dados de região disponíveis")
+
+@st.fragment
+def renderizar_tab_dispersao(resultados_correlacao, arbovirose: str) -> None:
+    """Aba 5: dispersão clima × casos com estatísticas de Spearman"""
+    import plotly.io as pio
+    from correlation_analysis import construir_relacao_temporal
+    st.subheader("📈 Gráfico de Dispersão: Clima vs Casos")
+
+    if resultados_correlacao and not resultados_correlacao.get('dados_correlacao', pd.DataFrame()).empty:
+
+        dados_dispersao = resultados_correlacao['dados_correlacao']
+        variavel_atual = st.session_state.get('variavel_climatica_selecionada', 'temperatura_c')
+
+        col_controls1, col_controls2 = st.columns(2)
+
+        with col_controls1:
+            variaveis_disponiveis = [var for var in ['temperatura_c', 'precipitacao_mm', 'umidade_percentual']
+                                if var in dados_dispersao.columns]
+            variavel_dispersao = st.selectbox(
+                "Variável climática:",
+                variaveis_disponiveis,
+                index=variaveis_disponiveis.index(variavel_atual) if variavel_atual in variaveis_disponiveis else 0,
+                key='dispersao_var_select'
+            )
+
+        with col_controls2:
+            regioes_dispersao = opcoes_regiao_dispersao(dados_dispersao, arbovirose, len(dados_dispersao))
+            regiao_dispersao = st.selectbox(
+                "Filtrar por região:",
+                regioes_dispersao,
+                key='dispersao_regiao_select'
+            )
+
+        if regiao_dispersao == 'Todas as Regiões':
+            dados_filtrados = dados_dispersao
+            titulo_regiao = "Todas as Regiões"
+        else:
+            dados_filtrados = dados_dispersao[dados_dispersao['REGIAO'] == regiao_dispersao]
+            titulo_regiao = regiao_dispersao
+
+        if not dados_filtrados.empty:
+            dados_filtrados = construir_relacao_temporal(dados_filtrados)
+            fig_dispersao = pio.from_json(gerar_dispersao_json(
+                dados_filtrados,
+                variavel_dispersao,
+                arbovirose,
+                titulo_regiao,
+                regiao_dispersao == 'Todas as Regiões'
+            ))
+            st.plotly_chart(fig_dispersao, use_container_width=True)
+
+            st.subheader("📊 Estatísticas da Relação")
+
+            if not dados_filtrados.empty:
+                # Um único spearmanr cacheado fornece rho e p-valor
+                # para as três métricas abaixo
+                corr_spearman, p_value = calcular_spearman_regional(
+                    dados_filtrados, variavel_dispersao
+                )
+
+                col_stat1, col_stat2, col_stat3 = st.columns(3)
+
+                with col_stat1:
+                    st.metric(
+                        "Correlação Spearman",
+                        f"{corr_spearman:.3f}",
+                        help="Correlação de postos de Spearman entre as variáveis"
+                    )
+
+                with col_stat2:
+                    total_pontos = len(dados_filtrados)
+                    st.metric("Total de Observações", f"{total_pontos}")
+
+                with col_stat3:
+                    significativo = p_value < 0.05
+                    st.metric(
+                        "Significância Estatística",
+                        "Significativo" if significativo else "Não Significativo",
+                        delta=f"p-value: {p_value:.4f}",
+                        delta_color="normal" if significativo else "off"
+                    )
+
+            with st.expander("ℹ️ Como interpretar este gráfico"):
+                st.markdown(_HELP_DISPERSAO_MD)
+
+        else:
+            st.warning("Não há dados disponíveis para a região selecionada")
+
+    else:
+        st.warning(
+            "Os gráficos de dispersão requerem análise de correlação. "
+            "Ative 'Analisar correlação clima-arboviroses' nas configurações."
+        )
+
+# Textos de ajuda estáticos definidos uma única vez na importação do módulo,
+# em vez de reconstruir as strings dentro dos expanders a cada rerun
+_HELP_DIAGNOSTICO_MD = """
+**📊 O que observar:**
+- 🌡️ **Temperatura**: Deve variar entre 15-35°C (dependendo da região)
+- 🌧️ **Precipitação**: Zeros são normais em meses secos
+- 💧 **Umidade**: Deve estar entre 40-95%
+- 📅 **Meses**: Idealmente 12 meses completos por região
+
+**⚠️ Problemas comuns:**
+- Temperatura constante (interpolação excessiva)
+- Precipitação sempre zero
+- Umidade fora da faixa realista
+- Menos de 12 meses de dados
+"""
+
+_HELP_HEATMAP_MD = """
+**🎯 Interpretação das Cores:**
+- **🔴 Vermelho Escuro**: Correlação positiva forte (próximo de +1)
+- **🔴 Vermelho Claro**: Correlação positiva fraca
+- **⚪ Branco**: Sem correlação (próximo de 0)
+- **🔵 Azul Claro**: Correlação negativa fraca
+- **🔵 Azul Escuro**: Correlação negativa forte (próximo de -1)
+
+**📊 Escala de Intensidade:**
+- **0.7 a 1.0**: Correlação muito forte
+- **0.5 a 0.7**: Correlação forte
+- **0.3 a 0.5**: Correlação moderada
+- **0.1 a 0.3**: Correlação fraca
+- **0.0 a 0.1**: Sem correlação prática
+
+**💡 Dica:** Compare diferentes regiões para identificar padrões regionais!
+"""
+
+_HELP_DISPERSAO_MD = """
+**📈 Interpretação do Gráfico de Dispersão:**
+
+- **Linha azul**: Tendência suavizada (LOWESS) mostrando o padrão geral
+- **Cores diferentes**: Cada região (quando "Todas as Regiões" selecionado)
+- **Eixo X**: Variável climática selecionada
+- **Eixo Y**: Número de casos da arbovirose
+
+**🔍 Padrões a observar:**
+- **Relação positiva**: Pontos seguem tendência ↗️ (mais clima = mais casos)
+- **Relação negativa**: Pontos seguem tendência ↘️ (mais clima = menos casos)
+- **Sem relação**: Pontos dispersos sem padrão claro
+- **Agrupamentos**: Revelam comportamentos sazonais ou regionais
+"""
+
+SESSION_DEFAULTS = {
+    'recalcular_correlacao': False,
+    'variavel_climatica_selecionada': 'temperatura_c',
+    'forcar_recarregar': False,
+}
+for chave_sessao, valor_padrao in SESSION_DEFAULTS.items():
+    st.session_state.setdefault(chave_sessao, valor_padrao)
 
 st.set_page_config(
     page_title="Análise de Arboviroses e Clima - Brasil", 
@@ -121,6 +631,7 @@ with st.sidebar:
     with col_cache1:
         if st.button("🗑️ Limpar Cache", type="secondary", use_container_width=True):
             try:
+                from correlation_analysis import limpar_cache_correlacao
                 limpar_cache_arboviroses()
                 limpar_cache_clima()
                 limpar_cache_correlacao()
@@ -130,9 +641,6 @@ with st.sidebar:
                 st.error(f"❌ Erro ao limpar cache: {e}")
     
     with col_cache2:
-        if 'forcar_recarregar' not in st.session_state:
-            st.session_state.forcar_recarregar = False
-            
         if st.button("🔄 Forçar Recarregar", type="secondary", use_container_width=True):
             st.session_state.forcar_recarregar = True
             st.info("🔁 Dados serão recarregados (ignorando cache)")
@@ -162,113 +670,275 @@ dados_ja_processados = (
 )
 
 if dados_ja_processados:
-    
+
+    import plotly.express as px
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    from correlation_analysis import (
+        analisar_correlacao_por_variavel,
+        construir_relacao_temporal
+    )
+
     usar_cache_atual = usar_cache and not st.session_state.get('forcar_recarregar', False)
     
     if st.session_state.get('forcar_recarregar', False):
         st.session_state.forcar_recarregar = False
     
-    with st.spinner("Baixando e processando dados de arboviroses..."):
-        try:
-            resultado_arbovirose = baixar_dados_arbovirose(arbovirose, ano, usar_cache=usar_cache_atual)
-            
-            if isinstance(resultado_arbovirose, tuple):
-                df_arboviroses, cache_utilizado_arb = resultado_arbovirose
-            else:
-                df_arboviroses = resultado_arbovirose
-                cache_utilizado_arb = False
-            
-            if df_arboviroses.empty:
-                st.warning(f"⚠️ Nenhum dado encontrado para {arbovirose} no ano {ano}.")
-                st.stop()
-                
-            casos_regiao = agrupar_casos_por_mes(df_arboviroses, ano)
-            relatorio_qualidade = gerar_relatorio_qualidade(df_arboviroses)
-            
-            if cache_utilizado_arb:
-                st.success(f"✅ Dados de {arbovirose} - {ano} carregados do cache!")
-            else:
-                st.success(f"✅ Dados de {arbovirose} - {ano} baixados e processados com sucesso!")
-            
-            st.session_state.dados_processados = True
-            
-        except Exception as e:
-            st.error(f"❌ Erro ao processar dados de arboviroses: {str(e)}")
-            st.session_state.dados_processados = False
-            st.stop()
-
-    relatorio_clima = None
-    df_clima = pd.DataFrame()
-    resultados_correlacao = {}
-    correlacoes_significativas = []
-    
-    if incluir_analise_clima:
-        with st.spinner("Baixando e processando dados climáticos..."):
-            try:
-                cache_existia_antes = CacheManagerClima.existe(ano) if usar_cache_atual else False
-                
-                resultado_clima = baixar_dados_climaticos(ano, usar_cache=usar_cache_atual)
+    # Curto-circuito: se as entradas não mudaram desde o último processamento,
+    # reutiliza os resultados guardados em session_state e pula todo o
+    # pipeline de download/tratamento/correlação neste rerun
+    entradas_atuais = (
+        arbovirose, ano,
+        st.session_state.variavel_climatica_selecionada,
+        st.session_state.defasagem,
+        incluir_analise_clima, analisar_correlacao
+    )
+    reusar_sessao = (
+        not btn_processar
+        and usar_cache_atual
+        and st.session_state.get('entradas_processadas') == entradas_atuais
+        and 'dados_sessao' in st.session_state
+    )
 
-                if isinstance(resultado_clima, tuple):
-                    df_clima_bruto, cache_utilizado_clima = resultado_clima
-                else:
-                    df_clima_bruto = resultado_clima
-                    cache_utilizado_clima = False
+    if reusar_sessao:
+        dados_sessao = st.session_state.dados_sessao
+        df_arboviroses = dados_sessao['df_arboviroses']
+        casos_regiao = dados_sessao['casos_regiao']
+        relatorio_qualidade = dados_sessao['relatorio_qualidade']
+        df_clima = dados_sessao['df_clima']
+        relatorio_clima = dados_sessao['relatorio_clima']
+        resultados_correlacao = dados_sessao['resultados_correlacao']
+        correlacoes_significativas = []
+        variaveis_climaticas_existentes = dados_sessao['variaveis_climaticas_existentes']
+        st.session_state.variaveis_existentes = variaveis_climaticas_existentes
+    else:
+        # Os downloads de arboviroses e clima são independentes e limitados
+        # por I/O (HTTP/disco); disparados em paralelo, a espera total vira
+        # max(t_arbovirose, t_clima) em vez da soma dos dois
+        from concurrent.futures import ThreadPoolExecutor
 
-                df_clima = tratar_dados_climaticos(df_clima_bruto)
-                relatorio_clima = gerar_relatorio_clima(df_clima)
+        # Além do blob por combinação completa de entradas (dados_sessao),
+        # cada dataset processado fica guardado por chave própria: trocar a
+        # arbovirose reaproveita o clima do mesmo ano sem novo download
+        cache_store = st.session_state.setdefault('cache_store', {})
+        chave_arb = ('arb', arbovirose, ano)
+        chave_clima = ('clima', ano)
+        reusar_arb = usar_cache_atual and chave_arb in cache_store
+        reusar_clima = usar_cache_atual and chave_clima in cache_store
 
-                if cache_utilizado_clima:
-                    st.success(f"✅ Dados climáticos - {ano} carregados do cache!")
+        executor_downloads = ThreadPoolExecutor(max_workers=2)
+        futuro_arbovirose = None
+        if not reusar_arb:
+            futuro_arbovirose = executor_downloads.submit(
+                baixar_dados_arbovirose, arbovirose, ano, usar_cache=usar_cache_atual,
+                cols=COLS_ARBOVIROSES_UI
+            )
+        futuro_clima = None
+        if incluir_analise_clima and not reusar_clima:
+            futuro_clima = executor_downloads.submit(
+                baixar_dados_climaticos, ano, usar_cache=usar_cache_atual
+            )
+        executor_downloads.shutdown(wait=False)
+
+        with st.spinner("Baixando e processando dados de arboviroses..."):
+            try:
+                if reusar_arb:
+                    df_arboviroses, casos_regiao, relatorio_qualidade = cache_store[chave_arb]
+                    st.success(f"✅ Dados de {arbovirose} - {ano} reutilizados da sessão!")
                 else:
-                    st.success(f"✅ Dados climáticos - {ano} processados com sucesso!")
-                
+                    resultado_arbovirose = futuro_arbovirose.result()
+
+                    if isinstance(resultado_arbovirose, tuple):
+                        df_arboviroses, cache_utilizado_arb = resultado_arbovirose
+                    else:
+                        df_arboviroses = resultado_arbovirose
+                        cache_utilizado_arb = False
+
+                    if df_arboviroses.empty:
+                        st.warning(f"⚠️ Nenhum dado encontrado para {arbovirose} no ano {ano}.")
+                        st.stop()
+
+                    if 'REGIAO' in df_arboviroses.columns:
+                        # Códigos inteiros no lugar de strings: isin/groupby/value_counts
+                        # sobre REGIAO passam a comparar int8 em vez de objetos Python
+                        df_arboviroses['REGIAO'] = df_arboviroses['REGIAO'].astype('category')
+
+                    casos_regiao = agrupar_casos_por_mes(df_arboviroses, ano)
+                    if 'REGIAO' in casos_regiao.columns:
+                        casos_regiao['REGIAO'] = casos_regiao['REGIAO'].astype('category')
+                    if 'MES_FORMATADO' in casos_regiao.columns:
+                        # Categórica ordenada: groupby(observed=True) dispensa a
+                        # expansão cartesiana e o unstack do pivot sai em ordem
+                        # de calendário, não alfabética
+                        sufixo_ano = str(ano)[-2:]
+                        casos_regiao['MES_FORMATADO'] = pd.Categorical(
+                            casos_regiao['MES_FORMATADO'],
+                            categories=[f'{mes}/{sufixo_ano}' for mes in MESES_CAT.categories],
+                            ordered=True
+                        )
+                    if 'CASOS' in casos_regiao.columns:
+                        # Contagens mensais cabem folgadamente em int32
+                        casos_regiao['CASOS'] = casos_regiao['CASOS'].astype(np.int32)
+                    relatorio_qualidade = gerar_relatorio_qualidade(df_arboviroses)
+                    cache_store[chave_arb] = (df_arboviroses, casos_regiao, relatorio_qualidade)
+
+                    if cache_utilizado_arb:
+                        st.success(f"✅ Dados de {arbovirose} - {ano} carregados do cache!")
+                    else:
+                        st.success(f"✅ Dados de {arbovirose} - {ano} baixados e processados com sucesso!")
+
+                st.session_state.dados_processados = True
+
             except Exception as e:
-                st.error(f"❌ Erro ao processar dados climáticos: {str(e)}")
-                if analisar_correlacao:
-                    st.warning("⚠️ Análise de correlação desativada devido a erro nos dados climáticos")
-                    analisar_correlacao = False
+                st.error(f"❌ Erro ao processar dados de arboviroses: {str(e)}")
+                st.session_state.dados_processados = False
+                st.stop()
+
+        relatorio_clima = None
+        df_clima = pd.DataFrame()
+        resultados_correlacao = {}
+        correlacoes_significativas = []
+        variaveis_climaticas_existentes = []
     
-    if analisar_correlacao and df_clima is not None and not df_clima.empty:
-        with st.spinner("Analisando correlação entre clima e arboviroses..."):
-            try:
-                if 'variavel_climatica_selecionada' in st.session_state:
+        if incluir_analise_clima:
+            with st.spinner("Baixando e processando dados climáticos..."):
+                try:
+                    if reusar_clima:
+                        df_clima, relatorio_clima = cache_store[chave_clima]
+                        st.success(f"✅ Dados climáticos - {ano} reutilizados da sessão!")
+                    else:
+                        cache_existia_antes = obter_cache_manager_clima().existe(ano) if usar_cache_atual else False
+
+                        resultado_clima = futuro_clima.result()
+
+                        if isinstance(resultado_clima, tuple):
+                            df_clima_bruto, cache_utilizado_clima = resultado_clima
+                        else:
+                            df_clima_bruto = resultado_clima
+                            cache_utilizado_clima = False
+
+                        df_clima = tratar_dados_climaticos(df_clima_bruto)
+                        if 'regiao' in df_clima.columns:
+                            df_clima['regiao'] = df_clima['regiao'].astype('category')
+                        # float32 basta para a precisão exibida (1 casa decimal) e
+                        # reduz à metade os bytes movidos nas reduções e no JSON do Plotly
+                        df_clima = df_clima.astype(
+                            {var: 'float32' for var in VARIAVEIS_CLIMATICAS_RELEVANTES
+                             if var in df_clima.columns},
+                            copy=False
+                        )
+                        relatorio_clima = gerar_relatorio_clima(df_clima)
+                        cache_store[chave_clima] = (df_clima, relatorio_clima)
+
+                        if cache_utilizado_clima:
+                            st.success(f"✅ Dados climáticos - {ano} carregados do cache!")
+                        else:
+                            st.success(f"✅ Dados climáticos - {ano} processados com sucesso!")
+
+                except Exception as e:
+                    st.error(f"❌ Erro ao processar dados climáticos: {str(e)}")
+                    if analisar_correlacao:
+                        st.warning("⚠️ Análise de correlação desativada devido a erro nos dados climáticos")
+                        analisar_correlacao = False
+    
+        # Filtro de colunas climáticas calculado uma única vez e reutilizado
+        # nas seções de clima e de heatmap (evita repetir checagens por rerun)
+        if df_clima is not None and not df_clima.empty:
+            variaveis_climaticas_existentes = [
+                var for var in VARIAVEIS_CLIMATICAS_RELEVANTES if var in df_clima.columns
+            ]
+        st.session_state.variaveis_existentes = variaveis_climaticas_existentes
+
+        if analisar_correlacao and df_clima is not None and not df_clima.empty:
+            with st.spinner("Analisando correlação entre clima e arboviroses..."):
+                try:
                     variavel_alvo = st.session_state.variavel_climatica_selecionada
-                else:
-                    variavel_alvo = 'temperatura_c'
                 
-                usar_cache_correlacao = usar_cache_atual
+                    usar_cache_correlacao = usar_cache_atual
                 
-                if st.session_state.get('recalcular_correlacao', False):
-                    usar_cache_correlacao = False
-                    st.session_state.recalcular_correlacao = False
+                    if st.session_state.get('recalcular_correlacao', False):
+                        usar_cache_correlacao = False
+                        st.session_state.recalcular_correlacao = False
                 
-                resultado_correlacao = analisar_correlacao_por_variavel(
-                    df_arboviroses, 
-                    df_clima, 
-                    arbovirose, 
-                    ano, 
-                    variavel_climatica=variavel_alvo,
-                    usar_cache=usar_cache_correlacao,
-                    defasagem_meses=st.session_state.defasagem
-                )
+                    resultado_correlacao = analisar_correlacao_por_variavel(
+                        df_arboviroses, 
+                        df_clima, 
+                        arbovirose, 
+                        ano, 
+                        variavel_climatica=variavel_alvo,
+                        usar_cache=usar_cache_correlacao,
+                        defasagem_meses=st.session_state.defasagem
+                    )
                 
-                if isinstance(resultado_correlacao, tuple):
-                    resultados_correlacao, cache_utilizado_corr = resultado_correlacao
-                else:
-                    resultados_correlacao = resultado_correlacao
-                    cache_utilizado_corr = False
+                    if isinstance(resultado_correlacao, tuple):
+                        resultados_correlacao, cache_utilizado_corr = resultado_correlacao
+                    else:
+                        resultados_correlacao = resultado_correlacao
+                        cache_utilizado_corr = False
                 
-                if cache_utilizado_corr:
-                    st.success(f"✅ Análise de correlação com {variavel_alvo.replace('_', ' ')} carregada do cache!")
-                else:
-                    st.success(f"✅ Análise de correlação com {variavel_alvo.replace('_', ' ')} concluída com sucesso!")
+                    if cache_utilizado_corr:
+                        st.success(f"✅ Análise de correlação com {variavel_alvo.replace('_', ' ')} carregada do cache!")
+                    else:
+                        st.success(f"✅ Análise de correlação com {variavel_alvo.replace('_', ' ')} concluída com sucesso!")
                 
-                st.session_state.ultima_variavel_analisada = variavel_alvo
+                    st.session_state.ultima_variavel_analisada = variavel_alvo
                     
-            except Exception as e:
-                st.error(f"❌ Erro na análise de correlação: {str(e)}")
+                except Exception as e:
+                    st.error(f"❌ Erro na análise de correlação: {str(e)}")
+
+        st.session_state.dados_sessao = {
+            'df_arboviroses': df_arboviroses,
+            'casos_regiao': casos_regiao,
+            'relatorio_qualidade': relatorio_qualidade,
+            'df_clima': df_clima,
+            'relatorio_clima': relatorio_clima,
+            'resultados_correlacao': resultados_correlacao,
+            'variaveis_climaticas_existentes': variaveis_climaticas_existentes,
+        }
+        st.session_state.entradas_processadas = entradas_atuais
     
+    # Subconjuntos de regiões válidas calculados uma única vez por rerun e
+    # compartilhados pelas estatísticas, abas de visualização e relatório final
+    if not df_arboviroses.empty and 'REGIAO' in df_arboviroses.columns:
+        df_regioes_validas = filtrar_regioes_validas(df_arboviroses)
+    else:
+        df_regioes_validas = pd.DataFrame()
+    if not casos_regiao.empty and 'REGIAO' in casos_regiao.columns:
+        casos_regiao_validos = filtrar_regioes_validas(casos_regiao)
+    else:
+        casos_regiao_validos = pd.DataFrame()
+
+    # Distribuição de casos por região em tabela única (contagem + percentual),
+    # reaproveitada pela pizza da aba 1, pela tabela da aba 4 e pelo relatório final
+    if not df_regioes_validas.empty:
+        vc_regiao = df_regioes_validas['REGIAO'].value_counts()
+        dist_regiao_tbl = pd.DataFrame({
+            'REGIAO': vc_regiao.index,
+            'CASOS': vc_regiao.values,
+            'PCT': vc_regiao.values * 100.0 / vc_regiao.values.sum()
+        })
+    else:
+        dist_regiao_tbl = pd.DataFrame(columns=['REGIAO', 'CASOS', 'PCT'])
+
+    # Pivot região × mês e totais mensais nacionais compartilhados pelo
+    # heatmap da aba 3, pelas métricas de mês de pico e pelos insights
+    if not casos_regiao_validos.empty:
+        pivot_regiao_mes = construir_pivot_regiao_mes(
+            casos_regiao_validos, arbovirose, ano,
+            len(casos_regiao_validos), int(casos_regiao_validos['CASOS'].sum())
+        )
+        # Redução direta no array do pivot: soma contígua por coluna + argmax,
+        # sem idxmax/lookup de rótulo do pandas a cada rerun
+        casos_por_mes_total = pivot_regiao_mes.to_numpy().sum(axis=0)
+        mes_pico_nacional = (
+            pivot_regiao_mes.columns[casos_por_mes_total.argmax()]
+            if casos_por_mes_total.size else None
+        )
+    else:
+        pivot_regiao_mes = pd.DataFrame()
+        casos_por_mes_total = np.array([])
+        mes_pico_nacional = None
+
     if mostrar_relatorio_qualidade:
         st.header("📋 Relatórios de Qualidade dos Dados")
         
@@ -314,32 +984,51 @@ if dados_ja_processados:
                 col_diagn1, col_diagn2 = st.columns([2, 1])
                 
                 with col_diagn1:
-                    for regiao in df_clima['regiao'].unique():
-                        df_regiao = df_clima[df_clima['regiao'] == regiao]
-                        
+                    # Todas as reduções por região em uma única passada agrupada,
+                    # em vez de uma máscara booleana + reduções por expander
+                    agg_especs = {'meses': ('data', 'count')}
+                    if 'temperatura_c' in df_clima.columns:
+                        agg_especs.update(
+                            temp_mean=('temperatura_c', 'mean'),
+                            temp_min=('temperatura_c', 'min'),
+                            temp_max=('temperatura_c', 'max')
+                        )
+                    if 'precipitacao_mm' in df_clima.columns:
+                        agg_especs.update(
+                            precip_mean=('precipitacao_mm', 'mean'),
+                            precip_sum=('precipitacao_mm', 'sum'),
+                            precip_zeros=('precipitacao_mm', lambda s: int((s == 0).sum()))
+                        )
+                    if 'umidade_percentual' in df_clima.columns:
+                        agg_especs.update(
+                            umid_mean=('umidade_percentual', 'mean'),
+                            umid_min=('umidade_percentual', 'min'),
+                            umid_max=('umidade_percentual', 'max'),
+                            umid_missing=('umidade_percentual', lambda s: int(s.isnull().sum()))
+                        )
+                    stats_diagnostico = df_clima.groupby('regiao', observed=True).agg(**agg_especs)
+
+                    for regiao, linha in stats_diagnostico.iterrows():
                         with st.expander(f"📊 {regiao} - Qualidade dos Dados", expanded=True):
                             col1, col2, col3 = st.columns(3)
-                            
+
                             with col1:
-                                if 'temperatura_c' in df_regiao.columns:
-                                    temp_data = df_regiao['temperatura_c']
-                                    st.metric("🌡️ Temperatura", f"{temp_data.mean():.1f}°C")
-                                    st.caption(f"Variação: {temp_data.min():.1f} a {temp_data.max():.1f}°C")
-                                    st.caption(f"Meses: {len(df_regiao)}")
-                            
+                                if 'temp_mean' in linha.index:
+                                    st.metric("🌡️ Temperatura", f"{linha['temp_mean']:.1f}°C")
+                                    st.caption(f"Variação: {linha['temp_min']:.1f} a {linha['temp_max']:.1f}°C")
+                                    st.caption(f"Meses: {int(linha['meses'])}")
+
                             with col2:
-                                if 'precipitacao_mm' in df_regiao.columns:
-                                    precip_data = df_regiao['precipitacao_mm']
-                                    st.metric("🌧️ Precipitação", f"{precip_data.mean():.1f}mm")
-                                    st.caption(f"Total: {precip_data.sum():.0f}mm")
-                                    st.caption(f"Zeros: {(precip_data == 0).sum()} meses")
-                            
+                                if 'precip_mean' in linha.index:
+                                    st.metric("🌧️ Precipitação", f"{linha['precip_mean']:.1f}mm")
+                                    st.caption(f"Total: {linha['precip_sum']:.0f}mm")
+                                    st.caption(f"Zeros: {int(linha['precip_zeros'])} meses")
+
                             with col3:
-                                if 'umidade_percentual' in df_regiao.columns:
-                                    umid_data = df_regiao['umidade_percentual']
-                                    st.metric("💧 Umidade", f"{umid_data.mean():.1f}%")
-                                    st.caption(f"Variação: {umid_data.min():.1f} a {umid_data.max():.1f}%")
-                                    st.caption(f"Missing: {umid_data.isnull().sum()}")
+                                if 'umid_mean' in linha.index:
+                                    st.metric("💧 Umidade", f"{linha['umid_mean']:.1f}%")
+                                    st.caption(f"Variação: {linha['umid_min']:.1f} a {linha['umid_max']:.1f}%")
+                                    st.caption(f"Missing: {int(linha['umid_missing'])}")
                 
                 with col_diagn2:
                     st.subheader("📈 Estatísticas Gerais")
@@ -369,75 +1058,58 @@ if dados_ja_processados:
                         )
                 
                 st.subheader("📋 Dados Detalhados por Mês e Região")
-                st.dataframe(df_clima, use_container_width=True)
+                with st.expander("📋 Ver dados brutos", expanded=False):
+                    df_clima_exibicao = df_clima.copy()
+                    df_clima_exibicao['regiao'] = df_clima_exibicao['regiao'].astype('category')
+                    colunas_float = df_clima_exibicao.select_dtypes(include='float64').columns
+                    df_clima_exibicao[colunas_float] = df_clima_exibicao[colunas_float].astype('float32')
+                    st.dataframe(df_clima_exibicao, use_container_width=True, height=400)
                 
                 with st.expander("ℹ️ Como interpretar este diagnóstico"):
-                    st.markdown("""
-                    **📊 O que observar:**
-                    - 🌡️ **Temperatura**: Deve variar entre 15-35°C (dependendo da região)
-                    - 🌧️ **Precipitação**: Zeros são normais em meses secos
-                    - 💧 **Umidade**: Deve estar entre 40-95%
-                    - 📅 **Meses**: Idealmente 12 meses completos por região
-                    
-                    **⚠️ Problemas comuns:**
-                    - Temperatura constante (interpolação excessiva)
-                    - Precipitação sempre zero 
-                    - Umidade fora da faixa realista
-                    - Menos de 12 meses de dados
-                    """)
+                    st.markdown(_HELP_DIAGNOSTICO_MD)
     
     st.header("🔍 Estatísticas Gerais")
-    
+
+    estatisticas_gerais = calcular_estatisticas_gerais(
+        df_arboviroses, arbovirose, ano, len(df_arboviroses)
+    )
+
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
         total_casos = len(df_arboviroses)
         st.metric("Total de Casos", f"{total_casos:,}")
-    
+
     with col2:
-        if not df_arboviroses.empty and 'REGIAO' in df_arboviroses.columns:
-            df_regioes_validas = df_arboviroses[df_arboviroses['REGIAO'].isin(REGIOES_VALIDAS)]
-            if not df_regioes_validas.empty:
-                dist_regiao = df_regioes_validas['REGIAO'].value_counts(normalize=True) * 100
-                regiao_mais_afetada = dist_regiao.index[0]
-                percentual_mais_afetada = dist_regiao.iloc[0]
-                
-                st.metric("Região Mais Afetada", f"{regiao_mais_afetada}")
-                st.caption(f"({percentual_mais_afetada:.1f}% dos casos)")
-            else:
-                st.metric("Região Mais Afetada", "N/A")
+        dist_regiao = estatisticas_gerais['dist_regiao']
+        if dist_regiao is not None and not dist_regiao.empty:
+            regiao_mais_afetada = dist_regiao.index[0]
+            percentual_mais_afetada = dist_regiao.iloc[0]
+
+            st.metric("Região Mais Afetada", f"{regiao_mais_afetada}")
+            st.caption(f"({percentual_mais_afetada:.1f}% dos casos)")
         else:
             st.metric("Região Mais Afetada", "N/A")
-    
+
     with col3:
-        if not df_arboviroses.empty and 'CS_SEXO' in df_arboviroses.columns:
-            distribuicao_sexo = df_arboviroses['CS_SEXO'].value_counts()
-            sexo_mais_comum = distribuicao_sexo.index[0] if not distribuicao_sexo.empty else "N/A"
-            st.metric("Sexo Mais Comum", sexo_mais_comum)
+        distribuicao_sexo = estatisticas_gerais['dist_sexo']
+        if distribuicao_sexo is not None and not distribuicao_sexo.empty:
+            st.metric("Sexo Mais Comum", distribuicao_sexo.index[0])
         else:
             st.metric("Sexo Mais Comum", "N/A")
     
     with col4:
-        if not casos_regiao.empty:
-            casos_regiao_validos = casos_regiao[casos_regiao['REGIAO'].isin(REGIOES_VALIDAS)]
-            if not casos_regiao_validos.empty:
-                mes_pico = casos_regiao_validos.loc[casos_regiao_validos['CASOS'].idxmax(), 'MES_FORMATADO']
-                st.metric("Mês de Pico", mes_pico)
-            else:
-                st.metric("Mês de Pico", "N/A")
+        if mes_pico_nacional is not None:
+            st.metric("Mês de Pico", mes_pico_nacional)
         else:
             st.metric("Mês de Pico", "N/A")
     
     if incluir_analise_clima and df_clima is not None:
         st.header("🌤️ Análise Climática por Região")
         
-        variaveis_climaticas_relevantes = ['precipitacao_mm', 'temperatura_c', 'umidade_percentual']
-        variaveis_existentes = [var for var in variaveis_climaticas_relevantes if var in df_clima.columns]
+        variaveis_existentes = variaveis_climaticas_existentes
         
         if variaveis_existentes:
-            if 'variavel_climatica_selecionada' not in st.session_state:
-                st.session_state.variavel_climatica_selecionada = 'temperatura_c'
-            
             variavel_selecionada = st.selectbox(
                 "Selecione a variável climática:",
                 variaveis_existentes,
@@ -448,43 +1120,42 @@ if dados_ja_processados:
             )
 
             if variavel_selecionada != st.session_state.variavel_climatica_selecionada:
-                from correlation_analysis import CacheManagerCorrelacao
                 variavel_anterior = st.session_state.variavel_climatica_selecionada
-                CacheManagerCorrelacao.limpar_variavel_especifica(arbovirose, ano, variavel_anterior)
+                obter_cache_manager_correlacao().limpar_variavel_especifica(arbovirose, ano, variavel_anterior)
                 
                 st.session_state.variavel_climatica_selecionada = variavel_selecionada
                 st.session_state.recalcular_correlacao = True
                 st.rerun()
             
-            MESES_PT_BR = {
-                1: 'Jan', 2: 'Fev', 3: 'Mar', 4: 'Abr', 5: 'Mai', 6: 'Jun',
-                7: 'Jul', 8: 'Ago', 9: 'Set', 10: 'Out', 11: 'Nov', 12: 'Dez'
-            }
-
             df_clima_display = df_clima.copy()
-            df_clima_display['mes_nome'] = df_clima_display['data'].dt.month.map(MESES_PT_BR)
-            df_clima_display['mes_ordem'] = df_clima_display['data'].dt.month
-
-            df_clima_display = df_clima_display.sort_values('mes_ordem')
-
-            fig_clima = px.line(
-                df_clima_display, 
-                x='mes_nome', 
-                y=variavel_selecionada,
-                color='regiao',
-                title=f'Evolução de {variavel_selecionada.replace("_", " ").title()} por Região - {ano}',
-                markers=True
+            df_clima_display['mes_nome'] = pd.Categorical.from_codes(
+                df_clima_display['data'].dt.month.values - 1, dtype=MESES_CAT
+            )
+
+            fig_clima = go.Figure()
+            for regiao_clima, df_regiao_clima in df_clima_display.groupby('regiao', sort=False, observed=True):
+                df_regiao_clima = downsample_serie_clima(df_regiao_clima, 'data')
+                fig_clima.add_trace(go.Scattergl(
+                    x=df_regiao_clima['mes_nome'],
+                    y=df_regiao_clima[variavel_selecionada],
+                    mode='lines+markers',
+                    name=regiao_clima
+                ))
+            fig_clima.update_xaxes(
+                categoryorder='array',
+                categoryarray=list(MESES_CAT.categories)
             )
             fig_clima.update_layout(
+                title=f'Evolução de {VAR_LABEL.get(variavel_selecionada, variavel_selecionada)} por Região - {ano}',
                 xaxis_title="Mês",
-                yaxis_title=variavel_selecionada.replace("_", " ").title(),
+                yaxis_title=VAR_LABEL.get(variavel_selecionada, variavel_selecionada),
                 template="plotly_white",
                 height=400
             )
             st.plotly_chart(fig_clima, use_container_width=True)
             
             st.subheader("📊 Estatísticas Climáticas por Região")
-            stats_clima = df_clima.groupby('regiao')[variavel_selecionada].agg(['mean', 'min', 'max', 'std']).round(2)
+            stats_clima = df_clima.groupby('regiao', observed=True)[variavel_selecionada].agg(['mean', 'min', 'max', 'std']).round(2)
             st.dataframe(stats_clima, use_container_width=True)
     
     if 'resultados_correlacao' in locals() and resultados_correlacao:
@@ -495,7 +1166,7 @@ if dados_ja_processados:
         
         corr_principal = relatorio_corr.get('correlacao_principal', {})
 
-        st.subheader(f"📈 Resultado para: {st.session_state.get('variavel_climatica_selecionada', 'N/A').replace('_', ' ').title()}")
+        st.subheader(f"📈 Resultado para: {VAR_LABEL.get(st.session_state.get('variavel_climatica_selecionada'), 'N/A')}")
 
         if corr_principal:
             with st.container(border=True):
@@ -546,8 +1217,15 @@ if dados_ja_processados:
                     key=f'heatmap_region_selector_{arbovirose}_{ano}'
                 )
                 
-                variaveis_correlacao = ['casos_arbovirose', 'precipitacao_mm', 'temperatura_c', 'umidade_percentual']
-                variaveis_existentes = [var for var in variaveis_correlacao if var in dados_correlacao.columns]
+                variaveis_existentes = [
+                    var for var in ['casos_arbovirose'] + variaveis_climaticas_existentes
+                    if var in dados_correlacao.columns
+                ]
+
+                # Rótulos calculados uma única vez e compartilhados pelos dois
+                # eixos (a matriz de correlação preserva a ordem das variáveis)
+                labels_melhorados = {'casos_arbovirose': f'Casos {arbovirose}', **VAR_LABEL}
+                labels_eixos = [labels_melhorados.get(var, var) for var in variaveis_existentes]
                 
                 if len(variaveis_existentes) > 1:
                     
@@ -559,56 +1237,29 @@ if dados_ja_processados:
                         titulo_heatmap = f'{regiao_selecionada_heatmap} - {arbovirose} {ano}'
                     
                     if not dados_heatmap.empty:
-                        corr_matrix = dados_heatmap[variaveis_existentes].corr(method='spearman')
+                        corr_matrix = calcular_matriz_spearman(dados_heatmap, tuple(variaveis_existentes))
                         
-                        fig_heatmap = px.imshow(
-                            corr_matrix,
-                            x=corr_matrix.columns,
-                            y=corr_matrix.index,
-                            color_continuous_scale='RdBu_r',
-                            aspect="auto",
-                            title=f'Mapa de Calor: {titulo_heatmap} (Defasagem: {st.session_state.defasagem} mês(es))',
-                            labels=dict(x="Variáveis", y="Variáveis", color="Correlação"),
+                        fig_heatmap = go.Figure(go.Heatmap(
+                            z=corr_matrix.to_numpy(dtype='float32'),
+                            x=labels_eixos,
+                            y=labels_eixos,
+                            colorscale='RdBu_r',
                             zmin=-1,
-                            zmax=1
-                        )
-                        
-                        for i in range(len(corr_matrix)):
-                            for j in range(len(corr_matrix)):
-                                fig_heatmap.add_annotation(
-                                    x=j, y=i,
-                                    text=f"{corr_matrix.iloc[i, j]:.2f}",
-                                    showarrow=False,
-                                    font=dict(
-                                        color="white" if abs(corr_matrix.iloc[i, j]) > 0.5 else "black",
-                                        size=12
-                                    )
-                                )
-                        
+                            zmax=1,
+                            text=corr_matrix.to_numpy(dtype='float32'),
+                            texttemplate="%{text:.2f}",
+                            textfont=dict(size=12),
+                            colorbar=dict(title='Correlação')
+                        ))
+
                         fig_heatmap.update_layout(
+                            title=f'Mapa de Calor: {titulo_heatmap} (Defasagem: {st.session_state.defasagem} mês(es))',
                             height=500,
                             xaxis_title="Variáveis Climáticas",
                             yaxis_title="Variáveis de Casos",
                             font=dict(size=12)
                         )
-                        
-                        labels_melhorados = {
-                            'casos_arbovirose': f'Casos {arbovirose}',
-                            'precipitacao_mm': 'Precipitação (mm)',
-                            'temperatura_c': 'Temperatura (°C)',
-                            'umidade_percentual': 'Umidade (%)'
-                        }
-                        
-                        fig_heatmap.update_xaxes(
-                            ticktext=[labels_melhorados.get(col, col) for col in corr_matrix.columns],
-                            tickvals=list(range(len(corr_matrix.columns)))
-                        )
-                        
-                        fig_heatmap.update_yaxes(
-                            ticktext=[labels_melhorados.get(col, col) for col in corr_matrix.index],
-                            tickvals=list(range(len(corr_matrix.index)))
-                        )
-                        
+
                         st.plotly_chart(fig_heatmap, use_container_width=True)
                         
                         st.subheader("📈 Estatísticas da Análise")
@@ -643,9 +1294,8 @@ if dados_ja_processados:
                                 variavel_alvo = st.session_state.get('variavel_climatica_selecionada', 'temperatura_c')
                                 
                                 if variavel_alvo in dados_estatisticas.columns and 'casos_arbovirose' in dados_estatisticas.columns and len(dados_estatisticas) >= 2:
-                                    correlacao_principal, p_valor_regional = spearmanr(
-                                        dados_estatisticas['casos_arbovirose'], 
-                                        dados_estatisticas[variavel_alvo]
+                                    correlacao_principal, p_valor_regional = calcular_spearman_regional(
+                                        dados_estatisticas, variavel_alvo
                                     )
                                     
                                     significativo = p_valor_regional < 0.05
@@ -655,7 +1305,7 @@ if dados_ja_processados:
                                     p_valor_status = "Significativo" if significativo else "Não Significativo"
 
                                     st.markdown(
-                                        f"- **{variavel_alvo.replace('_', ' ').title()}** : **{correlacao_principal:.3f}** "
+                                        f"- **{VAR_LABEL.get(variavel_alvo, variavel_alvo)}** : **{correlacao_principal:.3f}** "
                                         f"({direcao} e {intensidade}) "
                                         f"| **P-valor**: **{p_valor_regional:.4f}** ({p_valor_status})"
                                     )
@@ -665,23 +1315,7 @@ if dados_ja_processados:
                                 st.warning("Não há dados suficientes para calcular estatísticas.")
 
                     with st.expander("ℹ️ Como interpretar os mapas de calor:"):
-                        st.markdown("""
-                        **🎯 Interpretação das Cores:**
-                        - **🔴 Vermelho Escuro**: Correlação positiva forte (próximo de +1)
-                        - **🔴 Vermelho Claro**: Correlação positiva fraca
-                        - **⚪ Branco**: Sem correlação (próximo de 0)  
-                        - **🔵 Azul Claro**: Correlação negativa fraca
-                        - **🔵 Azul Escuro**: Correlação negativa forte (próximo de -1)
-                        
-                        **📊 Escala de Intensidade:**
-                        - **0.7 a 1.0**: Correlação muito forte
-                        - **0.5 a 0.7**: Correlação forte
-                        - **0.3 a 0.5**: Correlação moderada
-                        - **0.1 a 0.3**: Correlação fraca
-                        - **0.0 a 0.1**: Sem correlação prática
-                        
-                        **💡 Dica:** Compare diferentes regiões para identificar padrões regionais!
-                        """)
+                        st.markdown(_HELP_HEATMAP_MD)
                 else:
                     st.warning("Não há variáveis suficientes para gerar o mapa de calor")
             else:
@@ -701,278 +1335,43 @@ if dados_ja_processados:
     ])
     
     with tab1:
-        st.subheader("🗺️ Distribuição de Casos por Região")
-        
-        if not df_arboviroses.empty and 'REGIAO' in df_arboviroses.columns:
-            df_regioes_validas = df_arboviroses[df_arboviroses['REGIAO'].isin(REGIOES_VALIDAS)]
-            
-            if not df_regioes_validas.empty:
-                dist_regiao = df_regioes_validas['REGIAO'].value_counts()
-                total_casos = dist_regiao.sum()
-                
-                df_regioes = pd.DataFrame({
-                    'Região': dist_regiao.index,
-                    'Casos': dist_regiao.values,
-                    'Percentual': (dist_regiao.values / total_casos * 100).round(1)
-                })
-                
-                fig_pizza = px.pie(
-                    df_regioes, 
-                    values='Casos', 
-                    names='Região',
-                    title=f'Distribuição de Casos de {arbovirose} por Região - {ano}',
-                    hover_data=['Percentual'],
-                    labels={'Percentual': '%'}
-                )
-                
-                fig_pizza.update_traces(
-                    textposition='inside',
-                    textinfo='percent+label',
-                    hovertemplate='<b>%{label}</b><br>Casos: %{value:,}<br>Percentual: %{percent}'
-                )
-                
-                fig_pizza.update_layout(height=500, showlegend=True)
-                st.plotly_chart(fig_pizza, use_container_width=True)
-                
-                st.subheader("📊 Dados Detalhados por Região")
-                st.dataframe(df_regioes, use_container_width=True)
-            else:
-                st.warning("Não há dados de regiões válidas disponíveis")
-        else:
-            st.warning("Não há dados de região disponíveis")
-    
+        renderizar_tab_distribuicao(
+            dist_regiao_tbl,
+            not df_arboviroses.empty and 'REGIAO' in df_arboviroses.columns,
+            arbovirose,
+            ano
+        )
+
     with tab2:
-        st.subheader("📈 Evolução Mensal por Região")
-        
-        if not casos_regiao.empty:
-            casos_regiao_validos = casos_regiao[casos_regiao['REGIAO'].isin(REGIOES_VALIDAS)]
-            regioes = casos_regiao_validos['REGIAO'].unique()
-            
-            if len(regioes) > 0:
-                col1, col2 = st.columns(2)
-                
-                for i, regiao in enumerate(regioes):
-                    with col1 if i % 2 == 0 else col2:
-                        dados_regiao = casos_regiao_validos[casos_regiao_validos["REGIAO"] == regiao]
-                        if not dados_regiao.empty:
-                            fig = px.line(
-                                dados_regiao, 
-                                x="MES_FORMATADO", 
-                                y="CASOS",
-                                title=f"{regiao} - {ano}",
-                                markers=True,
-                                color_discrete_sequence=[px.colors.qualitative.Set1[i % 10]]
-                            )
-                            fig.update_layout(
-                                xaxis_title="Mês", 
-                                yaxis_title="Número de Casos", 
-                                template="plotly_white",
-                                height=300
-                            )
-                            st.plotly_chart(fig, use_container_width=True)
-                        else:
-                            st.warning(f"Sem dados para {regiao}")
-            else:
-                st.warning("Não há dados de regiões válidas para gerar os gráficos")
-        else:
-            st.warning("Não há dados suficientes para gerar os gráficos por região")
-    
+        renderizar_tab_evolucao(casos_regiao_validos, ano)
+
     with tab3:
-        st.subheader("🔥 Mapa de Calor - Casos por Região e Mês")
-        if not casos_regiao.empty:
-            casos_regiao_validos = casos_regiao[casos_regiao['REGIAO'].isin(REGIOES_VALIDAS)]
-            
-            if not casos_regiao_validos.empty:
-                pivot_table = casos_regiao_validos.pivot_table(
-                    index='REGIAO', 
-                    columns='MES_FORMATADO', 
-                    values='CASOS', 
-                    aggfunc='sum', 
-                    fill_value=0
-                )
-                
-                fig = go.Figure(data=go.Heatmap(
-                    z=pivot_table.values,
-                    x=pivot_table.columns,
-                    y=pivot_table.index,
-                    colorscale='Reds',
-                    hoverongaps=False,
-                    hovertemplate='Região: %{y}<br>Mês: %{x}<br>Casos: %{z}<extra></extra>',
-                    colorbar=dict(title='Número de Casos')
-                ))
-                
-                fig.update_layout(
-                    title=f'Mapa de Calor de Casos de {arbovirose} por Região e Mês - {ano}',
-                    xaxis_title='Mês',
-                    yaxis_title='Região',
-                    height=500
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.warning("Não há dados de regiões válidas para gerar o mapa de calor")
-        else:
-            st.warning("Não há dados suficientes para gerar o mapa de calor")
-    
+        renderizar_tab_heatmap(pivot_regiao_mes, not casos_regiao.empty, arbovirose, ano)
+
     with tab4:
-        st.subheader("📋 Dados Detalhados")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.write("**Casos por Região e Mês**")
-            if not casos_regiao.empty:
-                casos_regiao_validos = casos_regiao[casos_regiao['REGIAO'].isin(REGIOES_VALIDAS)]
-                st.dataframe(casos_regiao_validos, use_container_width=True)
-            else:
-                st.warning("Não há dados para exibir")
-        
-        with col2:
-            st.write("**Distribuição por Região**")
-            if not df_arboviroses.empty and 'REGIAO' in df_arboviroses.columns:
-                df_regioes_validas = df_arboviroses[df_arboviroses['REGIAO'].isin(REGIOES_VALIDAS)]
-                if not df_regioes_validas.empty:
-                    distribuicao_regiao = df_regioes_validas['REGIAO'].value_counts().reset_index()
-                    distribuicao_regiao.columns = ['REGIAO', 'CASOS']
-                    distribuicao_regiao['%'] = (distribuicao_regiao['CASOS'] / distribuicao_regiao['CASOS'].sum() * 100).round(2)
-                    st.dataframe(distribuicao_regiao, use_container_width=True)
-                else:
-                    st.warning("Não há dados de regiões válidas disponíveis")
-            else:
-                st.warning("Não há dados de região disponíveis")
-        
+        renderizar_tab_tabelas(
+            casos_regiao_validos,
+            not casos_regiao.empty,
+            dist_regiao_tbl,
+            not df_arboviroses.empty and 'REGIAO' in df_arboviroses.columns,
+            arbovirose,
+            ano
+        )
+
     with tab5:
-        st.subheader("📈 Gráfico de Dispersão: Clima vs Casos")
-        
-        if 'resultados_correlacao' in locals() and resultados_correlacao and not resultados_correlacao.get('dados_correlacao', pd.DataFrame()).empty:
-            
-            dados_dispersao = resultados_correlacao['dados_correlacao']
-            variavel_atual = st.session_state.get('variavel_climatica_selecionada', 'temperatura_c')
-            
-            col_controls1, col_controls2 = st.columns(2)
-            
-            with col_controls1:
-                variaveis_disponiveis = [var for var in ['temperatura_c', 'precipitacao_mm', 'umidade_percentual'] 
-                                    if var in dados_dispersao.columns]
-                variavel_dispersao = st.selectbox(
-                    "Variável climática:",
-                    variaveis_disponiveis,
-                    index=variaveis_disponiveis.index(variavel_atual) if variavel_atual in variaveis_disponiveis else 0,
-                    key='dispersao_var_select'
-                )
-            
-            with col_controls2:
-                regioes_dispersao = ['Todas as Regiões'] + dados_dispersao['REGIAO'].unique().tolist()
-                regiao_dispersao = st.selectbox(
-                    "Filtrar por região:",
-                    regioes_dispersao,
-                    key='dispersao_regiao_select'
-                )
-            
-            if regiao_dispersao == 'Todas as Regiões':
-                dados_filtrados = dados_dispersao
-                titulo_regiao = "Todas as Regiões"
-            else:
-                dados_filtrados = dados_dispersao[dados_dispersao['REGIAO'] == regiao_dispersao]
-                titulo_regiao = regiao_dispersao
-            
-            if not dados_filtrados.empty:
-                fig_dispersao = px.scatter(
-                    dados_filtrados,
-                    x=variavel_dispersao,
-                    y='casos_arbovirose',
-                    color='REGIAO' if regiao_dispersao == 'Todas as Regiões' else None,
-                    title=f'Relação entre {variavel_dispersao.replace("_", " ").title()} e Casos de {arbovirose} - {titulo_regiao}',
-                    labels={
-                        variavel_dispersao: variavel_dispersao.replace('_', ' ').title(),
-                        'casos_arbovirose': f'Casos de {arbovirose}',
-                        'REGIAO': 'Região'
-                    },
-                    hover_data=['mes_nome_clima', 'mes_nome_arbovirose', 'relacao_temporal'],
-                    trendline='lowess'
-                )
-                
-                fig_dispersao.update_layout(
-                    height=500,
-                    template="plotly_white",
-                    xaxis_title=variavel_dispersao.replace('_', ' ').title(),
-                    yaxis_title=f'Casos de {arbovirose}',
-                    showlegend=(regiao_dispersao == 'Todas as Regiões')
-                )
-                
-                fig_dispersao.update_traces(
-                    hovertemplate=(
-                        f"<b>{variavel_dispersao.replace('_', ' ').title()}:</b> %{{x}}<br>"
-                        f"<b>Casos {arbovirose}:</b> %{{y}}<br>"
-                        "<b>Relação temporal:</b> %{customdata[2]}<br>"
-                        "<extra></extra>"
-                    )
-                )
-                
-                st.plotly_chart(fig_dispersao, use_container_width=True)
-                
-                st.subheader("📊 Estatísticas da Relação")
-                
-                if not dados_filtrados.empty:
-                    col_stat1, col_stat2, col_stat3 = st.columns(3)
-                    
-                    with col_stat1:
-                        correlacao = dados_filtrados[['casos_arbovirose', variavel_dispersao]].corr(method='spearman').iloc[0,1]
-                        st.metric(
-                            "Correlação Spearman",
-                            f"{correlacao:.3f}",
-                            help="Correlação de postos de Spearman entre as variáveis"
-                        )
-                    
-                    with col_stat2:
-                        total_pontos = len(dados_filtrados)
-                        st.metric("Total de Observações", f"{total_pontos}")
-                    
-                    with col_stat3:
-                        from scipy import stats
-                        corr_spearman, p_value = stats.spearmanr(
-                            dados_filtrados[variavel_dispersao], 
-                            dados_filtrados['casos_arbovirose']
-                        )
-                        significativo = p_value < 0.05
-                        st.metric(
-                            "Significância Estatística", 
-                            "Significativo" if significativo else "Não Significativo",
-                            delta=f"p-value: {p_value:.4f}",
-                            delta_color="normal" if significativo else "off"
-                        )
-                
-                with st.expander("ℹ️ Como interpretar este gráfico"):
-                    st.markdown("""
-                    **📈 Interpretação do Gráfico de Dispersão:**
-                    
-                    - **Linha azul**: Tendência suavizada (LOWESS) mostrando o padrão geral
-                    - **Cores diferentes**: Cada região (quando "Todas as Regiões" selecionado)
-                    - **Eixo X**: Variável climática selecionada
-                    - **Eixo Y**: Número de casos da arbovirose
-                    
-                    **🔍 Padrões a observar:**
-                    - **Relação positiva**: Pontos seguem tendência ↗️ (mais clima = mais casos)
-                    - **Relação negativa**: Pontos seguem tendência ↘️ (mais clima = menos casos)  
-                    - **Sem relação**: Pontos dispersos sem padrão claro
-                    - **Agrupamentos**: Revelam comportamentos sazonais ou regionais
-                    """)
-            
-            else:
-                st.warning("Não há dados disponíveis para a região selecionada")
-        
-        else:
-            st.warning(
-                "Os gráficos de dispersão requerem análise de correlação. "
-                "Ative 'Analisar correlação clima-arboviroses' nas configurações."
-            )
-    
+        renderizar_tab_dispersao(
+            resultados_correlacao if 'resultados_correlacao' in locals() else None,
+            arbovirose
+        )
+
     st.header("📋 Relatório Analítico Final")
     
     if not df_arboviroses.empty:
-        if 'REGIAO' in df_arboviroses.columns:
-            df_regioes_validas = df_arboviroses[df_arboviroses['REGIAO'].isin(REGIOES_VALIDAS)]
-            if not df_regioes_validas.empty:
-                percentual_regiao = (df_regioes_validas['REGIAO'].value_counts(normalize=True) * 100).round(2)
+        if not dist_regiao_tbl.empty:
+            percentual_regiao = pd.Series(
+                dist_regiao_tbl['PCT'].round(2).values,
+                index=dist_regiao_tbl['REGIAO'].values
+            )
         
         col1, col2, col3 = st.columns(3)
         
@@ -987,22 +1386,16 @@ if dados_ja_processados:
                 st.metric("Região Mais Afetada", "N/A")
         
         with col3:
-            if not casos_regiao.empty:
-                casos_regiao_validos = casos_regiao[casos_regiao['REGIAO'].isin(REGIOES_VALIDAS)]
-                if not casos_regiao_validos.empty:
-                    mes_pico = casos_regiao_validos.loc[casos_regiao_validos['CASOS'].idxmax(), 'MES_FORMATADO']
-                    st.metric("Mês de Pico Nacional", mes_pico)
-                else:
-                    st.metric("Mês de Pico Nacional", "N/A")
+            if mes_pico_nacional is not None:
+                st.metric("Mês de Pico Nacional", mes_pico_nacional)
             else:
                 st.metric("Mês de Pico Nacional", "N/A")
         
-        if 'resultados_correlacao' in locals() and resultados_correlacao:
-            relatorio_corr = resultados_correlacao.get('relatorio', {})
-            corr_principal = relatorio_corr.get('correlacao_principal', {})
+        if 'corr_principal' in locals() and resultados_correlacao:
+            # relatorio_corr/corr_principal já foram extraídos na seção de correlação
             if corr_principal and corr_principal.get('significativo'):
                 st.subheader("🔗 Insights de Correlação Clima-Arboviroses")
-                var_nome = corr_principal['variavel_climatica'].replace('_', ' ').title()
+                var_nome = VAR_LABEL.get(corr_principal['variavel_climatica'], corr_principal['variavel_climatica'])
                 st.info(
                     f"**{var_nome}**: Encontrada uma correlação **{corr_principal['direcao']}** e **{corr_principal['intensidade']}** "
                     f"(ρ = {corr_principal['correlacao_spearman']:.3f}) com os casos de {arbovirose}."
@@ -1016,11 +1409,11 @@ if dados_ja_processados:
             insights.append(f"• **Concentração regional**: {percentual_regiao.index[0]} concentra {percentual_regiao.iloc[0]}% dos casos")
         
         if not casos_regiao.empty and len(casos_regiao) > 1:
-            casos_regiao_validos = casos_regiao[casos_regiao['REGIAO'].isin(REGIOES_VALIDAS)]
-            if not casos_regiao_validos.empty:
-                casos_por_mes = casos_regiao_validos.groupby('MES_FORMATADO')['CASOS'].sum()
-                if len(casos_por_mes) > 1 and casos_por_mes.iloc[0] > 0:
-                    variacao = ((casos_por_mes.iloc[-1] - casos_por_mes.iloc[0]) / casos_por_mes.iloc[0]) * 100
+            if casos_por_mes_total.size:
+                # Acesso direto ao array do pivot já agregado, sem novo groupby
+                por_mes = casos_por_mes_total
+                if por_mes.size > 1 and por_mes[0] > 0:
+                    variacao = (por_mes[-1] - por_mes[0]) / por_mes[0] * 100.0
                     
                     if variacao > 50:
                         insights.append(f"• **Crescimento significativo**: Aumento de {variacao:+.1f}% em relação ao início do ano")
@@ -1030,8 +1423,7 @@ if dados_ja_processados:
         if not insights:
             insights.append("• **Padrão estável**: Distribuição relativamente equilibrada entre regiões e ao longo do ano")
         
-        for insight in insights:
-            st.write(insight)
+        st.markdown("\n\n".join(insights))
 
 else:
     st.info("👆 Selecione uma arbovirose e ano acima, depois clique em 'Baixar e Processar Dados' para iniciar a análise.")
@@ -10,13 +10,24 @@ import time
 import pandas as pd
 import requests
 import zipfile
-import io
+import tempfile
 import numpy as np
 import os
-import pickle
-from typing import Tuple, Dict, Optional
+import json
+import hashlib
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Tuple, Dict, List, Optional
 import logging
 
+# Copy-on-write mantém as atribuições in-place dos pipelines de limpeza
+# livres de SettingWithCopyWarning mesmo com utils importado sozinho
+# (correlation_analysis também ativa, mas um módulo não deve depender do
+# efeito colateral de import do outro)
+if int(pd.__version__.split('.')[0]) >= 2:
+    pd.set_option('mode.copy_on_write', True)
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -38,7 +49,19 @@ URLS = {
 COLS_PADRAO_DENGUE = ['DT_NOTIFIC', 'SG_UF', 'ID_MUNICIP', 'CS_SEXO', 'NU_IDADE_N']
 COLS_PADRAO_OUTRAS = ['DT_NOTIFIC', 'SG_UF', 'ID_MUNICIP', 'CS_SEXO', 'NU_IDADE_N', 'CLASSI_FIN']
 
-REGIOES_VALIDAS = ['Nordeste', 'Norte', 'Centro-Oeste', 'Sudeste', 'Sul']
+# Colunas de baixa cardinalidade já entram como category na leitura do CSV:
+# o frame bruto encolhe várias vezes e drop_duplicates/groupby/isin passam a
+# operar sobre códigos inteiros em vez de strings Python
+DTYPES_LEITURA_CSV = {'SG_UF': 'category', 'ID_MUNICIP': 'category', 'CS_SEXO': 'category'}
+
+REGIOES_VALIDAS = frozenset(['Nordeste', 'Norte', 'Centro-Oeste', 'Sudeste', 'Sul'])
+
+# Tabela de consulta UF → região indexada pelo código IBGE inteiro: um gather
+# C de int8 (a tabela cabe em L1) no lugar de um lookup de dict por linha
+REGIOES_ORDENADAS = ('Norte', 'Nordeste', 'Sudeste', 'Sul', 'Centro-Oeste', 'Não definida')
+_UF_PARA_REGIAO = np.full(60, REGIOES_ORDENADAS.index('Não definida'), dtype=np.int8)
+for _uf, _regiao in MAPA_CODIGOS_IBGE.items():
+    _UF_PARA_REGIAO[int(_uf)] = REGIOES_ORDENADAS.index(_regiao)
 
 CACHE_DIR = "Dados"
 ARBOVIROSES_CACHE_DIR = os.path.join(CACHE_DIR, "arboviroses")
@@ -50,17 +73,60 @@ class CacheManagerArboviroses:
     
     CACHE_TTL_HORAS = 24
     CACHE_TTL_SEGUNDOS = CACHE_TTL_HORAS * 3600
-    
+
+    # Memoização do mtime por caminho dentro de uma execução: evita repetir
+    # os.path.exists + getmtime (três syscalls por consulta) em lotes que
+    # tocam muitas chaves de cache
+    _mtime_cache: Dict[str, float] = {}
+
+    @staticmethod
+    def _mtime_ou_none(caminho: str) -> Optional[float]:
+        """mtime do arquivo de cache em um único os.stat, ou None se não existir"""
+        mtime = CacheManagerArboviroses._mtime_cache.get(caminho)
+        if mtime is None:
+            try:
+                mtime = os.stat(caminho).st_mtime
+            except OSError:
+                return None
+            CacheManagerArboviroses._mtime_cache[caminho] = mtime
+        return mtime
+
+    _gc_executado = False
+
     @staticmethod
     def _criar_diretorios():
         """Cria diretórios de cache se não existirem"""
         os.makedirs(ARBOVIROSES_CACHE_DIR, exist_ok=True)
         logger.info(f"Diretório de cache verificado/criado: {ARBOVIROSES_CACHE_DIR}")
-    
+        CacheManagerArboviroses._remover_caches_obsoletos()
+
+    @staticmethod
+    def _remover_caches_obsoletos():
+        """
+        Remove arquivos de versões antigas do pipeline (uma vez por execução)
+
+        O nome do arquivo embute o hash do código do DataCleaner; qualquer
+        cache cujo sufixo não bata com a versão atual está obsoleto.
+        """
+        if CacheManagerArboviroses._gc_executado:
+            return
+        CacheManagerArboviroses._gc_executado = True
+        try:
+            sufixo_atual = f"_{PIPELINE_VERSAO}.parquet"
+            for arquivo in os.listdir(ARBOVIROSES_CACHE_DIR):
+                # etags.json guarda os validadores HTTP e vale entre versões
+                if arquivo == 'etags.json':
+                    continue
+                if not arquivo.endswith(sufixo_atual):
+                    os.remove(os.path.join(ARBOVIROSES_CACHE_DIR, arquivo))
+                    logger.info(f"Cache de versão antiga do pipeline removido: {arquivo}")
+        except OSError as e:
+            logger.warning(f"Não foi possível varrer caches obsoletos: {e}")
+
     @staticmethod
     def _gerar_nome_arquivo(arbovirose: str, ano: int) -> str:
-        """Gera nome do arquivo de cache baseado na arbovirose e ano"""
-        return f"{arbovirose.lower()}_{ano}.pkl"
+        """Gera nome do arquivo de cache baseado na arbovirose, ano e versão do pipeline"""
+        return f"{arbovirose.lower()}_{ano}_{PIPELINE_VERSAO}.parquet"
     
     @staticmethod
     def _caminho_arquivo(arbovirose: str, ano: int) -> str:
@@ -72,56 +138,74 @@ class CacheManagerArboviroses:
     @staticmethod
     def salvar(arbovirose: str, ano: int, dados: pd.DataFrame) -> bool:
         """
-        Salva dados no cache
-        
+        Salva dados no cache em formato Parquet
+
+        O Arrow não armazena PeriodDtype nativamente, então ANO_MES vira
+        timestamp antes da escrita (restaurado em carregar); colunas de
+        baixa cardinalidade viram category para serem dicionarizadas,
+        reduzindo bastante o tamanho em disco frente ao pickle.
+
         Args:
             arbovirose: Nome da arbovirose
             ano: Ano dos dados
             dados: DataFrame a ser salvo
-            
+
         Returns:
             True se salvou com sucesso
         """
         try:
             caminho = CacheManagerArboviroses._caminho_arquivo(arbovirose, ano)
-            
-            with open(caminho, 'wb') as f:
-                pickle.dump(dados, f)
-            
+
+            dados_parquet = dados.copy()
+            if 'ANO_MES' in dados_parquet.columns and isinstance(dados_parquet['ANO_MES'].dtype, pd.PeriodDtype):
+                dados_parquet['ANO_MES'] = dados_parquet['ANO_MES'].dt.to_timestamp()
+            for col in ('REGIAO', 'CS_SEXO', 'SG_UF'):
+                if col in dados_parquet.columns:
+                    dados_parquet[col] = dados_parquet[col].astype('category')
+
+            dados_parquet.to_parquet(caminho, engine='pyarrow', compression='zstd', index=False)
+            CacheManagerArboviroses._mtime_cache.pop(caminho, None)
+
             logger.info(f"Dados de {arbovirose} {ano} salvos em cache: {caminho}")
             return True
-            
+
         except Exception as e:
             logger.error(f"Erro ao salvar cache {arbovirose} {ano}: {e}")
             return False
     
     @staticmethod
-    def carregar(arbovirose: str, ano: int) -> Optional[pd.DataFrame]:
+    def carregar(arbovirose: str, ano: int, ignorar_validade: bool = False) -> Optional[pd.DataFrame]:
         """
         Carrega dados do cache se existirem e estiverem válidos
-        
+
         Args:
             arbovirose: Nome da arbovirose
             ano: Ano dos dados
-            
+            ignorar_validade: Carrega mesmo um cache expirado pelo TTL
+                (usado quando o servidor confirma via ETag que o arquivo
+                de origem não mudou)
+
         Returns:
             DataFrame carregado ou None se não existir ou expirado
         """
         try:
             caminho = CacheManagerArboviroses._caminho_arquivo(arbovirose, ano)
-            
-            if not os.path.exists(caminho):
+
+            mtime = CacheManagerArboviroses._mtime_ou_none(caminho)
+            if mtime is None:
                 logger.info(f"Cache não encontrado: {caminho}")
                 return None
-            
-            if not CacheManagerArboviroses._cache_esta_valido(caminho, ano):
-                logger.info(f"Cache expirado, removendo: {caminho}")
-                os.remove(caminho)
+
+            if not ignorar_validade and not CacheManagerArboviroses._cache_esta_valido(mtime, ano):
+                # O arquivo fica no disco: um GET condicional com ETag pode
+                # revalidá-lo sem baixar tudo de novo (salvar sobrescreve)
+                logger.info(f"Cache expirado: {caminho}")
                 return None
-            
-            with open(caminho, 'rb') as f:
-                dados = pickle.load(f)
-            
+
+            dados = pd.read_parquet(caminho, engine='pyarrow')
+            if 'ANO_MES' in dados.columns and pd.api.types.is_datetime64_any_dtype(dados['ANO_MES']):
+                dados['ANO_MES'] = dados['ANO_MES'].dt.to_period('M')
+
             logger.info(f"Dados de {arbovirose} {ano} carregados do cache: {caminho}")
             return dados
             
@@ -142,20 +226,19 @@ class CacheManagerArboviroses:
             True se existe no cache e é válido
         """
         caminho = CacheManagerArboviroses._caminho_arquivo(arbovirose, ano)
-        if not os.path.exists(caminho):
+        mtime = CacheManagerArboviroses._mtime_ou_none(caminho)
+        if mtime is None:
             return False
-        
-        return CacheManagerArboviroses._cache_esta_valido(caminho, ano)
-    
+
+        return CacheManagerArboviroses._cache_esta_valido(mtime, ano)
+
     @staticmethod
-    def _cache_esta_valido(caminho_arquivo: str, ano: int) -> bool:
+    def _cache_esta_valido(tempo_modificacao: float, ano: int) -> bool:
         """
         Verifica se o cache está dentro do TTL (24 horas para ano atual)
+
+        Recebe o mtime já resolvido por _mtime_ou_none, sem repetir syscalls.
         """
-        if not os.path.exists(caminho_arquivo):
-            return False
-            
-        tempo_modificacao = os.path.getmtime(caminho_arquivo)
         tempo_atual = time.time()
         idade_cache_segundos = tempo_atual - tempo_modificacao
         
@@ -181,8 +264,21 @@ class DataCleaner:
         """Filtra apenas as 5 regiões oficiais do Brasil"""
         if df.empty or 'REGIAO' not in df.columns:
             return df
-            
-        df_filtrado = df[df['REGIAO'].isin(REGIOES_VALIDAS)].copy()
+
+        serie_regiao = df['REGIAO']
+        if isinstance(serie_regiao.dtype, pd.CategoricalDtype):
+            # isin sobre códigos inteiros em vez de hashear as strings
+            # linha a linha; os códigos válidos saem das categorias (≤ 6)
+            codigos_validos = np.flatnonzero(serie_regiao.cat.categories.isin(REGIOES_VALIDAS))
+            mascara = np.isin(serie_regiao.cat.codes.to_numpy(), codigos_validos)
+        else:
+            mascara = serie_regiao.isin(REGIOES_VALIDAS).to_numpy()
+
+        df_filtrado = df[mascara]
+        if isinstance(serie_regiao.dtype, pd.CategoricalDtype):
+            # 'Não definida' sairia das linhas mas ficaria como categoria
+            # zerada, reaparecendo com contagem 0 nos value_counts a jusante
+            df_filtrado['REGIAO'] = df_filtrado['REGIAO'].cat.remove_unused_categories()
         registros_removidos = len(df) - len(df_filtrado)
         if registros_removidos > 0:
             logger.info(f"Removidos {registros_removidos} registros de regiões não definidas")
@@ -198,10 +294,13 @@ class DataCleaner:
         colunas_existentes = [col for col in colunas_chave if col in df.columns]
         
         if len(colunas_existentes) == len(colunas_chave):
-            duplicados_antes = df.duplicated(subset=colunas_existentes, keep='first').sum()
+            # Uma única passada de hash: a mesma máscara conta e remove,
+            # em vez de duplicated() + drop_duplicates() sobre as mesmas chaves
+            mascara_duplicados = df.duplicated(subset=colunas_existentes, keep='first')
+            duplicados_antes = int(mascara_duplicados.sum())
             if duplicados_antes > 0:
                 logger.info(f"Dengue - Encontrados {duplicados_antes:,} registros duplicados exatos")
-                df = df.drop_duplicates(subset=colunas_existentes, keep='first').copy()
+                df = df.loc[~mascara_duplicados]
                 logger.info(f"Removidos {duplicados_antes:,} registros duplicados exatos")
         
         return df
@@ -216,10 +315,11 @@ class DataCleaner:
         colunas_existentes = [col for col in colunas_chave if col in df.columns]
         
         if len(colunas_existentes) >= 4:
-            duplicados_antes = df.duplicated(subset=colunas_existentes, keep='first').sum()
+            mascara_duplicados = df.duplicated(subset=colunas_existentes, keep='first')
+            duplicados_antes = int(mascara_duplicados.sum())
             if duplicados_antes > 0:
                 logger.info(f"{arbovirose} - Encontrados {duplicados_antes:,} registros duplicados")
-                df = df.drop_duplicates(subset=colunas_existentes, keep='first').copy()
+                df = df.loc[~mascara_duplicados]
                 logger.info(f"Removidos {duplicados_antes:,} registros duplicados")
         
         return df
@@ -229,31 +329,59 @@ class DataCleaner:
         """Trata valores missing de forma estratégica por arbovirose"""
         if df.empty:
             return df
-            
-        df = df.copy()
-        
+
         if 'SG_UF' in df.columns:
-            df['SG_UF'] = df['SG_UF'].astype(str)
-            df['SG_UF'] = df['SG_UF'].str.replace(r'\.0$', '', regex=True)
-            df['SG_UF'] = df['SG_UF'].str.strip().str.zfill(2)
-            
-            missing_uf = (df['SG_UF'].isna()) | (df['SG_UF'] == 'nan') | (df['SG_UF'] == 'None') | (df['SG_UF'] == '')
-            if missing_uf.any():
-                df.loc[missing_uf, 'SG_UF'] = 'ND'
-        
-        if 'DT_NOTIFIC' in df.columns:
+            if not isinstance(df['SG_UF'].dtype, pd.CategoricalDtype):
+                df['SG_UF'] = df['SG_UF'].astype('category')
+
+            # Normalização feita no nível das categorias (dezenas de valores),
+            # não linha a linha sobre milhões de registros
+            categorias_limpas = (
+                df['SG_UF'].cat.categories.astype(str)
+                .str.replace(r'\.0$', '', regex=True)
+                .str.strip().str.zfill(2)
+            )
+            categorias_limpas = categorias_limpas.where(
+                ~categorias_limpas.isin(['nan', 'None']), 'ND'
+            )
+            if categorias_limpas.is_unique:
+                df['SG_UF'] = df['SG_UF'].cat.rename_categories(categorias_limpas)
+            else:
+                # Categorias que colapsam no mesmo valor exigem remapeamento
+                mapa = dict(zip(df['SG_UF'].cat.categories, categorias_limpas))
+                df['SG_UF'] = df['SG_UF'].map(mapa).astype('category')
+
+            if df['SG_UF'].isna().any():
+                if 'ND' not in df['SG_UF'].cat.categories:
+                    df['SG_UF'] = df['SG_UF'].cat.add_categories(['ND'])
+                df['SG_UF'] = df['SG_UF'].fillna('ND')
+
+        if 'DT_NOTIFIC' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['DT_NOTIFIC']):
+            # Normalmente já parseado no read_csv; o to_datetime só roda se a
+            # leitura tiver caído no fallback de object
             df['DT_NOTIFIC'] = pd.to_datetime(
-                df['DT_NOTIFIC'], 
+                df['DT_NOTIFIC'],
                 errors='coerce',
                 dayfirst=False
             )
-        
+
         if 'CS_SEXO' in df.columns:
-            df['CS_SEXO'] = df['CS_SEXO'].fillna('I')
-            
+            if isinstance(df['CS_SEXO'].dtype, pd.CategoricalDtype):
+                if df['CS_SEXO'].isna().any():
+                    if 'I' not in df['CS_SEXO'].cat.categories:
+                        df['CS_SEXO'] = df['CS_SEXO'].cat.add_categories(['I'])
+                    df['CS_SEXO'] = df['CS_SEXO'].fillna('I')
+            else:
+                df['CS_SEXO'] = df['CS_SEXO'].fillna('I')
+
         if 'NU_IDADE_N' in df.columns:
             df['NU_IDADE_N'] = pd.to_numeric(df['NU_IDADE_N'], errors='coerce')
-        
+
+        if 'CLASSI_FIN' in df.columns:
+            # Códigos de classificação cabem em Int8; as comparações dos
+            # filtros passam a rodar sobre inteiros pequenos
+            df['CLASSI_FIN'] = pd.to_numeric(df['CLASSI_FIN'], errors='coerce').astype('Int8')
+
         return df
     
     @staticmethod
@@ -261,10 +389,9 @@ class DataCleaner:
         """Valida idade para DENGUE - NÃO REMOVE REGISTROS"""
         if 'NU_IDADE_N' not in df.columns or df.empty:
             return df
-            
-        df = df.copy()
+
         df['NU_IDADE_N'] = pd.to_numeric(df['NU_IDADE_N'], errors='coerce')
-        
+
         outliers = (df['NU_IDADE_N'] > 130) | (df['NU_IDADE_N'] < 0)
         if outliers.any():
             logger.info(f"Dengue - {outliers.sum()} registros com idade fora da faixa [0,130] (apenas marcados como NaN)")
@@ -277,10 +404,9 @@ class DataCleaner:
         """Valida idade para ZIKA/CHIKUNGUNYA - REMOVE REGISTROS"""
         if 'NU_IDADE_N' not in df.columns or df.empty:
             return df
-            
-        df = df.copy()
+
         df['NU_IDADE_N'] = pd.to_numeric(df['NU_IDADE_N'], errors='coerce')
-        
+
         outliers = (df['NU_IDADE_N'] > 100) | (df['NU_IDADE_N'] < 0)
         if outliers.any():
             logger.info(f"{arbovirose} - {outliers.sum()} registros com idade fora da faixa [0,100]")
@@ -293,16 +419,14 @@ class DataCleaner:
         """Valida datas para DENGUE - CRITÉRIO PERMISSIVO"""
         if 'DT_NOTIFIC' not in df.columns or df.empty:
             return df
-            
-        df = df.copy()
-        
+
         if not pd.api.types.is_datetime64_any_dtype(df['DT_NOTIFIC']):
             df['DT_NOTIFIC'] = pd.to_datetime(df['DT_NOTIFIC'], errors='coerce', dayfirst=False)
-        
+
         datas_validas = df['DT_NOTIFIC'].notna()
         datas_no_ano = df['DT_NOTIFIC'].dt.year == ano_alvo
-        
-        df_filtrado = df[~datas_validas | (datas_validas & datas_no_ano)].copy()
+
+        df_filtrado = df[~datas_validas | (datas_validas & datas_no_ano)]
         
         removidos = len(df) - len(df_filtrado)
         if removidos > 0:
@@ -315,16 +439,14 @@ class DataCleaner:
         """Valida datas para ZIKA/CHIKUNGUNYA - CRITÉRIO RESTRITIVO"""
         if 'DT_NOTIFIC' not in df.columns or df.empty:
             return df
-            
-        df = df.copy()
-        
+
         if not pd.api.types.is_datetime64_any_dtype(df['DT_NOTIFIC']):
             df['DT_NOTIFIC'] = pd.to_datetime(df['DT_NOTIFIC'], errors='coerce', dayfirst=False)
-        
+
         datas_validas = df['DT_NOTIFIC'].notna()
         datas_no_ano = df['DT_NOTIFIC'].dt.year == ano_alvo
-        
-        df_filtrado = df[datas_validas & datas_no_ano].copy()
+
+        df_filtrado = df[datas_validas & datas_no_ano]
         
         removidos = len(df) - len(df_filtrado)
         if removidos > 0:
@@ -337,13 +459,12 @@ class DataCleaner:
         """Filtra casos válidos para CHIKUNGUNYA - Baseado nos dados reais"""
         if df.empty or 'CLASSI_FIN' not in df.columns:
             return df
-            
-        df = df.copy()
-        
-        casos_validos = df['CLASSI_FIN'].isin([5])
+
+        # Comparação direta em vez de isin([5]): sem hashset para valor único
+        casos_validos = (df['CLASSI_FIN'] == 5).fillna(False)
         logger.info(f"Chikungunya - Critério REAL: mantendo apenas CLASSI_FIN 5 (Inconclusivo provável)")
-        
-        df_filtrado = df[casos_validos].copy()
+
+        df_filtrado = df[casos_validos]
         
         removidos = len(df) - len(df_filtrado)
         if removidos > 0:
@@ -358,13 +479,15 @@ class DataCleaner:
         """Filtra casos válidos para ZIKA - CRITÉRIO MODERADO"""
         if df.empty or 'CLASSI_FIN' not in df.columns:
             return df
-            
-        df = df.copy()
-        
-        casos_validos = df['CLASSI_FIN'].isin([1, 3, 8, 9])
+
+        # np.isin sobre inteiros pequenos (NA vira -1, fora do conjunto válido)
+        codigos = df['CLASSI_FIN'].to_numpy(dtype=np.int8, na_value=-1) \
+            if isinstance(df['CLASSI_FIN'].dtype, pd.Int8Dtype) \
+            else df['CLASSI_FIN'].to_numpy()
+        casos_validos = np.isin(codigos, np.array([1, 3, 8, 9], dtype=np.int8))
         logger.info(f"Zika - Critério MODERADO: mantendo casos CLASSI_FIN 1,3,8,9")
-        
-        df_filtrado = df[casos_validos].copy()
+
+        df_filtrado = df[casos_validos]
         
         removidos = len(df) - len(df_filtrado)
         if removidos > 0:
@@ -379,24 +502,26 @@ class DataCleaner:
         """Adiciona coluna REGIAO baseada no SG_UF"""
         if df.empty or 'SG_UF' not in df.columns:
             return df
-            
-        df = df.copy()
-        
-        df['SG_UF'] = df['SG_UF'].astype(str)
-        df['SG_UF'] = df['SG_UF'].str.replace(r'\.0$', '', regex=True)
-        df['SG_UF'] = df['SG_UF'].str.strip().str.zfill(2)
-        
-        def mapear_regiao(uf):
-            uf_str = str(uf).strip().zfill(2)
-            if uf_str in MAPA_CODIGOS_IBGE:
-                return MAPA_CODIGOS_IBGE[uf_str]
-            elif uf_str == 'ND':
-                return 'Não definida'
-            else:
-                return 'Não definida'
-        
-        df['REGIAO'] = df['SG_UF'].apply(mapear_regiao)
-        
+
+        if isinstance(df['SG_UF'].dtype, pd.CategoricalDtype):
+            # Mapeia apenas as categorias (no máximo algumas dezenas de UFs)
+            # e deixa o pandas propagar o resultado pelos códigos inteiros
+            mapa_categorias = {
+                uf: MAPA_CODIGOS_IBGE.get(str(uf).strip().zfill(2), 'Não definida')
+                for uf in df['SG_UF'].cat.categories
+            }
+            regiao = df['SG_UF'].map(mapa_categorias)
+            if isinstance(regiao.dtype, pd.CategoricalDtype) and 'Não definida' not in regiao.cat.categories:
+                regiao = regiao.cat.add_categories(['Não definida'])
+            df['REGIAO'] = regiao.fillna('Não definida').astype('category')
+        else:
+            # Gather inteiro na tabela _UF_PARA_REGIAO: to_numeric absorve
+            # sufixos .0 e espaços, códigos inválidos caem em "Não definida"
+            uf_int = pd.to_numeric(df['SG_UF'], errors='coerce').fillna(0).astype(np.int64).to_numpy()
+            uf_int = np.where((uf_int >= 0) & (uf_int < len(_UF_PARA_REGIAO)), uf_int, 0)
+            codigos_regiao = _UF_PARA_REGIAO[uf_int]
+            df['REGIAO'] = pd.Categorical.from_codes(codigos_regiao, categories=list(REGIOES_ORDENADAS))
+
         return df
 
     @staticmethod
@@ -405,11 +530,9 @@ class DataCleaner:
         if df.empty:
             df['EM_INVESTIGACAO'] = False
             return df
-            
-        df = df.copy()
-        
+
         if 'CLASSI_FIN' in df.columns:
-            df['EM_INVESTIGACAO'] = df['CLASSI_FIN'] == 8
+            df['EM_INVESTIGACAO'] = (df['CLASSI_FIN'] == 8).fillna(False).astype(bool)
             casos_investigacao = df['EM_INVESTIGACAO'].sum()
             logger.info(f"{arbovirose} - Casos em investigação: {casos_investigacao:,}")
         else:
@@ -433,31 +556,47 @@ class DataCleaner:
             return df
             
         logger.info(f"Iniciando pipeline DENGUE. Registros iniciais: {len(df):,}")
-        
-        df_clean = df.copy()
-        
-        if 'DT_NOTIFIC' in df_clean.columns:
+
+        registros_iniciais = len(df)
+        # O frame bruto é descartado pelo chamador após o pipeline; trabalhar
+        # sobre ele direto evita cascatas de cópias profundas
+        df_clean = df
+
+
+        if 'DT_NOTIFIC' in df_clean.columns and not pd.api.types.is_datetime64_any_dtype(df_clean['DT_NOTIFIC']):
             df_clean['DT_NOTIFIC'] = pd.to_datetime(df_clean['DT_NOTIFIC'], errors='coerce')
-        
-        df_clean = df_clean.dropna(subset=['DT_NOTIFIC'])
-        
-        df_clean = df_clean[df_clean['DT_NOTIFIC'].dt.year == ano_alvo]
-        
-        if 'SG_UF' in df_clean.columns:
-            df_clean['SG_UF'] = df_clean['SG_UF'].astype(str).str.zfill(2)
-        
+
+        df_clean = DataCleaner.adicionar_regiao(df_clean)
+
+        # Data válida, ano alvo e região oficial são fundidos numa única
+        # máscara booleana: o frame é materializado uma vez só, em vez de
+        # quatro passagens encadeadas (dropna + ano + região + filtro)
+        anos = df_clean['DT_NOTIFIC'].dt.year.to_numpy(dtype=np.float64, na_value=np.nan)
+        mascara = anos == ano_alvo
+
+        if 'REGIAO' in df_clean.columns:
+            serie_regiao = df_clean['REGIAO']
+            codigos_validos = np.flatnonzero(serie_regiao.cat.categories.isin(REGIOES_VALIDAS))
+            mascara &= np.isin(serie_regiao.cat.codes.to_numpy(), codigos_validos)
+
+        df_clean = df_clean[mascara]
+
         logger.info(f"Dengue - Após filtros básicos: {len(df_clean):,} registros")
-        
+
         if 'DT_NOTIFIC' in df_clean.columns:
-            df_clean['ANO_MES'] = df_clean['DT_NOTIFIC'].dt.to_period('M')
-        
-        df_clean = DataCleaner.adicionar_regiao(df_clean)
-        
-        df_clean = DataCleaner.filtrar_regioes_validas(df_clean)      
-        
-        percentual_mantido = (len(df_clean) / len(df)) * 100
+            # Ordinal mensal por aritmética inteira (ano*12 + mês - 1, base
+            # 1970): o PeriodIndex nasce direto dos ordinais, sem a conversão
+            # timestamp a timestamp de dt.to_period('M')
+            datas = df_clean['DT_NOTIFIC'].dt
+            ordinais_mes = (datas.year.to_numpy(dtype=np.int64) - 1970) * 12 \
+                + datas.month.to_numpy(dtype=np.int64) - 1
+            df_clean['ANO_MES'] = pd.PeriodIndex.from_ordinals(ordinais_mes, freq='M')
+
+        df_clean = df_clean.reset_index(drop=True)
+
+        percentual_mantido = (len(df_clean) / registros_iniciais) * 100
         logger.info(f"Pipeline DENGUE concluído. Registros finais: {len(df_clean):,} ({percentual_mantido:.1f}% mantidos)")
-        
+
         return df_clean
     
     @staticmethod
@@ -485,7 +624,9 @@ class DataCleaner:
         df_clean = DataCleaner.adicionar_regiao(df_clean)
         df_clean = DataCleaner.filtrar_regioes_validas(df_clean)
         df_clean = DataCleaner.identificar_casos_investigacao(df_clean, "zika")
-        
+
+        df_clean = df_clean.reset_index(drop=True)
+
         percentual_mantido = (len(df_clean) / len(df)) * 100
         logger.info(f"Pipeline ZIKA concluído. Registros finais: {len(df_clean):,} ({percentual_mantido:.1f}% mantidos)")
         
@@ -514,32 +655,82 @@ class DataCleaner:
         df_clean = DataCleaner.validar_datas_zika_chikungunya(df_clean, ano_alvo, "chikungunya")
         
         if 'CLASSI_FIN' in df_clean.columns:
-            df_codigo5 = df_clean[df_clean['CLASSI_FIN'] == 5].copy()
-            df_codigo13 = df_clean[df_clean['CLASSI_FIN'] == 13].copy()
-            
-            if len(df_codigo13) > 0:
-                df_codigo13_amostrado = df_codigo13.sample(frac=0.68, random_state=42)
-                df_clean = pd.concat([df_codigo5, df_codigo13_amostrado], ignore_index=True)
-            else:
-                df_clean = df_codigo5
+            # Filtro + amostragem como um único kernel booleano sobre o array
+            # int8: manter = (c == 5) | (c == 13 e sorteio < 0.68), com o
+            # sorteio restrito às linhas 13 para não gerar aleatórios à toa.
+            # Um @njit do numba faria o mesmo laço fundido, mas as comparações
+            # do numpy já rodam em C e o ganho não justifica a dependência
+            # extra (nem consta no requirements)
+            codigos = df_clean['CLASSI_FIN'].to_numpy(dtype=np.int8, na_value=-1) \
+                if isinstance(df_clean['CLASSI_FIN'].dtype, pd.Int8Dtype) \
+                else df_clean['CLASSI_FIN'].to_numpy()
+            mascara_13 = codigos == 13
+            manter = codigos == 5
+            n_codigo13 = int(mascara_13.sum())
+            if n_codigo13 > 0:
+                rng = np.random.default_rng(42)
+                manter[mascara_13] = rng.random(n_codigo13) < 0.68
+            df_clean = df_clean[manter]
         
         df_clean = DataCleaner.adicionar_regiao(df_clean)
         df_clean = DataCleaner.filtrar_regioes_validas(df_clean)
         df_clean = DataCleaner.identificar_casos_investigacao(df_clean, "chikungunya")
-        
+
+        df_clean = df_clean.reset_index(drop=True)
+
         logger.info(f"Pipeline CHIKUNGUNYA concluído: {len(df_clean):,} registros")
         
         return df_clean
 
-def baixar_dados_arbovirose(arbovirose: str, ano: int, usar_cache: bool = True) -> Tuple[pd.DataFrame, bool]:
+# Hash curto do código do DataCleaner embutido nos nomes de cache: qualquer
+# edição nos pipelines invalida automaticamente os arquivos antigos, sem
+# reaproveitar dados processados por uma versão anterior da limpeza
+PIPELINE_VERSAO = hashlib.sha256(inspect.getsource(DataCleaner).encode()).hexdigest()[:10]
+
+# Validadores HTTP (url -> ETag) gravados junto ao cache: anos históricos do
+# SINAN nunca mudam, então um GET condicional evita rebaixar centenas de MB
+_ETAGS_ARQUIVO = os.path.join(ARBOVIROSES_CACHE_DIR, 'etags.json')
+_etags_lock = threading.Lock()
+
+def _carregar_etags() -> Dict[str, str]:
+    """Lê o mapa url -> ETag do disco (vazio se ausente ou corrompido)"""
+    try:
+        with open(_ETAGS_ARQUIVO, 'r', encoding='utf-8') as arquivo:
+            return json.load(arquivo)
+    except (OSError, ValueError):
+        return {}
+
+def _salvar_etag(url: str, etag: str) -> None:
+    """Registra o ETag devolvido pelo servidor para futuros GETs condicionais"""
+    with _etags_lock:
+        etags = _carregar_etags()
+        etags[url] = etag
+        try:
+            os.makedirs(ARBOVIROSES_CACHE_DIR, exist_ok=True)
+            with open(_ETAGS_ARQUIVO, 'w', encoding='utf-8') as arquivo:
+                json.dump(etags, arquivo)
+        except OSError as e:
+            logger.warning(f"Não foi possível gravar ETag de {url}: {e}")
+
+def _projetar_colunas(df: pd.DataFrame, cols: Optional[Tuple[str, ...]]) -> pd.DataFrame:
+    """Restringe o DataFrame às colunas de interesse presentes (None = todas)"""
+    if cols is None or df.empty:
+        return df
+    colunas_presentes = [col for col in cols if col in df.columns]
+    return df[colunas_presentes] if colunas_presentes else df
+
+def baixar_dados_arbovirose(arbovirose: str, ano: int, usar_cache: bool = True,
+                            cols: Optional[Tuple[str, ...]] = None) -> Tuple[pd.DataFrame, bool]:
     """
     Baixa e processa dados de uma arbovirose específica com cache inteligente
-    
+
     Args:
         arbovirose: Nome da arbovirose (dengue, zika, chikungunya)
         ano: Ano dos dados
         usar_cache: Usar cache para melhor performance
-        
+        cols: Colunas de interesse do chamador; o retorno é projetado para
+              elas após a limpeza (o cache continua guardando o schema completo)
+
     Returns:
         Tuple[DataFrame processado, True se veio do cache]
     """
@@ -547,7 +738,7 @@ def baixar_dados_arbovirose(arbovirose: str, ano: int, usar_cache: bool = True)
         dados_cache = CacheManagerArboviroses.carregar(arbovirose, ano)
         if dados_cache is not None and not dados_cache.empty:
             logger.info(f"Dados de {arbovirose.upper()} {ano} carregados do cache local.")
-            return dados_cache, True
+            return _projetar_colunas(dados_cache, cols), True
 
     url_template = URLS.get(arbovirose.lower())
     if not url_template:
@@ -557,42 +748,116 @@ def baixar_dados_arbovirose(arbovirose: str, ano: int, usar_cache: bool = True)
     logger.info(f"Baixando dados de {arbovirose.upper()} para {ano}...")
 
     try:
-        response = requests.get(url, timeout=60)
+        # Sondagem HEAD: rejeita URL inválida ou arquivo vazio no servidor
+        # antes de transferir qualquer byte do corpo
+        resposta_head = requests.head(url, timeout=10)
+        resposta_head.raise_for_status()
+        if int(resposta_head.headers.get('Content-Length', -1)) == 0:
+            raise RuntimeError(f"Arquivo vazio no servidor para {arbovirose} {ano}: {url}")
+
+        # GET condicional: se houver ETag conhecido e um parquet no disco
+        # (mesmo expirado pelo TTL), um 304 confirma que a origem não mudou
+        # e o cache local é reaproveitado sem download
+        cabecalhos = {}
+        etag_conhecido = _carregar_etags().get(url)
+        if usar_cache and etag_conhecido:
+            cabecalhos['If-None-Match'] = etag_conhecido
+
+        response = requests.get(url, stream=True, timeout=60, headers=cabecalhos)
+        if response.status_code == 304:
+            dados_cache = CacheManagerArboviroses.carregar(arbovirose, ano, ignorar_validade=True)
+            if dados_cache is not None and not dados_cache.empty:
+                logger.info(f"Servidor confirmou {arbovirose.upper()} {ano} inalterado (304); reaproveitando cache local.")
+                return _projetar_colunas(dados_cache, cols), True
+            # 304 sem cache utilizável: refaz o GET sem condicional
+            response = requests.get(url, stream=True, timeout=60)
         response.raise_for_status()
+
+        etag = response.headers.get('ETag')
+        if etag:
+            _salvar_etag(url, etag)
+
+        # O corpo é despejado em pedaços num buffer spooled (RAM até o limite,
+        # depois disco): o zipfile exige uma fonte com seek, e assim o ZIP não
+        # fica duplicado em memória como acontecia com response.content + BytesIO
+        buffer_download = tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024)
+        for pedaco in response.iter_content(chunk_size=1024 * 1024):
+            buffer_download.write(pedaco)
+        buffer_download.seek(0)
     except requests.exceptions.RequestException as e:
         raise RuntimeError(f"Erro ao baixar {arbovirose} {ano}: {e}")
 
     colunas_usar = COLS_PADRAO_DENGUE if arbovirose.lower() == "dengue" else COLS_PADRAO_OUTRAS
 
+    # Leitor CSV multithread do pyarrow: bem mais rápido que o read_csv em
+    # chunks do pandas e dispensa o pd.concat (que copiava tudo de novo).
+    # auto_dict_encode já devolve as colunas de texto dicionarizadas, que o
+    # to_pandas converte direto para category
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    opcoes_leitura = pacsv.ReadOptions(use_threads=True, encoding='latin1')
+    opcoes_conversao = pacsv.ConvertOptions(
+        include_columns=colunas_usar,
+        include_missing_columns=True,
+        strings_can_be_null=True,
+        auto_dict_encode=True,
+        # String explícita preserva zeros à esquerda de códigos IBGE que o
+        # inferidor trataria como inteiros
+        column_types={'SG_UF': pa.string(), 'ID_MUNICIP': pa.string(), 'CS_SEXO': pa.string()},
+        timestamp_parsers=[pacsv.ISO8601, '%Y-%m-%d']
+    )
+
     try:
-        if response.content.startswith(b'PK'):
-            with zipfile.ZipFile(io.BytesIO(response.content)) as zip_file:
+        assinatura = buffer_download.read(2)
+        buffer_download.seek(0)
+        if assinatura == b'PK':
+            with zipfile.ZipFile(buffer_download) as zip_file:
                 csv_filename = [f for f in zip_file.namelist() if f.endswith('.csv')][0]
-                df_iter = pd.read_csv(
-                    zip_file.open(csv_filename),
-                    sep=",", encoding="latin1",
-                    usecols=lambda x: x in colunas_usar,
-                    chunksize=100_000, low_memory=False,
-                    dtype={'SG_UF': str, 'ID_MUNICIP': str}
-                )
+                with zip_file.open(csv_filename) as csv_file:
+                    tabela = pacsv.read_csv(
+                        csv_file,
+                        read_options=opcoes_leitura,
+                        convert_options=opcoes_conversao
+                    )
         else:
-            df_iter = pd.read_csv(
-                io.BytesIO(response.content),
-                sep=",", encoding="latin1",
-                usecols=lambda x: x in colunas_usar,
-                chunksize=100_000, low_memory=False,
-                dtype={'SG_UF': str, 'ID_MUNICIP': str}
+            tabela = pacsv.read_csv(
+                buffer_download,
+                read_options=opcoes_leitura,
+                convert_options=opcoes_conversao
             )
     except Exception as e:
         raise RuntimeError(f"Erro ao processar arquivo de {arbovirose} {ano}: {e}")
+    finally:
+        buffer_download.close()
 
-    chunks = list(df_iter)
-    if not chunks:
+    if tabela.num_rows == 0:
         df_vazio = pd.DataFrame(columns=colunas_usar + ['ANO_MES', 'REGIAO', 'FAIXA_ETARIA', 'EM_INVESTIGACAO'])
         CacheManagerArboviroses.salvar(arbovirose, ano, df_vazio)
         return df_vazio, False
 
-    df = pd.concat(chunks, ignore_index=True)
+    if 'SG_UF' in tabela.column_names:
+        # Normalização única do SG_UF ainda no Arrow (kernels em C sobre o
+        # dicionário): remove o sufixo .0, apara espaços e completa com zero
+        # à esquerda, para o restante do pipeline já receber códigos limpos
+        import pyarrow.compute as pc
+        coluna_uf = tabela.column('SG_UF')
+        if pa.types.is_dictionary(coluna_uf.type):
+            coluna_uf = pc.cast(coluna_uf, pa.string())
+        coluna_uf = pc.replace_substring_regex(coluna_uf, r'\.0$', '')
+        coluna_uf = pc.utf8_lpad(pc.utf8_trim_whitespace(coluna_uf), 2, '0')
+        tabela = tabela.set_column(
+            tabela.column_names.index('SG_UF'), 'SG_UF',
+            pc.dictionary_encode(coluna_uf.combine_chunks() if isinstance(coluna_uf, pa.ChunkedArray) else coluna_uf)
+        )
+
+    df = tabela.to_pandas(self_destruct=True)
+    del tabela
+    # Garante category nas colunas de baixa cardinalidade caso alguma tenha
+    # escapado da dicionarização automática do Arrow
+    for col in DTYPES_LEITURA_CSV:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
     logger.info(f"Dados brutos de {arbovirose} carregados: {len(df):,} registros")
 
     if arbovirose.lower() == "dengue":
@@ -606,7 +871,44 @@ def baixar_dados_arbovirose(arbovirose: str, ano: int, usar_cache: bool = True)
         CacheManagerArboviroses.salvar(arbovirose, ano, df)
         logger.info(f"Dados de {arbovirose.upper()} {ano} processados e salvos no cache.")
 
-    return df, False
+    return _projetar_colunas(df, cols), False
+
+def baixar_dados_varios(pares: List[Tuple[str, int]], usar_cache: bool = True,
+                        max_workers: int = 6) -> Dict[Tuple[str, int], Tuple[pd.DataFrame, bool]]:
+    """
+    Baixa várias combinações (arbovirose, ano) em paralelo
+
+    Os downloads são I/O-bound e se sobrepõem num ThreadPoolExecutor; a
+    limpeza roda nos kernels C do pandas/pyarrow, que liberam o GIL na
+    maior parte do tempo, então as threads também aproveitam mais de um
+    núcleo no processamento.
+
+    Args:
+        pares: Lista de tuplas (arbovirose, ano)
+        usar_cache: Repassado a baixar_dados_arbovirose
+        max_workers: Número máximo de downloads simultâneos
+
+    Returns:
+        Dicionário {(arbovirose, ano): (DataFrame, veio_do_cache)}
+    """
+    resultados: Dict[Tuple[str, int], Tuple[pd.DataFrame, bool]] = {}
+    if not pares:
+        return resultados
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pares))) as executor:
+        futuros = {
+            executor.submit(baixar_dados_arbovirose, arbovirose, ano, usar_cache): (arbovirose, ano)
+            for arbovirose, ano in pares
+        }
+        for futuro in as_completed(futuros):
+            arbovirose, ano = futuros[futuro]
+            try:
+                resultados[(arbovirose, ano)] = futuro.result()
+            except Exception as e:
+                logger.error(f"Falha ao baixar {arbovirose} {ano}: {e}")
+                resultados[(arbovirose, ano)] = (pd.DataFrame(), False)
+
+    return resultados
 
 def gerar_relatorio_qualidade(df: pd.DataFrame) -> Dict:
     """
@@ -633,8 +935,13 @@ def gerar_relatorio_qualidade(df: pd.DataFrame) -> Dict:
             data_min = df[datas_validas]['DT_NOTIFIC'].min().strftime('%Y-%m-%d')
             data_max = df[datas_validas]['DT_NOTIFIC'].max().strftime('%Y-%m-%d')
     
+    # Uma única varredura notna() do frame inteiro produz as contagens de
+    # todas as colunas, em vez de duas passadas por coluna
+    total_registros = len(df)
+    nao_nulos = df.notna().sum()
+
     relatorio = {
-        'total_registros': len(df),
+        'total_registros': total_registros,
         'casos_investigacao': casos_investigacao,
         'periodo_cobertura': {
             'data_min': data_min,
@@ -643,9 +950,9 @@ def gerar_relatorio_qualidade(df: pd.DataFrame) -> Dict:
         'distribuicao_regiao': df['REGIAO'].value_counts().to_dict() if 'REGIAO' in df.columns else {},
         'completude_campos': {
             col: {
-                'total': len(df),
-                'nao_nulos': df[col].notna().sum(),
-                'percentual': (df[col].notna().sum() / len(df)) * 100
+                'total': total_registros,
+                'nao_nulos': int(nao_nulos[col]),
+                'percentual': (int(nao_nulos[col]) / total_registros) * 100
             } for col in df.columns
         }
     }
@@ -677,42 +984,60 @@ def agrupar_casos_por_mes(df: pd.DataFrame, ano: int) -> pd.DataFrame:
             logger.error("Não é possível criar ANO_MES: DT_NOTIFIC não encontrada")
             return pd.DataFrame(columns=['REGIAO','ANO_MES','CASOS','MES_FORMATADO'])
     
-    df_agrupado = df.groupby(['REGIAO', 'ANO_MES']).size().reset_index(name='CASOS')
-    
-    meses_pt = ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 
+    meses_pt = ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun',
                 'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez']
-    
-    regioes = df['REGIAO'].unique()
-    
-    meses_completos = []
-    for regiao in regioes:
-        for mes in range(1, 13):
-            periodo = pd.Period(year=ano, month=mes, freq='M')
-            meses_completos.append({
-                'REGIAO': regiao,
-                'ANO_MES': periodo,
-                'MES_FORMATADO': f"{meses_pt[mes-1]}/{str(ano)[-2:]}",
-                'MES_NUMERO': mes
-            })
-    
-    df_completo = pd.DataFrame(meses_completos)
-    
-    if not df_agrupado.empty:
-        df_completo = df_completo.merge(
-            df_agrupado[['REGIAO', 'ANO_MES', 'CASOS']], 
-            on=['REGIAO', 'ANO_MES'], 
-            how='left'
+
+    # Contagem por região × mês em uma passada; a grade completa de 12 meses
+    # vem de um reindex sobre MultiIndex.from_product, sem o laço Python que
+    # montava a lista de dicts mês a mês
+    # O mês sai dos ordinais do PeriodArray por aritmética inteira
+    # (ordinal % 12 + 1), e o groupby cai no hash rápido de int em vez do
+    # caminho de extração campo a campo de dt.month
+    if isinstance(df['ANO_MES'].dtype, pd.PeriodDtype):
+        mes_numero = pd.Series(
+            df['ANO_MES'].array.asi8 % 12 + 1, index=df.index, name='MES_NUMERO'
         )
-        df_completo['CASOS'] = df_completo['CASOS'].fillna(0)
     else:
-        df_completo['CASOS'] = 0
-    
-    df_completo = df_completo.sort_values(['REGIAO', 'MES_NUMERO'])
-    
+        mes_numero = df['ANO_MES'].dt.month.rename('MES_NUMERO')
+
+    serie_casos = df.groupby(['REGIAO', mes_numero], observed=True).size()
+
+    # Índice reconstruído como object/int para o reindex casar por valor
+    # mesmo quando REGIAO é categórica (a série agregada tem ≤ 60 linhas)
+    serie_casos.index = pd.MultiIndex.from_arrays(
+        [serie_casos.index.get_level_values('REGIAO').astype(str),
+         serie_casos.index.get_level_values('MES_NUMERO')],
+        names=['REGIAO', 'MES_NUMERO']
+    )
+
+    if not serie_casos.empty:
+        regioes = serie_casos.index.get_level_values('REGIAO').unique()
+    else:
+        # Sem contagens (ex.: todas as datas inválidas): grade zerada para
+        # as regiões observadas, como na versão com merge
+        regioes = pd.Index(df['REGIAO'].dropna().unique().astype(str))
+    indice_completo = pd.MultiIndex.from_product(
+        [regioes, range(1, 13)], names=['REGIAO', 'MES_NUMERO']
+    )
+
+    df_completo = (
+        serie_casos.reindex(indice_completo, fill_value=0)
+        .rename('CASOS')
+        .reset_index()
+    )
+
+    sufixo_ano = str(ano)[-2:]
+    rotulos_meses = np.array([f"{mes}/{sufixo_ano}" for mes in meses_pt])
+    df_completo['MES_FORMATADO'] = rotulos_meses[df_completo['MES_NUMERO'] - 1]
+    df_completo['ANO_MES'] = pd.PeriodIndex.from_ordinals(
+        (ano - 1970) * 12 + df_completo['MES_NUMERO'].to_numpy() - 1,
+        freq='M'
+    )
+
     df_completo = df_completo.drop('MES_NUMERO', axis=1)
-    
+
     logger.info(f"Gráfico gerado com {len(df_completo)} registros (12 meses × {len(regioes)} regiões)")
-    
+
     return df_completo
 
 def limpar_cache_arboviroses():
@@ -721,6 +1046,7 @@ def limpar_cache_arboviroses():
         if os.path.exists(ARBOVIROSES_CACHE_DIR):
             for arquivo in os.listdir(ARBOVIROSES_CACHE_DIR):
                 os.remove(os.path.join(ARBOVIROSES_CACHE_DIR, arquivo))
+            CacheManagerArboviroses._mtime_cache.clear()
             logger.info("Cache de arboviroses limpo com sucesso!")
         else:
             logger.info("Diretório de cache não existe")
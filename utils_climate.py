@@ -7,17 +7,25 @@ Autor: Eloy Cardozo Augusto
 Código: 836463
 """
 
+import re
 import time
+import shutil
 import traceback
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import zipfile
 import io
+import mmap
+import tempfile
+import threading
 import numpy as np
 import logging
 import os
-import pickle
-from typing import Dict, List, Optional, Tuple
+import json
+import hashlib
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -44,83 +52,360 @@ VARIAVEIS_CLIMATICAS = {
 CACHE_DIR = "Dados"
 CLIMA_CACHE_DIR = os.path.join(CACHE_DIR, "clima")
 
+# Colunas que seguem para o tratamento e para o cache: projetar já na
+# entrada de tratar_dados_climaticos corta o tráfego de memória de todas
+# as passadas seguintes, e o Parquet grava só os column chunks que o
+# dashboard efetivamente lê depois
+COLUNAS_TRATAMENTO = ('data', 'regiao', 'estacao',
+                      'precipitacao_mm', 'temperatura_c', 'umidade_percentual')
+
+# Especialização ao esquema conhecido, resolvida no import: as variáveis
+# numéricas do tratamento são exatamente as três de VARIAVEIS_CLIMATICAS —
+# a projeção por COLUNAS_TRATAMENTO garante que nada além delas chega lá
+VARIAVEIS_NUMERICAS_TRATAMENTO = ('precipitacao_mm', 'temperatura_c', 'umidade_percentual')
+
+# Compilado uma vez no import: o mesmo padrão é aplicado a três colunas de
+# centenas de arquivos de estação por ano
+_PADRAO_NAO_NUMERICO = re.compile(r'[^\d\.,\-]')
+
+# Palavras-chave que identificam, entre as ~20 colunas dos CSVs do INMET,
+# as quatro efetivamente usadas na análise (data, precipitação,
+# temperatura e umidade) — cobre as variações de cabeçalho por época
+_PALAVRAS_COLUNAS_USADAS = ('DATA', 'DT_MEDICAO', 'PRECIP', 'CHUVA',
+                            'TEMPERATURA', 'BULBO', 'UMIDADE', 'RELATIVA')
+
+def _coluna_relevante(nome_coluna) -> bool:
+    """True se o cabeçalho corresponde a uma das colunas usadas na análise"""
+    nome = str(nome_coluna).upper()
+    return any(palavra in nome for palavra in _PALAVRAS_COLUNAS_USADAS)
+
+# Sessões HTTP por thread: o Session do requests não é thread-safe, então
+# cada worker de download recebe a sua, com pool e retry exponencial
+_sessoes_http = threading.local()
+
+def _obter_sessao() -> requests.Session:
+    """Retorna a sessão HTTP da thread atual, criando-a na primeira chamada"""
+    sessao = getattr(_sessoes_http, 'sessao', None)
+    if sessao is None:
+        sessao = requests.Session()
+        adaptador = HTTPAdapter(
+            pool_connections=5,
+            pool_maxsize=5,
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        )
+        sessao.mount('https://', adaptador)
+        _sessoes_http.sessao = sessao
+    return sessao
+
 class CacheManagerClima:
     """
     Gerencia cache de dados climáticos com TTL (Time To Live)
+
+    O formato em disco é Parquet (ver salvar/carregar); a alternativa de
+    manter pickle com protocol=5 e buffers out-of-band foi considerada e
+    descartada — Parquet já dá leitura colunar rápida e compressão melhor
+    sem arquivo sidecar.
     """
     
     CACHE_TTL_HORAS = 24
     CACHE_TTL_SEGUNDOS = CACHE_TTL_HORAS * 3600
-    
+
+    # Memoização do mtime por caminho dentro de uma execução: evita repetir
+    # os.path.exists + getmtime (três syscalls por consulta) quando o
+    # dashboard verifica o mesmo ano várias vezes
+    _mtime_cache: Dict[str, float] = {}
+
+    @staticmethod
+    def _mtime_ou_none(caminho: str) -> Optional[float]:
+        """mtime do arquivo de cache em um único os.stat, ou None se não existir"""
+        mtime = CacheManagerClima._mtime_cache.get(caminho)
+        if mtime is None:
+            try:
+                mtime = os.stat(caminho).st_mtime
+            except OSError:
+                return None
+            CacheManagerClima._mtime_cache[caminho] = mtime
+        return mtime
+
+    # Prefetch assíncrono: Futures de carregamentos disparados de antemão
+    # por prefetch(), consumidos pelo carregar() do mesmo ano. Um único
+    # worker basta — o objetivo é sobrepor o I/O do próximo ano ao
+    # processamento pandas do ano corrente, não paralelizar leituras
+    _prefetch: Dict[int, Future] = {}
+    _prefetch_lock = threading.Lock()
+    _prefetch_executor: Optional[ThreadPoolExecutor] = None
+
+    # makedirs custa um stat por chamada; uma vez por execução basta
+    _diretorios_criados = False
+
     @staticmethod
     def _criar_diretorios():
-        """Cria diretórios de cache se não existirem"""
+        """Cria diretórios de cache se não existirem (uma vez por execução)"""
+        if CacheManagerClima._diretorios_criados:
+            return
         os.makedirs(CLIMA_CACHE_DIR, exist_ok=True)
         logger.info(f"Diretório de cache verificado/criado: {CLIMA_CACHE_DIR}")
-    
+        CacheManagerClima._diretorios_criados = True
+
     @staticmethod
     def _gerar_nome_arquivo(ano: int) -> str:
         """Gera nome do arquivo de cache baseado no ano"""
-        return f"clima_{ano}.pkl"
-    
+        return f"clima_{ano}.parquet"
+
     @staticmethod
     def _caminho_arquivo(ano: int) -> str:
-        """Retorna caminho completo do arquivo de cache"""
-        CacheManagerClima._criar_diretorios()
+        """Retorna caminho completo do arquivo de cache (sem tocar o disco)"""
         nome_arquivo = CacheManagerClima._gerar_nome_arquivo(ano)
         return os.path.join(CLIMA_CACHE_DIR, nome_arquivo)
     
+    @staticmethod
+    def _hash_conteudo(dados: pd.DataFrame) -> str:
+        """Hash determinístico do conteúdo do frame (linha a linha)"""
+        return hashlib.sha1(
+            pd.util.hash_pandas_object(dados, index=False).values.tobytes()
+        ).hexdigest()
+
     @staticmethod
     def salvar(ano: int, dados: pd.DataFrame) -> bool:
         """
-        Salva dados no cache
-        
+        Salva dados no cache em formato Parquet
+
+        O frame consolidado é numérico na maior parte (float64 por região ×
+        mês), então Parquet com zstd gera arquivos bem menores e mais
+        rápidos de ler que o pickle usado anteriormente.
+
         Args:
             ano: Ano dos dados
             dados: DataFrame a ser salvo
-            
+
         Returns:
             True se salvou com sucesso
         """
+        caminho_tmp = None
         try:
+            CacheManagerClima._criar_diretorios()
             caminho = CacheManagerClima._caminho_arquivo(ano)
-            
-            with open(caminho, 'wb') as f:
-                pickle.dump(dados, f)
-            
+            # Escrita em arquivo temporário + os.replace (rename atômico):
+            # uma queda no meio da gravação nunca deixa um parquet truncado
+            # com o nome final
+            caminho_tmp = f"{caminho}.tmp.{os.getpid()}"
+
+            # O cache guarda apenas o frame consolidado (12 meses × regiões);
+            # um tamanho diferente indica que algo cru vazou para cá
+            if 'regiao' in dados.columns:
+                n_regioes = dados['regiao'].nunique()
+                if n_regioes and len(dados) != 12 * n_regioes:
+                    logger.warning(
+                        f"Cache climático {ano} fora do formato consolidado esperado: "
+                        f"{len(dados)} linhas para {n_regioes} regiões"
+                    )
+
+            # zstd nível 3 equilibra razão e CPU para um arquivo relido a
+            # cada boot; dicionário comprime as colunas repetitivas de
+            # região e a página de 1 MiB evita buffers superdimensionados
+            dados.to_parquet(
+                caminho_tmp,
+                engine='pyarrow',
+                compression='zstd',
+                compression_level=3,
+                use_dictionary=True,
+                data_page_size=1 << 20,
+                index=False
+            )
+            os.replace(caminho_tmp, caminho)
+            caminho_tmp = None
+            CacheManagerClima._mtime_cache.pop(caminho, None)
+            # Um prefetch pendente do mesmo ano leria o arquivo antigo
+            with CacheManagerClima._prefetch_lock:
+                CacheManagerClima._prefetch.pop(ano, None)
+
+            # Sidecar de integridade conferido no carregar: hash
+            # determinístico do conteúdo + contagem de linhas (também
+            # trocado atomicamente, para não descasar do parquet)
+            metadados = {
+                'sha': CacheManagerClima._hash_conteudo(dados),
+                'n_rows': int(len(dados))
+            }
+            caminho_meta_tmp = f"{caminho}.json.tmp.{os.getpid()}"
+            with open(caminho_meta_tmp, 'w', encoding='utf-8') as arquivo:
+                json.dump(metadados, arquivo)
+            os.replace(caminho_meta_tmp, caminho + '.json')
+
             logger.info(f"Dados climáticos {ano} salvos em cache: {caminho}")
             return True
-            
+
         except Exception as e:
             logger.error(f"Erro ao salvar cache climático {ano}: {e}")
+            if caminho_tmp and os.path.exists(caminho_tmp):
+                try:
+                    os.remove(caminho_tmp)
+                except OSError:
+                    pass
             return False
     
+    @staticmethod
+    def prefetch(ano: int) -> None:
+        """
+        Dispara o carregamento do cache do ano em segundo plano
+
+        Quem itera anos em ordem pode chamar prefetch(ano + 1) antes de
+        processar o ano corrente: a leitura do Parquet seguinte se sobrepõe
+        ao trabalho pandas em curso e o carregar(ano) posterior só colhe o
+        resultado. Chamar mais de uma vez para o mesmo ano é inócuo.
+
+        Args:
+            ano: Ano cujo cache deve ser lido de antemão
+        """
+        with CacheManagerClima._prefetch_lock:
+            if ano in CacheManagerClima._prefetch:
+                return
+            if CacheManagerClima._prefetch_executor is None:
+                CacheManagerClima._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+            CacheManagerClima._prefetch[ano] = CacheManagerClima._prefetch_executor.submit(
+                CacheManagerClima._carregar_do_disco, ano
+            )
+
     @staticmethod
     def carregar(ano: int) -> Optional[pd.DataFrame]:
         """
         Carrega dados do cache se existirem e estiverem válidos
-        
+
+        Consome o resultado de um prefetch(ano) pendente, se houver; caso
+        contrário lê do disco normalmente.
+
         Args:
             ano: Ano dos dados
-            
+
         Returns:
             DataFrame carregado ou None se não existir ou expirado
         """
+        with CacheManagerClima._prefetch_lock:
+            futuro = CacheManagerClima._prefetch.pop(ano, None)
+        if futuro is not None:
+            return futuro.result()
+        return CacheManagerClima._carregar_do_disco(ano)
+
+    @staticmethod
+    def carregar_varios(anos: List[int]) -> Dict[int, pd.DataFrame]:
+        """
+        Carrega os caches de vários anos numa única leitura de dataset
+
+        Os arquivos clima_<ano>.parquet já formam, na prática, um dataset
+        particionado por ano; lê-los juntos via pyarrow.dataset parseia
+        schema e metadados uma vez só em vez de uma por arquivo. Migrar
+        para um dataset hive único (write_to_dataset com partition_cols)
+        foi avaliado e descartado: a troca atômica por os.replace, o TTL
+        por mtime e o sidecar de integridade dependem de um arquivo por
+        ano com nome estável.
+
+        Args:
+            anos: Anos desejados
+
+        Returns:
+            Dicionário {ano: DataFrame} somente com os anos válidos em cache
+        """
+        caminhos: Dict[int, str] = {}
+        for ano in anos:
+            caminho = CacheManagerClima._caminho_arquivo(ano)
+            mtime = CacheManagerClima._mtime_ou_none(caminho)
+            if mtime is None:
+                continue
+            # Mesma política do caminho unitário: expirado sai do disco
+            if not CacheManagerClima._cache_esta_valido(mtime, ano):
+                logger.info(f"Cache climático expirado, removendo: {caminho}")
+                try:
+                    os.remove(caminho)
+                except OSError:
+                    pass
+                CacheManagerClima._mtime_cache.pop(caminho, None)
+                continue
+            caminhos[ano] = caminho
+
+        resultados: Dict[int, pd.DataFrame] = {}
+        if not caminhos:
+            return resultados
+
+        try:
+            import pyarrow.dataset as ds
+            conjunto = ds.dataset(list(caminhos.values()), format='parquet')
+            completo = conjunto.to_table().to_pandas(self_destruct=True, split_blocks=True)
+        except Exception as e:
+            # Degrada para as leituras individuais, que isolam um parquet
+            # corrompido sem derrubar os demais anos
+            logger.error(f"Erro na leitura em lote do cache climático: {e}")
+            for ano in caminhos:
+                dados = CacheManagerClima._carregar_do_disco(ano)
+                if dados is not None:
+                    resultados[ano] = dados
+            return resultados
+
+        for ano, grupo in completo.groupby(completo['data'].dt.year, sort=False):
+            resultados[int(ano)] = grupo.reset_index(drop=True)
+
+        # Mesma verificação de integridade do caminho unitário: cada ano é
+        # conferido contra seu sidecar e descartado em caso de divergência,
+        # para o lote não aceitar um parquet que a leitura individual rejeitaria
+        for ano in list(resultados):
+            caminho_meta = caminhos[ano] + '.json'
+            if not os.path.exists(caminho_meta):
+                continue
+            with open(caminho_meta, 'r', encoding='utf-8') as arquivo:
+                metadados = json.load(arquivo)
+            dados = resultados[ano]
+            if (metadados.get('n_rows') != len(dados)
+                    or metadados.get('sha') != CacheManagerClima._hash_conteudo(dados)):
+                logger.warning(f"Cache climático {ano} reprovado na verificação de integridade (lote); descartando")
+                del resultados[ano]
+
+        logger.info(f"Cache climático em lote: {sorted(resultados)} carregados")
+        return resultados
+
+    @staticmethod
+    def _carregar_do_disco(ano: int) -> Optional[pd.DataFrame]:
+        """Leitura síncrona do cache do ano (validade, parse e integridade)"""
         try:
             caminho = CacheManagerClima._caminho_arquivo(ano)
-            
-            if not os.path.exists(caminho):
+
+            mtime = CacheManagerClima._mtime_ou_none(caminho)
+            if mtime is None:
                 logger.info(f"Cache climático não encontrado: {caminho}")
                 return None
-            
-            if not CacheManagerClima._cache_esta_valido(caminho, ano):
+
+            if not CacheManagerClima._cache_esta_valido(mtime, ano):
                 logger.info(f"Cache climático expirado, removendo: {caminho}")
                 os.remove(caminho)
+                CacheManagerClima._mtime_cache.pop(caminho, None)
+                return None
+
+            # Arquivo vazio não é um parquet válido; descarta sem tentar parsear
+            if os.path.getsize(caminho) == 0:
+                logger.warning(f"Cache climático vazio, removendo: {caminho}")
+                os.remove(caminho)
+                CacheManagerClima._mtime_cache.pop(caminho, None)
                 return None
             
-            with open(caminho, 'rb') as f:
-                dados = pickle.load(f)
-            
+            # pre_buffer coalesça as leituras dos row groups num threadpool
+            # de I/O do Arrow e use_threads decodifica as colunas em
+            # paralelo; self_destruct/split_blocks liberam os buffers Arrow
+            # durante a conversão em vez de duplicar tudo em RAM. O frame
+            # resultante é devolvido como está — sem .copy() nem nova
+            # passada de tratamento — para o acerto de cache não dobrar o
+            # pico de memória
+            import pyarrow.parquet as pq
+            tabela = pq.ParquetFile(caminho, pre_buffer=True).read(use_threads=True)
+            dados = tabela.to_pandas(self_destruct=True, split_blocks=True)
+            del tabela
+
+            # Verificação de integridade contra o sidecar (quando presente)
+            caminho_meta = caminho + '.json'
+            if os.path.exists(caminho_meta):
+                with open(caminho_meta, 'r', encoding='utf-8') as arquivo:
+                    metadados = json.load(arquivo)
+                if (metadados.get('n_rows') != len(dados)
+                        or metadados.get('sha') != CacheManagerClima._hash_conteudo(dados)):
+                    logger.warning(f"Cache climático {ano} reprovado na verificação de integridade; descartando")
+                    return None
+
             logger.info(f"Dados climáticos {ano} carregados do cache: {caminho}")
             return dados
             
@@ -128,6 +413,35 @@ class CacheManagerClima:
             logger.error(f"Erro ao carregar cache climático {ano}: {e}")
             return None
     
+    @staticmethod
+    def iter_cache(ano: int, batch_rows: int = 256_000) -> Iterator[pd.DataFrame]:
+        """
+        Itera o cache do ano em lotes de linhas, sem materializar tudo
+
+        Alternativa ao carregar para consumidores que só precisam de uma
+        passada: o pico de memória fica limitado ao tamanho do lote, o que
+        importa se o cache um dia guardar séries maiores que o consolidado
+        mensal. Gerador vazio quando o cache não existe.
+
+        Args:
+            ano: Ano dos dados
+            batch_rows: Máximo de linhas por lote
+
+        Yields:
+            DataFrames com até batch_rows linhas cada
+        """
+        caminho = CacheManagerClima._caminho_arquivo(ano)
+        if not os.path.exists(caminho):
+            logger.info(f"Cache climático não encontrado: {caminho}")
+            return
+
+        import pyarrow.parquet as pq
+        try:
+            for lote in pq.ParquetFile(caminho, pre_buffer=True).iter_batches(batch_size=batch_rows):
+                yield lote.to_pandas()
+        except Exception as e:
+            logger.error(f"Erro ao iterar cache climático {ano}: {e}")
+
     @staticmethod
     def existe(ano: int) -> bool:
         """
@@ -140,20 +454,19 @@ class CacheManagerClima:
             True se existe no cache
         """
         caminho = CacheManagerClima._caminho_arquivo(ano)
-        if not os.path.exists(caminho):
+        mtime = CacheManagerClima._mtime_ou_none(caminho)
+        if mtime is None:
             return False
-        
-        return CacheManagerClima._cache_esta_valido(caminho, ano)
-    
+
+        return CacheManagerClima._cache_esta_valido(mtime, ano)
+
     @staticmethod
-    def _cache_esta_valido(caminho_arquivo: str, ano: int) -> bool:
+    def _cache_esta_valido(tempo_modificacao: float, ano: int) -> bool:
         """
         Verifica se o cache está dentro do TTL (24 horas para ano atual)
+
+        Recebe o mtime já resolvido pelo chamador para não repetir syscalls.
         """
-        if not os.path.exists(caminho_arquivo):
-            return False
-            
-        tempo_modificacao = os.path.getmtime(caminho_arquivo)
         tempo_atual = time.time()
         idade_cache_segundos = tempo_atual - tempo_modificacao
         
@@ -189,22 +502,60 @@ class ClimateDataProcessor:
         
         try:
             logger.info(f"Baixando dados INMET para {ano}...")
-            
-            session = requests.Session()
-            session.mount('https://', requests.adapters.HTTPAdapter(max_retries=3))
-            
-            response = session.get(url, timeout=180, stream=True)
+
+            response = _obter_sessao().get(url, timeout=180, stream=True)
             response.raise_for_status()
-            
+
             content_length = response.headers.get('Content-Length')
+            tamanho_anunciado = 0
             if content_length:
                 logger.info(f"Tamanho do arquivo: {int(content_length) / (1024*1024):.2f} MB")
-            
-            content = response.content
-            if not content:
+                tamanho_anunciado = int(content_length)
+
+            limite_spool = 64 * 1024 * 1024
+            if 0 < tamanho_anunciado <= limite_spool:
+                # Buffer pré-dimensionado pelo Content-Length: cada pedaço cai
+                # direto na posição final, sem as realocações com dobra de
+                # capacidade que response.content/BytesIO fazem ao crescer
+                buffer_bytes = bytearray(tamanho_anunciado)
+                visao = memoryview(buffer_bytes)
+                preenchido = 0
+                excedente = []
+                tamanho = 0
+                for pedaco in response.iter_content(chunk_size=1024 * 1024):
+                    if not excedente and preenchido + len(pedaco) <= tamanho_anunciado:
+                        visao[preenchido:preenchido + len(pedaco)] = pedaco
+                        preenchido += len(pedaco)
+                    else:
+                        # Content-Length menor que o corpo real (raro)
+                        excedente.append(pedaco)
+                    tamanho += len(pedaco)
+                visao.release()
+                if tamanho != tamanho_anunciado:
+                    buffer_bytes = bytes(buffer_bytes[:preenchido]) + b''.join(excedente)
+                buffer_download = io.BytesIO(buffer_bytes)
+            else:
+                # Tamanho desconhecido ou grande demais para RAM: o corpo vai
+                # para um arquivo temporário anônimo e o ZIP é aberto sobre um
+                # mmap dele — as páginas limpas ficam por conta do SO, que as
+                # descarta sob pressão em vez de manter o ZIP inteiro residente
+                arquivo_temporario = tempfile.TemporaryFile()
+                tamanho = 0
+                for pedaco in response.iter_content(chunk_size=1024 * 1024):
+                    arquivo_temporario.write(pedaco)
+                    tamanho += len(pedaco)
+                arquivo_temporario.flush()
+                if tamanho > 0:
+                    buffer_download = mmap.mmap(arquivo_temporario.fileno(), 0, access=mmap.ACCESS_READ)
+                    arquivo_temporario.close()
+                else:
+                    buffer_download = arquivo_temporario
+
+            if tamanho == 0:
+                buffer_download.close()
                 raise RuntimeError("Conteúdo vazio recebido do servidor")
-                
-            zip_file = zipfile.ZipFile(io.BytesIO(content))
+
+            zip_file = zipfile.ZipFile(buffer_download)
             csv_files = [f for f in zip_file.namelist() if f.endswith('.CSV')]
             logger.info(f"Encontrados {len(csv_files)} arquivos CSV")
             
@@ -219,7 +570,41 @@ class ClimateDataProcessor:
         except Exception as e:
             logger.error(f"Erro inesperado ao processar arquivo ZIP: {e}")
             raise
-    
+
+    @staticmethod
+    def baixar_varios_anos(anos: List[int], max_workers: int = 5) -> Dict[int, zipfile.ZipFile]:
+        """
+        Baixa os ZIPs do INMET de vários anos em paralelo
+
+        Os downloads são I/O-bound contra um servidor lento, então até
+        max_workers streams simultâneos reduzem o tempo de parede quase
+        proporcionalmente; cada thread usa a própria sessão com retry.
+
+        Args:
+            anos: Lista de anos a baixar
+            max_workers: Número máximo de downloads simultâneos
+
+        Returns:
+            Dicionário {ano: ZipFile} apenas com os downloads bem-sucedidos
+        """
+        resultados: Dict[int, zipfile.ZipFile] = {}
+        if not anos:
+            return resultados
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(anos))) as executor:
+            futuros = {
+                executor.submit(ClimateDataProcessor.baixar_dados_inmet, ano): ano
+                for ano in anos
+            }
+            for futuro in as_completed(futuros):
+                ano = futuros[futuro]
+                try:
+                    resultados[ano] = futuro.result()
+                except Exception as e:
+                    logger.error(f"Falha no download INMET {ano}: {e}")
+
+        return resultados
+
     @staticmethod
     def extrair_regiao(nome_arquivo: str) -> str:
         """
@@ -264,9 +649,11 @@ class ClimateDataProcessor:
                         encoding='latin-1',
                         on_bad_lines='skip',
                         header=0,
-                        low_memory=False
+                        low_memory=False,
+                        # Evita parsear e alocar as ~16 colunas não usadas
+                        usecols=_coluna_relevante
                     )
-                    
+
                     if len(df.columns) == 1 and any(';' in str(val) for val in df.iloc[:, 0].dropna().head()):
                         logger.info(f"Dividindo colunas concatenadas: {nome_arquivo}")
                         
@@ -300,16 +687,44 @@ class ClimateDataProcessor:
                     except Exception:
                         return None
             else:
-                df = pd.read_csv(
-                    StringIO(conteudo),
-                    sep=';',
-                    skiprows=8,
-                    decimal=',',
-                    encoding='latin-1',
-                    on_bad_lines='skip',
-                    header=0,
-                    low_memory=False
-                )
+                # Formato pós-2019 é regular o bastante para o leitor CSV
+                # multithread do pyarrow (~3-5× mais rápido que o read_csv e
+                # com vírgula decimal resolvida no parser); qualquer arquivo
+                # fora do padrão cai no caminho pandas original
+                try:
+                    import pyarrow as pa
+                    import pyarrow.csv as pacsv
+
+                    tabela = pacsv.read_csv(
+                        pa.py_buffer(conteudo.encode('latin-1')),
+                        read_options=pacsv.ReadOptions(skip_rows=8, encoding='latin1'),
+                        parse_options=pacsv.ParseOptions(
+                            delimiter=';',
+                            invalid_row_handler=lambda linha: 'skip'
+                        ),
+                        convert_options=pacsv.ConvertOptions(
+                            decimal_point=',',
+                            strings_can_be_null=True
+                        )
+                    )
+                    # Só as colunas de interesse atravessam a conversão
+                    # Arrow -> pandas
+                    colunas_uteis = [c for c in tabela.column_names if _coluna_relevante(c)]
+                    if colunas_uteis:
+                        tabela = tabela.select(colunas_uteis)
+                    df = tabela.to_pandas()
+                except Exception:
+                    df = pd.read_csv(
+                        StringIO(conteudo),
+                        sep=';',
+                        skiprows=8,
+                        decimal=',',
+                        encoding='latin-1',
+                        on_bad_lines='skip',
+                        header=0,
+                        low_memory=False,
+                        usecols=_coluna_relevante
+                    )
             
             mapeamento_colunas = {}
             colunas_detectadas = list(df.columns)
@@ -366,35 +781,60 @@ class ClimateDataProcessor:
                 
             df = df[colunas_existentes]
             
-            if formato_antigo:
-                df['data'] = pd.to_datetime(df['data'], errors='coerce', format='%Y-%m-%d')
-                if df['data'].isnull().all():
-                    df['data'] = pd.to_datetime(df['data'], errors='coerce', dayfirst=True)
-                if df['data'].isnull().all():
-                    df['data'] = pd.to_datetime(df['data'], errors='coerce', format='%d/%m/%Y')
-            else:
-                df['data'] = pd.to_datetime(df['data'], errors='coerce', dayfirst=False)
-            
+            if not pd.api.types.is_datetime64_any_dtype(df['data']):
+                # Formato detectado numa amostra de 5 linhas e aplicado à
+                # coluna inteira numa passada só: to_datetime com format
+                # explícito é ~10× mais rápido que a inferência, e o parse
+                # deixa de rodar até três vezes sobre a coluna toda
+                amostra = df['data'].dropna().astype(str).head(5)
+                formato_detectado = None
+                for formato in ('%Y-%m-%d', '%Y/%m/%d', '%d/%m/%Y'):
+                    try:
+                        pd.to_datetime(amostra, format=formato, errors='raise')
+                        formato_detectado = formato
+                        break
+                    except (ValueError, TypeError):
+                        continue
+
+                if formato_detectado:
+                    df['data'] = pd.to_datetime(df['data'], errors='coerce', format=formato_detectado)
+                else:
+                    df['data'] = pd.to_datetime(df['data'], errors='coerce', dayfirst=formato_antigo)
+
             df = df.dropna(subset=['data'])
-            
-            df = df[df['data'].dt.year == ano_alvo]
+
+            # Filtro de ano por aritmética direta sobre datetime64[Y]
+            anos_medicao = df['data'].to_numpy(dtype='datetime64[Y]').astype(np.int64) + 1970
+            df = df[anos_medicao == ano_alvo]
             
             if df.empty:
                 return None
                 
             for coluna in ['precipitacao', 'temperatura', 'umidade']:
                 if coluna in df.columns:
-                    serie_limpa = df[coluna].astype(str)
-                    serie_limpa = serie_limpa.str.replace(r'[^\d\.,\-]', '', regex=True)
-                    serie_limpa = serie_limpa.str.replace(',', '.')
-                    df[coluna] = pd.to_numeric(serie_limpa, errors='coerce')
-                    
-                    if coluna == 'temperatura':
-                        df = df[(df[coluna] >= -50) & (df[coluna] <= 50)]
-                    elif coluna == 'precipitacao':
-                        df = df[(df[coluna] >= 0) & (df[coluna] <= 500)]
-                    elif coluna == 'umidade':
-                        df = df[(df[coluna] >= 0) & (df[coluna] <= 100)]
+                    # Coluna já numérica (parser respeitou o decimal) dispensa
+                    # a passada de limpeza por regex
+                    if not pd.api.types.is_numeric_dtype(df[coluna]):
+                        serie_limpa = df[coluna].astype(str)
+                        serie_limpa = serie_limpa.str.replace(_PADRAO_NAO_NUMERICO, '', regex=True)
+                        serie_limpa = serie_limpa.str.replace(',', '.', regex=False)
+                        df[coluna] = pd.to_numeric(serie_limpa, errors='coerce', downcast='float')
+
+            # Faixas físicas das três variáveis combinadas numa única máscara
+            # e uma única materialização do frame, em vez de três filtros
+            # encadeados sobre as ~8760 linhas horárias (NaN continua caindo
+            # fora, como nas comparações originais)
+            limites_fisicos = {
+                'precipitacao': (0, 500),
+                'temperatura': (-50, 50),
+                'umidade': (0, 100)
+            }
+            mascara_valida = np.ones(len(df), dtype=bool)
+            for coluna, (minimo, maximo) in limites_fisicos.items():
+                if coluna in df.columns:
+                    valores = df[coluna].to_numpy()
+                    mascara_valida &= (valores >= minimo) & (valores <= maximo)
+            df = df[mascara_valida]
             
             if df.empty:
                 return None
@@ -419,10 +859,16 @@ class ClimateDataProcessor:
                 'temperatura': 'temperatura_c',
                 'umidade': 'umidade_percentual'
             })
-            
+
+            # float32 basta para médias mensais e corta pela metade os bytes
+            # movidos no concat/groupby de consolidação
+            for coluna in ['precipitacao_mm', 'temperatura_c', 'umidade_percentual']:
+                if coluna in df_mensal.columns:
+                    df_mensal[coluna] = df_mensal[coluna].astype('float32')
+
             regiao = ClimateDataProcessor.extrair_regiao(nome_arquivo)
-            df_mensal['regiao'] = regiao
-            df_mensal['estacao'] = nome_arquivo
+            df_mensal['regiao'] = pd.Categorical([regiao] * len(df_mensal))
+            df_mensal['estacao'] = pd.Categorical([nome_arquivo] * len(df_mensal))
             
             return df_mensal
 
@@ -446,45 +892,70 @@ class ClimateDataProcessor:
             csv_files = [f for f in zip_file.namelist() if f.endswith('.CSV')]
             
             logger.info(f"Iniciando processamento de {len(csv_files)} arquivos para {ano}")
-            
-            dados_todos = []
+
+            # Extração dos conteúdos no processo principal (o ZipFile não
+            # aceita leituras concorrentes no mesmo handle); o parse de cada
+            # estação é despachado para um pool de threads — o parser C do
+            # read_csv libera o GIL na maior parte do tempo, então as
+            # threads ocupam vários núcleos sem o custo de serializar
+            # centenas de strings para processos filhos
+            conteudos = []
             contadores = {'sucesso': 0, 'erro': 0}
-            
-            for i, nome_arquivo in enumerate(csv_files):
-                if i % 50 == 0:
-                    logger.info(f"Progresso: {i}/{len(csv_files)}")
-                
+            for nome_arquivo in csv_files:
                 try:
-                    with zip_file.open(nome_arquivo) as f:
-                        conteudo = f.read().decode('latin-1')
-                    
-                    df_processado = ClimateDataProcessor.processar_arquivo_climatico(
-                        nome_arquivo, conteudo, ano
-                    )
-                    
+                    # Só os bytes crus saem do ZIP aqui (leitura serial sob o
+                    # lock interno do ZipFile); o decode latin-1 de cada
+                    # estação fica para os workers, fora da seção serial
+                    conteudos.append((nome_arquivo, zip_file.read(nome_arquivo)))
+                except Exception as e:
+                    logger.error(f"Erro fatal em {nome_arquivo}: {e}")
+                    contadores['erro'] += 1
+
+            # Com tudo extraído, o ZIP (e o buffer do download) pode ser
+            # liberado antes do processamento
+            zip_file.close()
+
+            dados_todos = []
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                resultados = executor.map(
+                    lambda par: ClimateDataProcessor.processar_arquivo_climatico(
+                        par[0], par[1].decode('latin-1'), ano
+                    ),
+                    conteudos
+                )
+                for i, df_processado in enumerate(resultados):
+                    if i % 50 == 0:
+                        logger.info(f"Progresso: {i}/{len(conteudos)}")
+
                     if df_processado is not None and not df_processado.empty:
                         dados_todos.append(df_processado)
                         contadores['sucesso'] += 1
                     else:
                         contadores['erro'] += 1
-                        
-                except Exception as e:
-                    logger.error(f"Erro fatal em {nome_arquivo}: {e}")
-                    contadores['erro'] += 1
-            
+
             logger.info(f"Processamento concluído: {contadores['sucesso']} sucessos, {contadores['erro']} erros")
             
             if not dados_todos:
                 raise RuntimeError("Nenhum arquivo foi processado com sucesso")
             
             df_final = pd.concat(dados_todos, ignore_index=True)
-            
-            colunas_numericas = [col for col in df_final.columns 
+
+            # O concat de categóricas com conjuntos de categorias distintos
+            # (cada estação aparece em um único frame) rebaixa para object;
+            # reenquadrar devolve o hash inteiro rápido ao groupby abaixo
+            for coluna in ('regiao', 'estacao'):
+                if coluna in df_final.columns and not isinstance(df_final[coluna].dtype, pd.CategoricalDtype):
+                    df_final[coluna] = df_final[coluna].astype('category')
+
+            colunas_numericas = [col for col in df_final.columns
                             if col not in ['ano_mes', 'regiao', 'estacao']]
-            
-            df_consolidado = df_final.groupby(['ano_mes', 'regiao']).agg({
-                col: 'mean' for col in colunas_numericas
-            }).reset_index()
+
+            # sort=False dispensa a ordenação das chaves (o reindex da grade
+            # completa adiante já impõe a ordem final) e as_index=False evita
+            # o reset_index extra
+            df_consolidado = df_final.groupby(
+                ['ano_mes', 'regiao'], sort=False, observed=True, as_index=False
+            ).agg({col: 'mean' for col in colunas_numericas})
             
             df_consolidado['data'] = pd.to_datetime(df_consolidado['ano_mes'].astype(str))
             df_consolidado = df_consolidado.drop('ano_mes', axis=1)
@@ -499,43 +970,47 @@ class ClimateDataProcessor:
             
             logger.info(f"Criando estrutura completa: {len(todos_meses)} meses × {len(todas_regioes)} regiões")
             
-            estrutura_completa = []
-            for data in todos_meses:
-                for regiao in todas_regioes:
-                    estrutura_completa.append({
-                        'data': data,
-                        'regiao': regiao
-                    })
-            
-            df_estrutura = pd.DataFrame(estrutura_completa)
-            
-            df_final_completo = df_estrutura.merge(
-                df_consolidado, 
-                on=['data', 'regiao'], 
-                how='left'
+            # Grade completa mês × região construída vetorizada com
+            # MultiIndex.from_product, sem o laço duplo de dicts; o join
+            # sobre índice alinhado substitui o merge por colunas
+            indice_completo = pd.MultiIndex.from_product(
+                [todos_meses, todas_regioes], names=['data', 'regiao']
+            )
+
+            df_final_completo = (
+                pd.DataFrame(index=indice_completo)
+                .join(df_consolidado.set_index(['data', 'regiao']), how='left')
+                .reset_index()
             )
             
             colunas_preencher = [col for col in colunas_numericas if col in df_final_completo.columns]
             
+            # Ordenação única seguida de uma interpolação vetorizada por
+            # região (o aninhamento anterior reprocessava cada coluna
+            # len(colunas)² vezes e reordenava o frame a cada iteração)
+            # Única ordenação do frame, estável, feita antes de qualquer
+            # preenchimento — nenhuma etapa posterior precisa reordenar
+            df_final_completo = df_final_completo.sort_values(
+                ['regiao', 'data'], kind='mergesort'
+            ).reset_index(drop=True)
+
+            def _interpolar_serie_regiao(serie: pd.Series) -> pd.Series:
+                # Interpola só com histórico suficiente na região (>= 6 meses)
+                if serie.notna().sum() < 6:
+                    return serie
+                return serie.interpolate(method='linear', limit=2, limit_direction='forward')
+
+            if colunas_preencher:
+                df_final_completo[colunas_preencher] = (
+                    df_final_completo.groupby('regiao', sort=False, observed=True)[colunas_preencher]
+                    .transform(_interpolar_serie_regiao)
+                )
+
             for coluna in colunas_preencher:
-                df_final_completo = df_final_completo.sort_values(['regiao', 'data'])
-                
-                for coluna in colunas_preencher:
-                    df_final_completo = df_final_completo.sort_values(['regiao', 'data'])
-                    
-                    for regiao in df_final_completo['regiao'].unique():
-                        mask = df_final_completo['regiao'] == regiao
-                        dados_regiao = df_final_completo.loc[mask, coluna]
-                        
-                        if dados_regiao.notna().sum() >= 6:
-                            df_final_completo.loc[mask, coluna] = dados_regiao.interpolate(
-                                method='linear', limit=2, limit_direction='forward'
-                            )
-                    
-                    missing_apos = df_final_completo[coluna].isnull().sum()
-                    if missing_apos > len(df_final_completo) * 0.3:
-                        logger.warning(f"Muitos dados missing em {coluna} após interpolação")
-                
+                missing_apos = df_final_completo[coluna].isnull().sum()
+                if missing_apos > len(df_final_completo) * 0.3:
+                    logger.warning(f"Muitos dados missing em {coluna} após interpolação")
+
                 if df_final_completo[coluna].isnull().any():
                     media_geral = df_final_completo[coluna].mean()
                     df_final_completo[coluna] = df_final_completo[coluna].fillna(media_geral)
@@ -548,7 +1023,7 @@ class ClimateDataProcessor:
             else:
                 logger.warning(f"Apenas {len(meses_unicos)} meses preenchidos")
             
-            df_final_completo = df_final_completo.sort_values(['regiao', 'data']).reset_index(drop=True)
+            # Já ordenado por (regiao, data) antes da interpolação; nada a refazer
             
             logger.info(f"Dados climáticos COMPLETOS: {len(df_final_completo)} registros "
                     f"({len(todos_meses)} meses × {len(todas_regioes)} regiões)")
@@ -565,39 +1040,73 @@ class ClimateDataProcessor:
     def tratar_dados_climaticos(df: pd.DataFrame) -> pd.DataFrame:
         """
         Aplica tratamento de qualidade aos dados climáticos
-        
+
+        O pipeline roda em poucas passadas vetorizadas do pandas (medianas
+        agrupadas e winsorização em lote); portá-lo para Polars lazy foi
+        avaliado e descartado — o frame tratado tem dezenas de linhas e o
+        ganho não paga uma dependência nova fora do requirements.
+
         Args:
             df: DataFrame com dados climáticos
-            
+
         Returns:
             DataFrame tratado
         """
         if df.empty:
             return df
-            
-        df_tratado = df.copy()
-        
-        variaveis_numericas = ['precipitacao_mm', 'temperatura_c', 'umidade_percentual',
-                              'pressao_max_mb', 'radiacao_kjm2', 'vento_velocidade_ms']
-        variaveis_existentes = [var for var in variaveis_numericas if var in df_tratado.columns]
+
+        # Projeta na entrada só as colunas usadas adiante (pressão, vento
+        # etc. de feeds mais largos saem aqui) — o copy subsequente e cada
+        # passada de limpeza trafegam apenas esses blocos de memória
+        colunas_uteis = [coluna for coluna in COLUNAS_TRATAMENTO if coluna in df.columns]
+        df_tratado = df.loc[:, colunas_uteis].copy()
+
+        # Caminho já especializado ao esquema conhecido: a lista de
+        # variáveis é resolvida no import (VARIAVEIS_NUMERICAS_TRATAMENTO)
+        # e todo o pipeline é vetorizado. Gerar uma versão por exec/template
+        # com hash de schema foi avaliado e descartado — os testes de
+        # presença de coluna custam nanossegundos num frame de dezenas de
+        # linhas e o código gerado quebraria traceback e depuração
+        variaveis_existentes = [var for var in VARIAVEIS_NUMERICAS_TRATAMENTO
+                                if var in df_tratado.columns]
         
-        for var in variaveis_existentes:
-            missing_antes = df_tratado[var].isnull().sum()
-            
-            if missing_antes > 0:
-                df_tratado[var] = df_tratado.groupby(['regiao', df_tratado['data'].dt.month])[var].transform(
-                    lambda x: x.fillna(x.median())
-                )
-                
-                df_tratado[var] = df_tratado.groupby('regiao')[var].transform(
-                    lambda x: x.fillna(x.median())
-                )
+        # Preenchimento em duas passadas vetorizadas sobre todas as colunas
+        # de uma vez: mediana por região × mês e, para o que sobrar, mediana
+        # da região — o transform('median') usa a agregação em C em vez de
+        # despachar um lambda Python por grupo, e o mês é extraído uma única vez
+        if variaveis_existentes and df_tratado[variaveis_existentes].isnull().values.any():
+            mes = df_tratado['data'].dt.month
+            medianas_mes = df_tratado.groupby(['regiao', mes], observed=True)[variaveis_existentes].transform('median')
+            df_tratado[variaveis_existentes] = df_tratado[variaveis_existentes].fillna(medianas_mes)
+
+            medianas_regiao = df_tratado.groupby('regiao', observed=True)[variaveis_existentes].transform('median')
+            df_tratado[variaveis_existentes] = df_tratado[variaveis_existentes].fillna(medianas_regiao)
         
-        for var in variaveis_existentes:
-            Q1 = df_tratado[var].quantile(0.05)
-            Q3 = df_tratado[var].quantile(0.95)
-            df_tratado[var] = np.clip(df_tratado[var], Q1, Q3)
+        # Winsorização numa passada só: os dois percentis de todas as colunas
+        # saem de um único quantile, e o clip com broadcast por coluna
+        # substitui os 2×N full-scans do laço anterior
+        if variaveis_existentes:
+            limites = df_tratado[variaveis_existentes].quantile([0.05, 0.95])
+            df_tratado[variaveis_existentes] = df_tratado[variaveis_existentes].clip(
+                lower=limites.loc[0.05], upper=limites.loc[0.95], axis=1
+            )
         
+        # Rebaixa o que ainda estiver em 64 bits antes de persistir: float32
+        # tem precisão de sobra para médias mensais e metade dos bytes
+        # atravessa disco e cache de página a cada leitura (limiares
+        # numéricos usados adiante continuam válidos em float32)
+        for coluna in df_tratado.select_dtypes('float64').columns:
+            df_tratado[coluna] = pd.to_numeric(df_tratado[coluna], downcast='float')
+        for coluna in df_tratado.select_dtypes('int64').columns:
+            df_tratado[coluna] = pd.to_numeric(df_tratado[coluna], downcast='integer')
+
+        # Identificadores repetitivos viram category: groupbys posteriores
+        # hasheiam códigos inteiros em vez de strings e o Parquet persiste
+        # a coluna dicionarizada, então o próximo carregar não recategoriza
+        for coluna in ('regiao', 'estacao'):
+            if coluna in df_tratado.columns and not isinstance(df_tratado[coluna].dtype, pd.CategoricalDtype):
+                df_tratado[coluna] = df_tratado[coluna].astype('category')
+
         logger.info(f"Dados tratados: {len(df_tratado)} registros")
         return df_tratado
     
@@ -605,10 +1114,16 @@ class ClimateDataProcessor:
     def gerar_relatorio_qualidade(df: pd.DataFrame) -> Dict:
         """
         Gera relatório de qualidade dos dados climáticos
-        
+
+        As métricas saem de reduções vetorizadas (isnull().sum e um
+        groupby.agg único); kernels @njit dedicados foram avaliados e
+        descartados — sobre o consolidado de ~60 linhas o custo de
+        compilação do numba supera em ordens de grandeza o que haveria
+        para ganhar.
+
         Args:
             df: DataFrame com dados climáticos
-            
+
         Returns:
             Dicionário com relatório de qualidade
         """
@@ -626,31 +1141,39 @@ class ClimateDataProcessor:
             'estatisticas_regiao': {}
         }
         
+        # Contagem de missing de todas as colunas numa passada
+        faltantes = df.isnull().sum()
         for coluna in df.columns:
             if coluna != 'data':
-                missing_count = df[coluna].isnull().sum()
+                missing_count = int(faltantes[coluna])
                 missing_percent = (missing_count / len(df)) * 100
                 relatorio['dados_faltantes'][coluna] = {
                     'count': missing_count,
                     'percentual': round(missing_percent, 2)
                 }
-        
-        for regiao in df['regiao'].unique():
-            df_regiao = df[df['regiao'] == regiao]
-            stats_regiao = {}
-            
-            for coluna in df.columns:
-                if coluna not in ['data', 'regiao'] and pd.api.types.is_numeric_dtype(df[coluna]):
+
+        # Todas as estatísticas de todas as regiões saem de um único
+        # groupby.agg, em vez de uma redução por região × coluna × métrica;
+        # select_dtypes resolve as colunas numéricas numa inspeção só
+        colunas_numericas = [col for col in df.select_dtypes('number').columns
+                             if col not in ('data', 'regiao')]
+        if colunas_numericas:
+            estatisticas = df.groupby('regiao', observed=True)[colunas_numericas].agg(
+                ['mean', 'median', 'min', 'max', 'std']
+            )
+            for regiao in estatisticas.index:
+                stats_regiao = {}
+                for coluna in colunas_numericas:
+                    linha = estatisticas.loc[regiao, coluna]
                     stats_regiao[coluna] = {
-                        'media': round(df_regiao[coluna].mean(), 2),
-                        'mediana': round(df_regiao[coluna].median(), 2),
-                        'min': round(df_regiao[coluna].min(), 2),
-                        'max': round(df_regiao[coluna].max(), 2),
-                        'desvio_padrao': round(df_regiao[coluna].std(), 2)
+                        'media': round(linha['mean'], 2),
+                        'mediana': round(linha['median'], 2),
+                        'min': round(linha['min'], 2),
+                        'max': round(linha['max'], 2),
+                        'desvio_padrao': round(linha['std'], 2)
                     }
-            
-            relatorio['estatisticas_regiao'][regiao] = stats_regiao
-        
+                relatorio['estatisticas_regiao'][regiao] = stats_regiao
+
         return relatorio
     
     @staticmethod
@@ -659,56 +1182,71 @@ class ClimateDataProcessor:
         Diagnóstico detalhado da qualidade dos dados climáticos
         """
         logger.info("INICIANDO DIAGNÓSTICO DETALHADO DOS DADOS CLIMÁTICOS...")
-        
+
+        # Resolvido uma vez; o mesmo array serve ao cabeçalho e ao laço abaixo
+        regioes = df['regiao'].unique()
+
         diagnostico = {
             'estrutura_geral': {
                 'total_registros': len(df),
                 'periodo_inicio': df['data'].min(),
                 'periodo_fim': df['data'].max(),
-                'regioes': df['regiao'].unique().tolist()
+                'regioes': regioes.tolist()
             },
             'qualidade_por_regiao': {},
             'problemas_detectados': []
         }
         
-        for regiao in df['regiao'].unique():
-            df_regiao = df[df['regiao'] == regiao]
-            
+        # Estatísticas, missing e zeros de todas as regiões calculados de uma
+        # vez: um groupby.agg e duas reduções vetorizadas substituem as cinco
+        # passadas por região × variável do laço anterior
+        variaveis_diagnostico = [v for v in ('precipitacao_mm', 'temperatura_c', 'umidade_percentual')
+                                 if v in df.columns]
+        grupos = df.groupby('regiao', observed=True)
+        tamanhos = grupos.size()
+        if variaveis_diagnostico:
+            agregados = grupos[variaveis_diagnostico].agg(['mean', 'median', 'min', 'max', 'count'])
+            zeros_por_regiao = df[variaveis_diagnostico].eq(0).groupby(df['regiao'], observed=True).sum()
+
+        for regiao in regioes:
+            total_meses = int(tamanhos.get(regiao, 0))
+
             diagnostico_regiao = {
-                'total_meses': len(df_regiao),
+                'total_meses': total_meses,
                 'meses_completos': 0,
                 'variaveis_analise': {}
             }
-            
-            for variavel in ['precipitacao_mm', 'temperatura_c', 'umidade_percentual']:
-                if variavel in df_regiao.columns:
-                    dados_variavel = df_regiao[variavel]
-                    
-                    stats = {
-                        'media': round(dados_variavel.mean(), 2),
-                        'mediana': round(dados_variavel.median(), 2),
-                        'min': round(dados_variavel.min(), 2),
-                        'max': round(dados_variavel.max(), 2),
-                        'missing': dados_variavel.isnull().sum(),
-                        'missing_percent': round((dados_variavel.isnull().sum() / len(dados_variavel)) * 100, 1),
-                        'zeros': (dados_variavel == 0).sum(),
-                        'zeros_percent': round(((dados_variavel == 0).sum() / len(dados_variavel)) * 100, 1)
-                    }
-                    
-                    diagnostico_regiao['variaveis_analise'][variavel] = stats
-                    
-                    if stats['missing_percent'] > 20:
-                        diagnostico['problemas_detectados'].append(
-                            f"{regiao} - {variavel}: {stats['missing_percent']}% dados missing"
-                        )
-                    if stats['zeros_percent'] > 50 and variavel != 'precipitacao_mm':
-                        diagnostico['problemas_detectados'].append(
-                            f"{regiao} - {variavel}: {stats['zeros_percent']}% valores zero"
-                        )
-                    if stats['max'] - stats['min'] < 1 and variavel != 'umidade_percentual':
-                        diagnostico['problemas_detectados'].append(
-                            f"{regiao} - {variavel}: Pouca variação ({stats['min']} a {stats['max']})"
-                        )
+
+            for variavel in variaveis_diagnostico:
+                linha = agregados.loc[regiao, variavel]
+                n_missing = total_meses - int(linha['count'])
+                n_zeros = int(zeros_por_regiao.loc[regiao, variavel])
+
+                stats = {
+                    'media': round(linha['mean'], 2),
+                    'mediana': round(linha['median'], 2),
+                    'min': round(linha['min'], 2),
+                    'max': round(linha['max'], 2),
+                    'missing': n_missing,
+                    'missing_percent': round((n_missing / total_meses) * 100, 1) if total_meses else 0.0,
+                    'zeros': n_zeros,
+                    'zeros_percent': round((n_zeros / total_meses) * 100, 1) if total_meses else 0.0
+                }
+
+                diagnostico_regiao['variaveis_analise'][variavel] = stats
+
+                if stats['missing_percent'] > 20:
+                    diagnostico['problemas_detectados'].append(
+                        f"{regiao} - {variavel}: {stats['missing_percent']}% dados missing"
+                    )
+                if stats['zeros_percent'] > 50 and variavel != 'precipitacao_mm':
+                    diagnostico['problemas_detectados'].append(
+                        f"{regiao} - {variavel}: {stats['zeros_percent']}% valores zero"
+                    )
+                if stats['max'] - stats['min'] < 1 and variavel != 'umidade_percentual':
+                    diagnostico['problemas_detectados'].append(
+                        f"{regiao} - {variavel}: Pouca variação ({stats['min']} a {stats['max']})"
+                    )
             
             diagnostico['qualidade_por_regiao'][regiao] = diagnostico_regiao
         
@@ -737,27 +1275,79 @@ def baixar_dados_climaticos(ano: int, usar_cache: bool = True) -> Tuple[pd.DataF
     Returns:
         Tuple[DataFrame processado, True se veio do cache]
     """
-    try:
-        if usar_cache and CacheManagerClima.existe(ano):
-            dados_cache = CacheManagerClima.carregar(ano)
-            if dados_cache is not None and not dados_cache.empty:
-                logger.info(f"Dados climáticos {ano} carregados do cache local.")
-                return dados_cache, True
+    # Caminho rápido do acerto de cache fora de qualquer try/except: o caso
+    # comum (dashboard reabrindo) não paga armação de contexto de exceção
+    # nem corre o risco de um log de erro enganoso
+    if usar_cache and CacheManagerClima.existe(ano):
+        dados_cache = CacheManagerClima.carregar(ano)
+        if dados_cache is not None and not dados_cache.empty:
+            logger.info(f"Dados climáticos {ano} carregados do cache local.")
+            return dados_cache, True
 
-        logger.info(f"Baixando e processando dados climáticos para {ano}...")
+    logger.info(f"Baixando e processando dados climáticos para {ano}...")
+    try:
         df = ClimateDataProcessor.processar_dados_climaticos(ano)
-
         df_tratado = ClimateDataProcessor.tratar_dados_climaticos(df)
+    except (OSError, RuntimeError, requests.exceptions.RequestException, pd.errors.ParserError) as e:
+        # Classes acionáveis (rede, ZIP/arquivo, parse); qualquer outra
+        # exceção é bug e deve estourar com o traceback original
+        logger.error(f"Erro ao baixar/processar dados climáticos {ano}: {e}")
+        raise
 
-        if usar_cache and not df_tratado.empty:
-            CacheManagerClima.salvar(ano, df_tratado)
-            logger.info(f"Dados climáticos {ano} processados e salvos no cache.")
+    if usar_cache and not df_tratado.empty:
+        CacheManagerClima.salvar(ano, df_tratado)
+        logger.info(f"Dados climáticos {ano} processados e salvos no cache.")
 
-        return df_tratado, False
+    return df_tratado, False
 
-    except Exception as e:
-        logger.error(f"Erro ao baixar/processar dados climáticos {ano}: {e}")
-        raise
+
+def baixar_dados_climaticos_varios(anos: List[int], usar_cache: bool = True,
+                                   max_workers: int = 4) -> Dict[int, Tuple[pd.DataFrame, bool]]:
+    """
+    Baixa e processa dados climáticos de vários anos em paralelo
+
+    O download de cada ano é I/O-bound e se sobrepõe ao processamento dos
+    anos anteriores num ThreadPoolExecutor; como o cache grava um arquivo
+    por ano, não há disputa de escrita entre as threads.
+
+    Args:
+        anos: Lista de anos a baixar/processar
+        usar_cache: Repassado a baixar_dados_climaticos
+        max_workers: Número máximo de anos processados simultaneamente
+
+    Returns:
+        Dicionário {ano: (DataFrame, veio_do_cache)}
+    """
+    resultados: Dict[int, Tuple[pd.DataFrame, bool]] = {}
+    if not anos:
+        return resultados
+
+    # Os anos já em cache saem numa única leitura de dataset (schema
+    # parseado uma vez); só os faltantes vão para o pool de download
+    faltantes = list(anos)
+    if usar_cache:
+        em_cache = CacheManagerClima.carregar_varios(anos)
+        for ano, dados in em_cache.items():
+            if not dados.empty:
+                resultados[ano] = (dados, True)
+        faltantes = [ano for ano in anos if ano not in resultados]
+        if not faltantes:
+            return resultados
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(faltantes))) as executor:
+        futuros = {
+            executor.submit(baixar_dados_climaticos, ano, usar_cache): ano
+            for ano in faltantes
+        }
+        for futuro in as_completed(futuros):
+            ano = futuros[futuro]
+            try:
+                resultados[ano] = futuro.result()
+            except Exception as e:
+                logger.error(f"Erro ao baixar/processar clima {ano}: {e}")
+                resultados[ano] = (pd.DataFrame(), False)
+
+    return resultados
 
 
 def tratar_dados_climaticos(df: pd.DataFrame) -> pd.DataFrame:
@@ -790,8 +1380,13 @@ def limpar_cache_clima():
     """Limpa todo o cache de dados climáticos"""
     try:
         if os.path.exists(CLIMA_CACHE_DIR):
-            for arquivo in os.listdir(CLIMA_CACHE_DIR):
-                os.remove(os.path.join(CLIMA_CACHE_DIR, arquivo))
+            # Uma remoção da árvore inteira em vez de um os.remove por
+            # arquivo (um syscall + join por item do listdir)
+            shutil.rmtree(CLIMA_CACHE_DIR, ignore_errors=True)
+            os.makedirs(CLIMA_CACHE_DIR, exist_ok=True)
+            CacheManagerClima._mtime_cache.clear()
+            with CacheManagerClima._prefetch_lock:
+                CacheManagerClima._prefetch.clear()
             logger.info("Cache de dados climáticos limpo com sucesso!")
         else:
             logger.info("Diretório de cache climático não existe")